@@ -22,7 +22,8 @@ from src.processing import (
     DocumentParser,
     TextChunker,
     EmbeddingGenerator,
-    IngestionPipeline
+    IngestionPipeline,
+    ParsedDocument
 )
 
 
@@ -35,25 +36,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def demo_parser():
+def demo_parser(doc: ParsedDocument):
     """Demo document parsing."""
     print("\n" + "=" * 60)
     print("DEMO: Document Parser")
     print("=" * 60)
 
-    parser = DocumentParser()
-
-    # Find architecture document
-    doc_path = Path(__file__).parent / 'docs' / 'architecture.md'
-
-    if not doc_path.exists():
-        print(f"Architecture document not found: {doc_path}")
-        return
-
-    print(f"\nParsing: {doc_path}")
-
-    # Parse document
-    doc = parser.parse(str(doc_path))
+    print(f"\nParsed: {doc.path}")
 
     print(f"\nDocument Type: {doc.doc_type}")
     print(f"Document ID: {doc.frontmatter.get('id')}")
@@ -69,24 +58,14 @@ def demo_parser():
         print(f"  {i+1}. {section['title']} (Level {section['level']})")
 
 
-def demo_chunker():
+def demo_chunker(doc: ParsedDocument):
     """Demo text chunking."""
     print("\n" + "=" * 60)
     print("DEMO: Text Chunker")
     print("=" * 60)
 
-    parser = DocumentParser()
     chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
 
-    # Parse architecture document
-    doc_path = Path(__file__).parent / 'docs' / 'architecture.md'
-
-    if not doc_path.exists():
-        print(f"Architecture document not found: {doc_path}")
-        return
-
-    doc = parser.parse(str(doc_path))
-
     print(f"\nChunking document: {doc.frontmatter.get('id')}")
 
     # Create chunks
@@ -96,7 +75,7 @@ def demo_chunker():
 
     # Show chunk statistics
     chunk_sizes = [len(chunk.content) for chunk in chunks]
-    token_counts = [chunker.count_tokens(chunk.content) for chunk in chunks]
+    token_counts = [chunk.token_count for chunk in chunks]
 
     print(f"\nChunk Statistics:")
     print(f"  Min size: {min(chunk_sizes)} chars, {min(token_counts)} tokens")
@@ -108,18 +87,16 @@ def demo_chunker():
     for i, chunk in enumerate(chunks[:3]):
         print(f"\n  Chunk {i+1}:")
         print(f"    Section: {chunk.section_title or 'N/A'}")
-        print(f"    Size: {len(chunk.content)} chars, {chunker.count_tokens(chunk.content)} tokens")
+        print(f"    Size: {len(chunk.content)} chars, {chunk.token_count} tokens")
         print(f"    Preview: {chunk.content[:100]}...")
 
 
-def demo_embedder():
+def demo_embedder(embedder: EmbeddingGenerator):
     """Demo embedding generation."""
     print("\n" + "=" * 60)
     print("DEMO: Embedding Generator")
     print("=" * 60)
 
-    embedder = EmbeddingGenerator()
-
     print(f"\nEmbedder Configuration:")
     print(f"  Host: {embedder.host}")
     print(f"  Model: {embedder.model_name}")
@@ -144,6 +121,10 @@ def demo_embedder():
 
     print("Model is available!")
 
+    # Load the model up front so the first real request isn't charged for it
+    print("\nWarming up model...")
+    embedder.warmup()
+
     # Generate test embedding
     print("\nGenerating test embedding...")
     test_text = "This is a test document about the Librarian Agent architecture."
@@ -156,13 +137,14 @@ def demo_embedder():
     print(f"  Valid: {embedder.validate_embedding(embedding)}")
 
 
-def demo_pipeline():
+def demo_pipeline(doc: ParsedDocument, embedder: EmbeddingGenerator):
     """Demo complete ingestion pipeline."""
     print("\n" + "=" * 60)
     print("DEMO: Complete Ingestion Pipeline")
     print("=" * 60)
 
-    pipeline = IngestionPipeline()
+    # Reuse the demo embedder so its Ollama status checks aren't repeated
+    pipeline = IngestionPipeline(embedder=embedder)
 
     # Validate setup
     print("\nValidating pipeline setup...")
@@ -184,16 +166,10 @@ def demo_pipeline():
         print("\nPipeline validation failed. Please fix errors above.")
         return
 
-    # Process architecture document
-    doc_path = Path(__file__).parent / 'docs' / 'architecture.md'
-
-    if not doc_path.exists():
-        print(f"\nArchitecture document not found: {doc_path}")
-        return
-
-    print(f"\nProcessing: {doc_path}")
+    # Process the already-parsed architecture document
+    print(f"\nProcessing: {doc.path}")
 
-    result = pipeline.process_file(str(doc_path))
+    result = pipeline.process_document(doc)
 
     if result['success']:
         print("\n[SUCCESS] Processing successful!")
@@ -222,11 +198,24 @@ def main():
     print("=" * 60)
 
     try:
+        embedder = EmbeddingGenerator()
+
+        # Parse the architecture document once and share it across demos
+        doc_path = Path(__file__).parent / 'docs' / 'architecture.md'
+        doc = None
+
+        if doc_path.exists():
+            doc = DocumentParser().parse(str(doc_path))
+        else:
+            print(f"\nArchitecture document not found: {doc_path}")
+
         # Run demos in sequence
-        demo_parser()
-        demo_chunker()
-        demo_embedder()
-        demo_pipeline()
+        if doc is not None:
+            demo_parser(doc)
+            demo_chunker(doc)
+        demo_embedder(embedder)
+        if doc is not None:
+            demo_pipeline(doc, embedder)
 
         print("\n" + "=" * 60)
         print("DEMO COMPLETE")
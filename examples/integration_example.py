@@ -103,28 +103,29 @@ async def main():
 
             # Step 5: Process entire directory
             if DOCS_DIR.exists():
-                result = await orchestrator.process_directory(
+                # Stream results so large directories aren't held in memory
+                successful = failed = skipped = 0
+
+                async for file_path, file_result in orchestrator.iter_process_directory(
                     directory=str(DOCS_DIR),
                     pattern="**/*.md",
                     skip_validation=False,
                     force_update=False
-                )
+                ):
+                    if file_result is None:
+                        skipped += 1
+                    elif file_result.success:
+                        successful += 1
+                        logger.info(f"  ✓ {Path(file_path).name}: {file_result.document_id}")
+                    else:
+                        failed += 1
+                        logger.error(f"  ✗ {Path(file_path).name}: {file_result.error}")
 
                 logger.info(f"Directory processing complete:")
-                logger.info(f"  - Total files: {result['total_files']}")
-                logger.info(f"  - Successful: {result['successful']}")
-                logger.info(f"  - Failed: {result['failed']}")
-                logger.info(f"  - Skipped: {result['skipped']}")
-
-                # Show details for each file
-                for file_result in result['results']:
-                    file_path = file_result['file']
-                    file_status = file_result['result']
-
-                    if file_status['success']:
-                        logger.info(f"  ✓ {Path(file_path).name}: {file_status['document_id']}")
-                    else:
-                        logger.error(f"  ✗ {Path(file_path).name}: {file_status['error']}")
+                logger.info(f"  - Total files: {successful + failed + skipped}")
+                logger.info(f"  - Successful: {successful}")
+                logger.info(f"  - Failed: {failed}")
+                logger.info(f"  - Skipped: {skipped}")
 
             else:
                 logger.error(f"Docs directory not found: {DOCS_DIR}")
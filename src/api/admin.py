@@ -1,20 +1,57 @@
 """Administrative endpoints for document ingestion and management."""
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 import logging
 from pathlib import Path
 import tempfile
+import hashlib
 import os
 
 from src.api.models import IngestRequest, IngestResponse
 from src.processing.pipeline import IngestionPipeline
-from src.graph.connection import get_connection
+from src.processing.embedder import quantize_int8
+from src.graph.connection import Neo4jConnection, get_connection
 from src.graph.operations import GraphOperations
+from src.api.clients import get_neo4j_connection
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Read size used when streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Number of characters of document content stored on the document node
+CONTENT_PREVIEW_CHARS = 1000
+
+# Nodes deleted per server-side transaction when removing a document
+DELETE_BATCH_SIZE = 10000
+
+# Deletes a document's chunks, then the document, in batched server-side
+# transactions so large documents don't build one huge transaction. The
+# document is last in the list, so it goes in the final batch
+DELETE_DOCUMENT_QUERY = f"""
+MATCH (d {{id: $node_id}})
+OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+WITH d, collect(c) AS chunks
+UNWIND chunks + [d] AS n
+CALL {{
+    WITH n
+    DETACH DELETE n
+}} IN TRANSACTIONS OF {DELETE_BATCH_SIZE} ROWS
+RETURN count(n) as deleted_count
+"""
+
+# Node label used for each ingestable document type
+DOCUMENT_TYPE_LABELS = {
+    "architecture": "Architecture",
+    "design": "Design",
+    "code": "Code",
+    "research": "Research"
+}
+
 # Initialize services
 doc_processor = None
 graph_ops = None
@@ -59,6 +96,29 @@ async def ingest_document(request: IngestRequest):
         if not doc_path.exists():
             raise HTTPException(status_code=404, detail=f"Document not found: {request.document_path}")
 
+        # Determine node label based on document type
+        node_label = DOCUMENT_TYPE_LABELS.get(request.document_type, "Document")
+
+        ops = get_graph_ops()
+
+        # Skip parsing, embedding and writes when identical content is already stored
+        content_hash = hashlib.sha256(doc_path.read_bytes()).hexdigest()
+        if not request.force_update:
+            existing = await ops.conn.execute_read(
+                f"MATCH (d:{node_label} {{content_hash: $content_hash}}) RETURN d.id as id LIMIT 1",
+                {"content_hash": content_hash}
+            )
+            if existing:
+                logger.info(
+                    f"Document unchanged, skipping ingest: {request.document_path} "
+                    f"(already stored as {existing[0]['id']})"
+                )
+                return IngestResponse(
+                    success=True,
+                    node_id=existing[0]["id"],
+                    relationships_created=0
+                )
+
         # Process document through pipeline
         processor = get_doc_processor()
 
@@ -71,74 +131,74 @@ async def ingest_document(request: IngestRequest):
                 detail=f"Processing failed: {processed.get('error', 'Unknown error')}"
             )
 
-        # Store in graph database
-        ops = get_graph_ops()
-
         # Get processed document
         document = processed.get('document')
 
         # Create main document node
         node_id = document.frontmatter.get('id', f"{request.document_type}-{doc_path.stem}")
 
+        # Store a truncated preview of the content on the node; only copy
+        # the string when it is actually longer than the preview
+        content = document.content or ""
+        preview = (
+            content if len(content) <= CONTENT_PREVIEW_CHARS
+            else content[:CONTENT_PREVIEW_CHARS]
+        )
+
         # Build node properties from document metadata
         node_props = {
             "id": node_id,
             "title": document.frontmatter.get("title", doc_path.stem),
             "doc_type": request.document_type,
-            "content": document.content[:1000] if document.content else "",  # Store truncated content
+            "content": preview,
             "source_path": str(doc_path),
             "status": "active",
             "version": document.frontmatter.get("version", "1.0.0"),
             "subsystem": document.frontmatter.get("subsystem", "general"),
+            "content_hash": content_hash,
             **request.metadata
         }
 
-        # Determine node label based on document type
-        label_map = {
-            "architecture": "Architecture",
-            "design": "Design",
-            "code": "Code",
-            "research": "Research"
-        }
-        node_label = label_map.get(request.document_type, "Document")
-
         # Create node
         await ops.create_node(
             label=node_label,
             properties=node_props
         )
 
-        # Store chunks as related nodes
-        relationships_created = 0
+        # Store all chunks and their HAS_CHUNK relationships in one round-trip.
+        # Embeddings are kept as int8 plus a per-vector scale, 8x smaller than
+        # Neo4j's float64 lists
         processed_chunks = processed.get("processed_chunks", [])
-
+        chunk_rows = []
         for i, chunk in enumerate(processed_chunks):
-            chunk_id = f"{node_id}-chunk-{i}"
-            chunk_props = {
-                "id": chunk_id,
+            embedding_q, embedding_scale = quantize_int8(chunk.embedding)
+            chunk_rows.append({
+                "id": f"{node_id}-chunk-{i}",
                 "content": chunk.content,
                 "start_index": chunk.start_index,
                 "end_index": chunk.end_index,
                 "section_title": chunk.section_title,
-                "embedding": chunk.embedding
-            }
-
-            # Create chunk node
-            await ops.create_node(
-                label="Chunk",
-                properties=chunk_props
-            )
+                "embedding_q": embedding_q,
+                "embedding_scale": embedding_scale,
+                "chunk_index": i
+            })
 
-            # Create relationship
-            await ops.create_relationship(
-                from_label=node_label,
-                from_id=node_id,
-                to_label="Chunk",
-                to_id=chunk_id,
-                rel_type="HAS_CHUNK",
-                properties={"chunk_index": i}
+        relationships_created = 0
+        if chunk_rows:
+            chunk_query = f"""
+            MATCH (d:{node_label} {{id: $doc_id}})
+            UNWIND $chunks AS c
+            CREATE (x:Chunk)
+            SET x = c
+            CREATE (d)-[:HAS_CHUNK {{chunk_index: c.chunk_index}}]->(x)
+            RETURN count(x) as created
+            """
+
+            result = await ops.conn.execute_write(
+                chunk_query,
+                {"doc_id": node_id, "chunks": chunk_rows}
             )
-            relationships_created += 1
+            relationships_created = result[0].get("created", 0) if result else 0
 
         logger.info(
             f"Document ingested successfully: {node_id}, "
@@ -180,10 +240,18 @@ async def ingest_file_upload(
     try:
         logger.info(f"Ingesting uploaded file: {file.filename} ({document_type})")
 
-        # Save to temporary file
         with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=Path(file.filename).suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
+            if _upload_on_disk(file):
+                # Large uploads have already spilled to disk; copy file-to-file
+                # in the kernel instead of through Python buffers
+                await run_in_threadpool(_sendfile_copy, file.file, tmp)
+            else:
+                # Stream to a temporary file in fixed-size pieces to bound memory use
+                while True:
+                    buf = await file.read(UPLOAD_CHUNK_SIZE)
+                    if not buf:
+                        break
+                    tmp.write(buf)
             tmp_path = tmp.name
 
         try:
@@ -215,13 +283,41 @@ async def ingest_file_upload(
         raise HTTPException(status_code=500, detail=f"Upload ingestion failed: {str(e)}")
 
 
+def _upload_on_disk(file: UploadFile) -> bool:
+    """Check whether an upload's spooled file has rolled over to a real file."""
+    # SpooledTemporaryFile has no public flag, and calling fileno() on an
+    # in-memory spool would force it to disk
+    return hasattr(os, "sendfile") and getattr(file.file, "_rolled", False)
+
+
+def _sendfile_copy(src, dst) -> None:
+    """
+    Copy the whole of one open file into another with os.sendfile.
+
+    Args:
+        src: Source file object backed by a file descriptor
+        dst: Destination file object backed by a file descriptor
+    """
+    src.flush()
+    in_fd, out_fd = src.fileno(), dst.fileno()
+    size = os.fstat(in_fd).st_size
+    offset = 0
+
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
 @router.delete("/document/{node_id}")
-async def delete_document(node_id: str):
+async def delete_document(node_id: str, conn: Neo4jConnection = Depends(get_neo4j_connection)):
     """
     Delete a document and its associated chunks from the graph.
 
     Args:
         node_id: ID of the document to delete
+        conn: Neo4j connection opened by the app lifespan
 
     Returns:
         Success message
@@ -229,17 +325,8 @@ async def delete_document(node_id: str):
     try:
         logger.info(f"Deleting document: {node_id}")
 
-        conn = get_connection()
-
-        # Delete document and all its chunks
-        delete_query = """
-        MATCH (d {id: $node_id})
-        OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-        DETACH DELETE d, c
-        RETURN count(d) + count(c) as deleted_count
-        """
-
-        result = await conn.execute_write(delete_query, {"node_id": node_id})
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction
+        result = await conn.execute_autocommit(DELETE_DOCUMENT_QUERY, {"node_id": node_id})
         deleted_count = result[0].get("deleted_count", 0) if result else 0
 
         if deleted_count == 0:
@@ -256,8 +343,13 @@ async def delete_document(node_id: str):
         raise HTTPException(status_code=500, detail=f"Deletion failed: {str(e)}")
 
 
-@router.get("/documents")
-async def list_documents(doc_type: str = None, subsystem: str = None, limit: int = 50):
+@router.get("/documents", response_class=ORJSONResponse)
+async def list_documents(
+    doc_type: str = None,
+    subsystem: str = None,
+    limit: int = 50,
+    conn: Neo4jConnection = Depends(get_neo4j_connection)
+):
     """
     List all documents in the knowledge graph.
 
@@ -265,6 +357,7 @@ async def list_documents(doc_type: str = None, subsystem: str = None, limit: int
         doc_type: Filter by document type (optional)
         subsystem: Filter by subsystem (optional)
         limit: Maximum number of results
+        conn: Neo4j connection opened by the app lifespan
 
     Returns:
         List of documents with metadata
@@ -272,8 +365,6 @@ async def list_documents(doc_type: str = None, subsystem: str = None, limit: int
     try:
         logger.info(f"Listing documents (type={doc_type}, subsystem={subsystem}, limit={limit})")
 
-        conn = get_connection()
-
         # Build query with optional filters
         where_clauses = []
         params = {"limit": limit}
@@ -291,30 +382,21 @@ async def list_documents(doc_type: str = None, subsystem: str = None, limit: int
         query = f"""
         MATCH (d)
         {where_clause}
-        RETURN d.id as id, d.title as title, d.doc_type as doc_type,
-               d.subsystem as subsystem, d.version as version,
-               d.status as status, d.created_at as created_at
+        RETURN d {{.id, .title, .doc_type, .subsystem, .version, .status,
+                  created_at: toString(d.created_at)}} as doc
         ORDER BY d.created_at DESC
         LIMIT $limit
         """
 
         results = await conn.execute_read(query, params)
 
-        documents = []
-        for r in results:
-            documents.append({
-                "id": r.get("id"),
-                "title": r.get("title"),
-                "doc_type": r.get("doc_type"),
-                "subsystem": r.get("subsystem"),
-                "version": r.get("version"),
-                "status": r.get("status"),
-                "created_at": str(r.get("created_at")) if r.get("created_at") else None
-            })
+        # Each row is already a document dict built by the map projection
+        documents = [r["doc"] for r in results]
 
         logger.info(f"Found {len(documents)} documents")
 
-        return {"documents": documents, "count": len(documents)}
+        # Rows are plain dicts, so hand them straight to orjson
+        return ORJSONResponse({"documents": documents, "count": len(documents)})
 
     except Exception as e:
         logger.error(f"Document listing failed: {e}", exc_info=True)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 import logging
-import uuid
+import secrets
 from datetime import datetime
 
 from src.api.models import (
@@ -63,7 +63,7 @@ async def request_approval(request: AgentRequestModel):
     """
     try:
         # Generate unique request ID
-        request_id = f"req-{uuid.uuid4().hex[:12]}"
+        request_id = f"req-{secrets.token_hex(6)}"
 
         # Convert API model to internal model
         agent_request = AgentRequest(
@@ -147,7 +147,7 @@ async def report_completion(completion: CompletionRequest):
         logger.info(f"Processing completion report for request {completion.request_id}")
 
         # Create decision record
-        decision_id = f"dec-{uuid.uuid4().hex[:12]}"
+        decision_id = f"dec-{secrets.token_hex(6)}"
         decision = Decision(
             id=decision_id,
             decision_type="completion_report",
@@ -0,0 +1,40 @@
+"""Shared service clients used by several API routers."""
+
+import threading
+from typing import Optional
+
+from fastapi import Request
+
+from src.graph.connection import Neo4jConnection, get_connection
+from src.processing.embedder import EmbeddingGenerator
+
+# Process-wide embedder shared by query and health endpoints
+_embedder: Optional[EmbeddingGenerator] = None
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> EmbeddingGenerator:
+    """Get or create the shared embedder instance."""
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = EmbeddingGenerator()
+    return _embedder
+
+
+def get_neo4j_connection(request: Request) -> Neo4jConnection:
+    """
+    FastAPI dependency returning the Neo4j connection opened by the app lifespan.
+
+    Falls back to the process-wide connection when the app was started
+    without its lifespan (e.g. a bare test client).
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Connected Neo4jConnection
+    """
+    conn = getattr(request.app.state, "neo4j", None)
+    return conn if conn is not None else get_connection()
@@ -1,14 +1,16 @@
 """Health check endpoints for Kubernetes and monitoring."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
 import logging
+from functools import partial
 import time
-from datetime import datetime
-from typing import Dict, Any
-import psutil
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
 
-from src.graph.connection import get_connection
-from src.processing.embedder import EmbeddingGenerator
+from src.graph.connection import Neo4jConnection
+from src.api.clients import get_embedder, get_neo4j_connection
+from src.api.middleware import iso_now
 from src.api.models import HealthResponse
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,71 @@ router = APIRouter()
 # Track application start time for uptime calculation
 START_TIME = time.time()
 
+# How long probe results are reused, in seconds; failures are retried sooner
+HEALTH_CACHE_TTL_OK = 27.0
+HEALTH_CACHE_TTL_FAIL = 9.0
+
+# How long a psutil snapshot is reused across probes, in seconds
+SYSTEM_SNAPSHOT_TTL = 5.0
+
+# psutil is imported on the first system snapshot rather than at startup, and
+# is optional: without it resource checks pass and metrics are empty
+psutil = None
+_psutil_checked = False
+
+# Cached probe results: key -> (monotonic expiry, payload)
+_health_cache: Dict[str, Tuple[float, Any]] = {}
+_health_lock = asyncio.Lock()
+
+
+def _health_ttl(ok: bool) -> float:
+    """Get the cache lifetime for a probe result."""
+    return HEALTH_CACHE_TTL_OK if ok else HEALTH_CACHE_TTL_FAIL
+
+
+def _cache_times(ok: bool) -> Dict[str, str]:
+    """Get timestamp/expires fields describing a freshly computed probe result."""
+    now = datetime.utcnow()
+    return {
+        "timestamp": now.isoformat(),
+        "expires": (now + timedelta(seconds=_health_ttl(ok))).isoformat()
+    }
+
+
+async def _cached_probe(key: str, probe: Callable[[], Awaitable[Tuple[Any, bool]]]) -> Any:
+    """
+    Return a cached probe result, running the probe only when it has expired.
+
+    Concurrent callers wait on a lock and re-check the cache, so a burst of
+    probes triggers a single upstream check.
+
+    Args:
+        key: Cache key for the probe
+        probe: Coroutine function returning (payload, ok)
+
+    Returns:
+        Cached or freshly computed payload
+    """
+    cached = _health_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    async with _health_lock:
+        cached = _health_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        payload, ok = await probe()
+        _health_cache[key] = (time.monotonic() + _health_ttl(ok), payload)
+        return payload
+
+
+def reset_health_cache() -> None:
+    """Discard cached probe results so the next request re-checks dependencies."""
+    global _snapshot_cache
+    _health_cache.clear()
+    _snapshot_cache = (0.0, None)
+
 
 @router.get("/health/live")
 async def liveness():
@@ -30,28 +97,47 @@ async def liveness():
     Returns:
         Basic liveness status
     """
+    # NO I/O: liveness must never touch Neo4j, Ollama, psutil or the disk, so
+    # it keeps answering even when dependencies or the threadpool are saturated
     return {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": iso_now()
     }
 
 
 @router.get("/health/ready")
-async def readiness():
+async def readiness(conn: Neo4jConnection = Depends(get_neo4j_connection)):
     """
     Kubernetes readiness probe.
 
     Returns 200 if the application is ready to serve traffic.
     Checks that all critical dependencies are available.
 
+    Args:
+        conn: Neo4j connection opened by the app lifespan
+
     Returns:
         Readiness status with dependency checks
     """
+    return await _cached_probe("ready", partial(_run_readiness_checks, conn))
+
+
+async def _run_readiness_checks(conn: Neo4jConnection) -> Tuple[Dict[str, Any], bool]:
+    """Run the readiness dependency checks."""
+    # One psutil pass serves both resource checks
+    try:
+        snapshot = await take_snapshot()
+        disk_ok = check_disk_space(snapshot)
+        memory_ok = check_memory(snapshot)
+    except Exception as e:
+        logger.error(f"System resource check failed: {e}")
+        disk_ok = memory_ok = False
+
     checks = {
-        "neo4j": await check_neo4j(),
+        "neo4j": await check_neo4j(conn),
         "ollama": await check_ollama(),
-        "disk": check_disk_space(),
-        "memory": check_memory()
+        "disk": disk_ok,
+        "memory": memory_ok
     }
 
     all_ready = all(checks.values())
@@ -60,12 +146,12 @@ async def readiness():
     return {
         "status": "ready" if all_ready else "not_ready",
         "checks": checks,
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        **_cache_times(all_ready)
+    }, all_ready
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(conn: Neo4jConnection = Depends(get_neo4j_connection)):
     """
     Detailed health check with system metrics.
 
@@ -75,15 +161,28 @@ async def health_check():
     - Application uptime
     - Component versions
 
+    Results are cached for ``HEALTH_CACHE_TTL_OK`` seconds when healthy and
+    ``HEALTH_CACHE_TTL_FAIL`` seconds when degraded.
+
+    Args:
+        conn: Neo4j connection opened by the app lifespan
+
     Returns:
         HealthResponse with detailed status
     """
+    response = await _cached_probe("health", partial(_run_health_check, conn))
+
+    # Uptime is free to compute, so keep it current even on cached responses
+    return response.model_copy(update={"uptime_seconds": get_uptime()})
+
+
+async def _run_health_check(conn: Neo4jConnection) -> Tuple[HealthResponse, bool]:
+    """Check all dependencies and build the detailed health response."""
     # Check Neo4j
     neo4j_healthy = False
     neo4j_details = {}
 
     try:
-        conn = get_connection()
         health_data = await conn.health_check()
         neo4j_healthy = health_data.get("connected", False)
 
@@ -107,11 +206,12 @@ async def health_check():
     ollama_details = {}
 
     try:
-        embedder = EmbeddingGenerator()
-        ollama_healthy = embedder.check_connection()
+        # The Ollama client is synchronous; keep its HTTP calls off the event loop
+        embedder = get_embedder()
+        ollama_healthy = await asyncio.to_thread(embedder.check_connection)
 
         if ollama_healthy:
-            model_available = embedder.check_model_available()
+            model_available = await asyncio.to_thread(embedder.check_model_available)
             ollama_details = {
                 "available": True,
                 "model_available": model_available,
@@ -132,10 +232,20 @@ async def health_check():
         }
 
     # Get system metrics
-    system_metrics = get_system_metrics()
+    try:
+        system_metrics = get_system_metrics(await take_snapshot())
+    except Exception as e:
+        logger.error(f"Failed to get system metrics: {e}")
+        system_metrics = {
+            "cpu_percent": 0.0,
+            "memory_percent": 0.0,
+            "disk_percent": 0.0,
+            "error": str(e)
+        }
 
     # Determine overall status
-    overall_status = "healthy" if (neo4j_healthy and ollama_healthy) else "degraded"
+    healthy = neo4j_healthy and ollama_healthy
+    overall_status = "healthy" if healthy else "degraded"
 
     return HealthResponse(
         status=overall_status,
@@ -148,20 +258,23 @@ async def health_check():
                 "neo4j": neo4j_details,
                 "ollama": ollama_details
             },
-            "system": system_metrics
+            "system": system_metrics,
+            **_cache_times(healthy)
         }
-    )
+    ), healthy
 
 
-async def check_neo4j() -> bool:
+async def check_neo4j(conn: Neo4jConnection) -> bool:
     """
     Check if Neo4j is available.
 
+    Args:
+        conn: Neo4j connection to check
+
     Returns:
         True if Neo4j is reachable and healthy
     """
     try:
-        conn = get_connection()
         health_data = await conn.health_check()
         return health_data.get("connected", False)
     except Exception as e:
@@ -177,76 +290,142 @@ async def check_ollama() -> bool:
         True if Ollama is reachable
     """
     try:
-        embedder = EmbeddingGenerator()
-        return embedder.check_connection()
+        embedder = get_embedder()
+        return await asyncio.to_thread(embedder.check_connection)
     except Exception as e:
         logger.error(f"Ollama check failed: {e}")
         return False
 
 
-def check_disk_space(threshold: float = 90.0) -> bool:
+def _get_psutil():
+    """
+    Import psutil on first use.
+
+    Returns:
+        The psutil module, or None if it isn't installed
+    """
+    global psutil, _psutil_checked
+    if psutil is None and not _psutil_checked:
+        _psutil_checked = True
+        try:
+            import psutil as psutil_module
+        except ImportError:
+            logger.warning("psutil not installed; system resource checks disabled")
+            return None
+
+        # Prime the CPU counter so non-blocking cpu_percent calls have a baseline
+        psutil_module.cpu_percent(interval=None)
+        psutil = psutil_module
+    return psutil
+
+
+class SystemSnapshot(NamedTuple):
+    """System resource usage read in a single pass."""
+    cpu_percent: float
+    mem_percent: float
+    mem_available: int
+    disk_percent: float
+    disk_free: int
+
+
+# Most recent system snapshot: (monotonic expiry, snapshot)
+_snapshot_cache: Tuple[float, Optional[SystemSnapshot]] = (0.0, None)
+
+
+def _snapshot() -> Optional[SystemSnapshot]:
+    """
+    Read CPU, memory and disk usage from psutil once (blocking).
+
+    CPU usage is measured since the previous call rather than by sleeping
+    for a sampling interval.
+
+    Returns:
+        SystemSnapshot shared by all checks for one probe, or None if psutil
+        isn't installed
+    """
+    ps = _get_psutil()
+    if ps is None:
+        return None
+
+    cpu_percent = ps.cpu_percent(interval=None)
+    memory = ps.virtual_memory()
+    disk = ps.disk_usage('/')
+
+    return SystemSnapshot(
+        cpu_percent=cpu_percent,
+        mem_percent=memory.percent,
+        mem_available=memory.available,
+        disk_percent=disk.percent,
+        disk_free=disk.free
+    )
+
+
+async def take_snapshot() -> Optional[SystemSnapshot]:
+    """
+    Get a recent system snapshot, re-reading psutil at most every
+    ``SYSTEM_SNAPSHOT_TTL`` seconds and always off the event loop.
+
+    Returns:
+        SystemSnapshot, or None if psutil isn't installed
+    """
+    global _snapshot_cache
+    expires, snapshot = _snapshot_cache
+    if time.monotonic() < expires:
+        return snapshot
+
+    snapshot = await asyncio.to_thread(_snapshot)
+    _snapshot_cache = (time.monotonic() + SYSTEM_SNAPSHOT_TTL, snapshot)
+    return snapshot
+
+
+def check_disk_space(snapshot: Optional[SystemSnapshot], threshold: float = 90.0) -> bool:
     """
     Check if sufficient disk space is available.
 
     Args:
+        snapshot: System resource snapshot (None if psutil is unavailable)
         threshold: Maximum disk usage percentage before failing check
 
     Returns:
-        True if disk usage is below threshold
+        True if disk usage is below threshold or can't be measured
     """
-    try:
-        usage = psutil.disk_usage('/')
-        return usage.percent < threshold
-    except Exception as e:
-        logger.error(f"Disk check failed: {e}")
-        return False
+    return snapshot is None or snapshot.disk_percent < threshold
 
 
-def check_memory(threshold: float = 90.0) -> bool:
+def check_memory(snapshot: Optional[SystemSnapshot], threshold: float = 90.0) -> bool:
     """
     Check if sufficient memory is available.
 
     Args:
+        snapshot: System resource snapshot (None if psutil is unavailable)
         threshold: Maximum memory usage percentage before failing check
 
     Returns:
-        True if memory usage is below threshold
+        True if memory usage is below threshold or can't be measured
     """
-    try:
-        memory = psutil.virtual_memory()
-        return memory.percent < threshold
-    except Exception as e:
-        logger.error(f"Memory check failed: {e}")
-        return False
+    return snapshot is None or snapshot.mem_percent < threshold
 
 
-def get_system_metrics() -> Dict[str, Any]:
+def get_system_metrics(snapshot: Optional[SystemSnapshot]) -> Dict[str, Any]:
     """
-    Get current system resource metrics.
+    Get system resource metrics from a snapshot.
+
+    Args:
+        snapshot: System resource snapshot (None if psutil is unavailable)
 
     Returns:
-        Dictionary with CPU, memory, and disk metrics
+        Dictionary with CPU, memory, and disk metrics; empty without psutil
     """
-    try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-
-        return {
-            "cpu_percent": cpu_percent,
-            "memory_percent": memory.percent,
-            "memory_available_mb": memory.available / (1024 * 1024),
-            "disk_percent": disk.percent,
-            "disk_available_gb": disk.free / (1024 * 1024 * 1024)
-        }
-    except Exception as e:
-        logger.error(f"Failed to get system metrics: {e}")
-        return {
-            "cpu_percent": 0.0,
-            "memory_percent": 0.0,
-            "disk_percent": 0.0,
-            "error": str(e)
-        }
+    if snapshot is None:
+        return {}
+
+    return {
+        "cpu_percent": snapshot.cpu_percent,
+        "memory_percent": snapshot.mem_percent,
+        "memory_available_mb": snapshot.mem_available / (1024 * 1024),
+        "disk_percent": snapshot.disk_percent,
+        "disk_available_gb": snapshot.disk_free / (1024 * 1024 * 1024)
+    }
 
 
 def get_uptime() -> float:
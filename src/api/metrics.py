@@ -1,35 +1,125 @@
 """Basic metrics collection for monitoring."""
 
+import threading
 import time
+from array import array
+from bisect import bisect_left
 from collections import defaultdict, Counter
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 
+# Upper bounds (µs) of the log-spaced duration histogram buckets: 1ms .. ~524s;
+# durations above the last bound land in an extra overflow bucket
+DURATION_BUCKET_BOUNDS_US = tuple(1000 << i for i in range(20))
+
+# Maximum number of (method, path, status) metric keys memoized; paths with
+# IDs in them are unbounded, so keys past this are formatted per request
+METRIC_KEY_CACHE_SIZE = 1024
+
+
+class DurationStats:
+    """Fixed-size running statistics for request durations, in integer µs."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = array("L", [0] * (len(DURATION_BUCKET_BOUNDS_US) + 1))
+
+    def record(self, duration_us: int) -> None:
+        """
+        Add one observation.
+
+        Args:
+            duration_us: Request duration in microseconds
+        """
+        self.count += 1
+        self.total += duration_us
+        if self.min is None or duration_us < self.min:
+            self.min = duration_us
+        if duration_us > self.max:
+            self.max = duration_us
+        self.buckets[bisect_left(DURATION_BUCKET_BOUNDS_US, duration_us)] += 1
+
+    @property
+    def average(self) -> float:
+        """Mean duration in microseconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> Optional[int]:
+        """
+        Estimate a percentile from the histogram.
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket containing the percentile (capped at the
+            observed maximum), or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+
+        target = self.count * pct / 100
+        seen = 0
+        for idx, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                if idx < len(DURATION_BUCKET_BOUNDS_US):
+                    return min(DURATION_BUCKET_BOUNDS_US[idx], self.max)
+                break
+        return self.max
+
+
 class MetricsCollector:
     """Simple in-memory metrics collector."""
 
+    __slots__ = (
+        "request_count", "request_duration", "validation_results",
+        "document_ingestions", "start_time", "_key_cache", "_lock"
+    )
+
     def __init__(self):
         """Initialize metrics collector."""
         self.request_count = Counter()
-        self.request_duration = defaultdict(list)
+        self.request_duration = defaultdict(DurationStats)
         self.validation_results = Counter()
         self.document_ingestions = Counter()
-        self.start_time = time.time()
-
-    def record_request(self, method: str, path: str, duration_ms: float, status: int) -> None:
+        self.start_time = time.monotonic()
+        self._key_cache: Dict[Tuple[str, str, int], Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _request_keys(self, method: str, path: str, status: int) -> Tuple[str, str]:
+        """Get the (count key, duration key) pair for a request, memoized."""
+        cache_key = (method, path, status)
+        keys = self._key_cache.get(cache_key)
+        if keys is None:
+            keys = (f"{method}:{path}:{status}", f"{method}:{path}")
+            if len(self._key_cache) < METRIC_KEY_CACHE_SIZE:
+                self._key_cache[cache_key] = keys
+        return keys
+
+    def record_request(self, method: str, path: str, duration_us: int, status: int) -> None:
         """
         Record API request metrics.
 
         Args:
             method: HTTP method
             path: Request path
-            duration_ms: Request duration
+            duration_us: Request duration in microseconds
             status: HTTP status code
         """
-        key = f"{method}:{path}:{status}"
-        self.request_count[key] += 1
-        self.request_duration[f"{method}:{path}"].append(duration_ms)
+        count_key, duration_key = self._request_keys(method, path, status)
+
+        # Requests may be recorded from threadpool workers as well as the loop
+        with self._lock:
+            self.request_count[count_key] += 1
+            self.request_duration[duration_key].record(duration_us)
 
     def record_validation(self, status: str) -> None:
         """
@@ -38,7 +128,8 @@ class MetricsCollector:
         Args:
             status: Validation status (approved, rejected, etc.)
         """
-        self.validation_results[status] += 1
+        with self._lock:
+            self.validation_results[status] += 1
 
     def record_ingestion(self, doc_type: str, success: bool) -> None:
         """
@@ -49,7 +140,8 @@ class MetricsCollector:
             success: Whether ingestion succeeded
         """
         key = f"{doc_type}:{'success' if success else 'failure'}"
-        self.document_ingestions[key] += 1
+        with self._lock:
+            self.document_ingestions[key] += 1
 
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -58,39 +150,49 @@ class MetricsCollector:
         Returns:
             Dictionary with collected metrics
         """
-        uptime_seconds = time.time() - self.start_time
-
-        # Calculate average durations
-        avg_duration_ms = {}
-        for key, durations in self.request_duration.items():
-            if durations:
-                avg_duration_ms[key] = sum(durations) / len(durations)
-
-        return {
-            "uptime_seconds": uptime_seconds,
-            "timestamp": datetime.utcnow().isoformat(),
-            "requests": {
-                "total": sum(self.request_count.values()),
-                "by_endpoint": dict(self.request_count),
-                "avg_duration_ms": avg_duration_ms
-            },
-            "validations": {
-                "total": sum(self.validation_results.values()),
-                "by_status": dict(self.validation_results)
-            },
-            "ingestions": {
-                "total": sum(self.document_ingestions.values()),
-                "by_type": dict(self.document_ingestions)
+        uptime_seconds = time.monotonic() - self.start_time
+
+        # Hold the lock so concurrent recording can't resize dicts mid-iteration
+        with self._lock:
+            # Durations are kept as running statistics, so this is O(endpoints);
+            # they are stored in µs and reported in ms
+            avg_duration_ms = {}
+            p95_duration_ms = {}
+            max_duration_ms = {}
+            for key, stats in self.request_duration.items():
+                if stats.count:
+                    avg_duration_ms[key] = stats.average / 1000
+                    p95_duration_ms[key] = stats.percentile(95) / 1000
+                    max_duration_ms[key] = stats.max / 1000
+
+            return {
+                "uptime_seconds": uptime_seconds,
+                "timestamp": datetime.utcnow().isoformat(),
+                "requests": {
+                    "total": sum(self.request_count.values()),
+                    "by_endpoint": dict(self.request_count),
+                    "avg_duration_ms": avg_duration_ms,
+                    "p95_duration_ms": p95_duration_ms,
+                    "max_duration_ms": max_duration_ms
+                },
+                "validations": {
+                    "total": sum(self.validation_results.values()),
+                    "by_status": dict(self.validation_results)
+                },
+                "ingestions": {
+                    "total": sum(self.document_ingestions.values()),
+                    "by_type": dict(self.document_ingestions)
+                }
             }
-        }
 
     def reset(self) -> None:
         """Reset all metrics to zero."""
-        self.request_count.clear()
-        self.request_duration.clear()
-        self.validation_results.clear()
-        self.document_ingestions.clear()
-        self.start_time = time.time()
+        with self._lock:
+            self.request_count.clear()
+            self.request_duration.clear()
+            self.validation_results.clear()
+            self.document_ingestions.clear()
+            self.start_time = time.monotonic()
 
 
 # Global metrics collector instance
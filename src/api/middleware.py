@@ -1,108 +1,175 @@
 """Request/response middleware for timing and logging."""
 
+import atexit
+import queue
 import time
 import logging
-import json
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Callable
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
+
+try:
+    from pythonjsonlogger.json import JsonFormatter
+except ImportError:  # python-json-logger < 3.1
+    from pythonjsonlogger.jsonlogger import JsonFormatter
 
 logger = logging.getLogger(__name__)
 
+# Background listener that formats and writes request logs, and the queue
+# handler feeding it
+_request_log_listener: Optional[QueueListener] = None
+_request_log_handler: Optional[QueueHandler] = None
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """Middleware to track request/response times."""
+# Cached UTC timestamp string, refreshed at most once per second:
+# (epoch second, ISO string)
+_iso_timestamp = (0, "")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request and add timing information.
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware/endpoint handler
+def configure_request_logging() -> QueueListener:
+    """
+    Send request logs through a queue to a background JSON-formatting thread.
+
+    Request handlers only enqueue the log record; JSON serialization and the
+    write happen on the listener thread. Safe to call more than once; undone
+    by shutdown_request_logging.
+
+    Returns:
+        The running QueueListener
+    """
+    global _request_log_listener, _request_log_handler
+    if _request_log_listener is not None:
+        return _request_log_listener
+
+    log_queue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+
+    _request_log_handler = QueueHandler(log_queue)
+    logger.addHandler(_request_log_handler)
+    logger.propagate = False
+
+    _request_log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _request_log_listener.start()
+    atexit.register(shutdown_request_logging)
+
+    return _request_log_listener
 
-        Returns:
-            Response with timing header added
-        """
-        start_time = time.time()
 
-        # Process request
-        response = await call_next(request)
+def shutdown_request_logging() -> None:
+    """
+    Flush and stop the request log listener and restore normal propagation.
 
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+    Safe to call when request logging isn't configured.
+    """
+    global _request_log_listener, _request_log_handler
+    if _request_log_listener is None:
+        return
 
-        # Add timing header
-        response.headers["X-Process-Time"] = f"{duration_ms:.2f}ms"
+    logger.removeHandler(_request_log_handler)
+    logger.propagate = True
+    _request_log_listener.stop()
+    atexit.unregister(shutdown_request_logging)
 
-        # Log request
-        log_request(request, response, duration_ms)
+    _request_log_listener = None
+    _request_log_handler = None
 
-        return response
 
+def iso_now() -> str:
+    """
+    Get the current UTC time as an ISO string at one-second resolution.
 
-class JSONLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for structured JSON logging of requests."""
+    The string is only re-formatted when the second changes, so per-request
+    callers (logging middleware, liveness) don't build a datetime every time.
+    Concurrent refreshes just write the same value twice.
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _iso_timestamp
+    second = int(time.time())
+    if second != _iso_timestamp[0]:
+        _iso_timestamp = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _iso_timestamp[1]
+
+
+class ObservabilityMiddleware:
+    """
+    Pure ASGI middleware that times each request, adds an X-Process-Time
+    header and writes one structured log record.
+
+    Replaces the separate timing and logging BaseHTTPMiddleware layers, each of
+    which spawned its own task and response stream per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Log request and response in structured JSON format.
+        Time the wrapped app and log the request once it completes.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware/endpoint handler
-
-        Returns:
-            Response from the endpoint
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Log in structured format
-        log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-            "client_ip": request.client.host if request.client else None,
-            "user_agent": request.headers.get("user-agent", "unknown")
-        }
-
-        # Log at appropriate level
-        if response.status_code >= 500:
-            logger.error(f"Request failed: {json.dumps(log_data)}")
-        elif response.status_code >= 400:
-            logger.warning(f"Client error: {json.dumps(log_data)}")
-        else:
-            logger.info(f"Request processed: {json.dumps(log_data)}")
-
-        return response
-
-
-def log_request(request: Request, response: Response, duration_ms: float) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_us = (time.perf_counter_ns() - start_ns) // 1000
+                MutableHeaders(scope=message).raw.append(
+                    (b"x-process-time", b"%d.%03dms" % divmod(duration_us, 1000))
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            log_request(scope, status_code, (time.perf_counter_ns() - start_ns) // 1000 / 1000)
+
+
+def log_request(scope: Scope, status_code: int, duration_ms: float) -> None:
     """
     Log request details in structured format.
 
+    Fields travel as record attributes and are serialized to JSON by the
+    request log handler.
+
     Args:
-        request: The request object
-        response: The response object
+        scope: ASGI connection scope of the request
+        status_code: Response status code
         duration_ms: Request duration in milliseconds
     """
-    logger.info(
-        "Request processed",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-            "client": request.client.host if request.client else None
-        }
-    )
+    log_data = {
+        "timestamp": iso_now(),
+        "method": scope["method"],
+        "path": scope["path"],
+        "status_code": status_code,
+        "duration_ms": duration_ms
+    }
+
+    if status_code < 400:
+        logger.info("Request processed", extra=log_data)
+        return
+
+    # Client details are only worth decoding for failed requests
+    client = scope.get("client")
+    log_data["client_ip"] = client[0] if client else None
+    log_data["user_agent"] = Headers(scope=scope).get("user-agent", "unknown")
+    log_data["query_params"] = dict(QueryParams(scope.get("query_string", b"")))
+
+    if status_code >= 500:
+        logger.error("Request failed", extra=log_data)
+    else:
+        logger.warning("Client error", extra=log_data)
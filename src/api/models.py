@@ -1,10 +1,17 @@
 """Pydantic models for API request/response validation."""
 
 from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation
 from datetime import datetime
 
 
+# Free-form payloads the server builds itself (query rows, violations, health
+# details). Response models skip re-validating their contents; the JSON schema
+# is unchanged
+ServerDict = SkipValidation[Dict[str, Any]]
+ServerDictList = SkipValidation[List[Dict[str, Any]]]
+
+
 class AgentRequestModel(BaseModel):
     """Request model for agent approval."""
 
@@ -38,8 +45,8 @@ class AgentResponseModel(BaseModel):
     approved_location: Optional[str] = Field(None, description="Where to write if approved")
     required_changes: List[str] = Field(default_factory=list, description="Changes needed")
     next_steps: List[str] = Field(default_factory=list, description="What to do next")
-    violations: List[Dict[str, Any]] = Field(default_factory=list, description="Violations found")
-    warnings: List[Dict[str, Any]] = Field(default_factory=list, description="Warnings")
+    violations: ServerDictList = Field(default_factory=list, description="Violations found")
+    warnings: ServerDictList = Field(default_factory=list, description="Warnings")
     confidence: float = Field(1.0, ge=0.0, le=1.0, description="Confidence in decision")
     processing_time_ms: float = Field(0.0, description="Processing time in milliseconds")
 
@@ -75,28 +82,36 @@ class SemanticQueryRequest(BaseModel):
 
 class SemanticQueryResponse(BaseModel):
     """Response model for semantic search."""
-    results: List[Dict[str, Any]] = Field(..., description="Search results")
+    results: ServerDictList = Field(..., description="Search results")
 
 
 class CypherQueryResponse(BaseModel):
     """Response model for Cypher queries."""
-    results: List[Dict[str, Any]] = Field(..., description="Query results")
+    results: ServerDictList = Field(..., description="Query results")
 
 
 class DriftCheckResponse(BaseModel):
     """Response model for drift detection."""
     drift_detected: bool = Field(..., description="Whether drift was detected")
-    mismatches: List[Dict[str, Any]] = Field(default_factory=list, description="Drift violations")
+    mismatches: ServerDictList = Field(default_factory=list, description="Drift violations")
 
 
 class ComplianceCheckResponse(BaseModel):
     """Response model for compliance check."""
     compliance_rate: float = Field(..., ge=0.0, le=1.0, description="Compliance rate")
-    violations: List[Dict[str, Any]] = Field(default_factory=list, description="Violations found")
-    uncovered_requirements: List[Dict[str, Any]] = Field(
+    violations: ServerDictList = Field(default_factory=list, description="Violations found")
+    uncovered_requirements: ServerDictList = Field(
         default_factory=list,
         description="Requirements without implementation"
     )
+    next_violation_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page of violations, if any"
+    )
+    next_requirement_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page of uncovered requirements, if any"
+    )
 
 
 class IngestRequest(BaseModel):
@@ -107,6 +122,10 @@ class IngestRequest(BaseModel):
         description="Type of document"
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    force_update: bool = Field(
+        False,
+        description="Re-ingest even if a document with identical content is already stored"
+    )
 
 
 class IngestResponse(BaseModel):
@@ -123,4 +142,4 @@ class HealthResponse(BaseModel):
     ollama: bool = Field(..., description="Ollama connection status")
     version: str = Field(..., description="API version")
     uptime_seconds: Optional[float] = Field(None, description="Application uptime in seconds")
-    details: Optional[Dict[str, Any]] = Field(None, description="Additional health details")
+    details: Optional[ServerDict] = Field(None, description="Additional health details")
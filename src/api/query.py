@@ -1,21 +1,44 @@
 """Query endpoints for semantic search and Cypher queries."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+import asyncio
+import heapq
 import logging
-from typing import Optional
+import re
+from itertools import islice
+from typing import Any, Optional
+
+from neo4j.time import Date, DateTime, Duration, Time
 
 from src.api.models import SemanticQueryRequest, SemanticQueryResponse, CypherQueryResponse
-from src.graph.connection import get_connection
+from src.graph.connection import Neo4jConnection, get_connection
 from src.graph.vector_ops import VectorOperations
-from src.processing.embedder import EmbeddingGenerator
+from src.api.clients import get_embedder, get_neo4j_connection
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Write clauses rejected by the read-only Cypher endpoint, matched as whole
+# words in a single case-insensitive pass, or as the start of a camelCase
+# procedure name such as apoc.refactor.mergeNodes
+DISALLOWED_CYPHER_KEYWORDS = "CREATE|DELETE|SET|REMOVE|MERGE|DROP|DETACH|FOREACH"
+DISALLOWED_CYPHER_PATTERN = re.compile(
+    rf'\b(?:{DISALLOWED_CYPHER_KEYWORDS})\b'
+    rf'|(?<=\.)(?:{DISALLOWED_CYPHER_KEYWORDS})(?=(?-i:[A-Z]))',
+    re.IGNORECASE
+)
+
+# Characters of document content returned per search result; truncated in Neo4j
+RESULT_CONTENT_CHARS = 500
+
+# Neo4j temporal types that can come back from arbitrary Cypher; they aren't
+# JSON-serializable, so they're returned as ISO 8601 strings
+NEO4J_TEMPORAL_TYPES = (DateTime, Date, Time, Duration)
+
 # Initialize services
 vector_ops = None
-embedder = None
 
 
 def get_vector_ops() -> VectorOperations:
@@ -27,15 +50,7 @@ def get_vector_ops() -> VectorOperations:
     return vector_ops
 
 
-def get_embedder() -> EmbeddingGenerator:
-    """Get or create embedder instance."""
-    global embedder
-    if embedder is None:
-        embedder = EmbeddingGenerator()
-    return embedder
-
-
-@router.post("/semantic", response_model=SemanticQueryResponse)
+@router.post("/semantic", response_model=SemanticQueryResponse, response_class=ORJSONResponse)
 async def semantic_search(request: SemanticQueryRequest):
     """
     Perform semantic search across specifications.
@@ -64,26 +79,38 @@ async def semantic_search(request: SemanticQueryRequest):
         else:  # all
             node_labels = ["Architecture", "Design"]
 
-        # Search across specified node types
-        ops = get_vector_ops()
-        all_results = []
+        # The driver needs a list; convert once and share it across labels
+        embedding_list = query_embedding.tolist()
 
-        for label in node_labels:
-            try:
-                results = await ops.vector_search(
-                    query_embedding=query_embedding.tolist(),
+        # Search across specified node types concurrently
+        ops = get_vector_ops()
+        label_results = await asyncio.gather(
+            *(
+                ops.vector_search(
+                    query_embedding=embedding_list,
                     node_label=label,
                     limit=request.limit,
-                    threshold=0.3  # Minimum similarity score
+                    threshold=0.3,  # Minimum similarity score
+                    content_chars=RESULT_CONTENT_CHARS
                 )
-                all_results.extend(results)
-            except Exception as e:
-                logger.warning(f"Search failed for {label}: {e}")
+                for label in node_labels
+            ),
+            return_exceptions=True
+        )
+
+        results_per_label = []
+        for label, results in zip(node_labels, label_results):
+            if isinstance(results, Exception):
+                logger.warning(f"Search failed for {label}: {results}")
                 continue
+            results_per_label.append(results)
 
-        # Sort by score and limit
-        all_results.sort(key=lambda x: x['score'], reverse=True)
-        all_results = all_results[:request.limit]
+        # Each label's results are already sorted by score, so merge them and
+        # stop after the top results instead of re-sorting everything
+        all_results = list(islice(
+            heapq.merge(*results_per_label, key=lambda x: x['score'], reverse=True),
+            request.limit
+        ))
 
         # Format results
         formatted_results = []
@@ -92,7 +119,7 @@ async def semantic_search(request: SemanticQueryRequest):
             formatted_results.append({
                 "id": node.get('id', 'unknown'),
                 "type": node.get('doc_type', 'unknown'),
-                "content": node.get('content', '')[:500],  # Truncate for response
+                "content": node.get('content', ''),  # Already truncated by the query
                 "relevance_score": result['score'],
                 "metadata": {
                     "title": node.get('title'),
@@ -104,15 +131,39 @@ async def semantic_search(request: SemanticQueryRequest):
 
         logger.info(f"Semantic search returned {len(formatted_results)} results")
 
-        return SemanticQueryResponse(results=formatted_results)
+        # Results are plain dicts built above, so skip response-model
+        # validation and hand them straight to orjson
+        return ORJSONResponse({"results": formatted_results})
 
     except Exception as e:
         logger.error(f"Semantic search failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+def _to_json_value(value: Any) -> Any:
+    """
+    Convert Neo4j temporal values nested in a query result to ISO strings.
+
+    Args:
+        value: Record, list or scalar from a query result
+
+    Returns:
+        The value with every temporal replaced by its ISO 8601 string
+    """
+    if isinstance(value, NEO4J_TEMPORAL_TYPES):
+        return value.iso_format()
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    return value
+
+
 @router.get("/cypher", response_model=CypherQueryResponse)
-async def cypher_query(q: str = Query(..., description="Cypher query to execute")):
+async def cypher_query(
+    q: str = Query(..., description="Cypher query to execute"),
+    conn: Neo4jConnection = Depends(get_neo4j_connection)
+):
     """
     Execute a read-only Cypher query against the graph database.
 
@@ -120,34 +171,28 @@ async def cypher_query(q: str = Query(..., description="Cypher query to execute"
 
     Args:
         q: Cypher query string (must be read-only)
+        conn: Neo4j connection opened by the app lifespan
 
     Returns:
         CypherQueryResponse with query results
     """
     try:
         # Security check: only allow read queries
-        query_upper = q.strip().upper()
-        disallowed_keywords = [
-            'CREATE', 'DELETE', 'SET', 'REMOVE', 'MERGE',
-            'DROP', 'DETACH', 'FOREACH'
-        ]
-
-        for keyword in disallowed_keywords:
-            if keyword in query_upper:
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Write operations not allowed. Found: {keyword}"
-                )
+        match = DISALLOWED_CYPHER_PATTERN.search(q)
+        if match:
+            raise HTTPException(
+                status_code=403,
+                detail=f"Write operations not allowed. Found: {match.group(0).upper()}"
+            )
 
         logger.info(f"Executing Cypher query: {q[:100]}...")
 
         # Execute query
-        conn = get_connection()
         results = await conn.execute_read(q)
 
         logger.info(f"Cypher query returned {len(results)} results")
 
-        return CypherQueryResponse(results=results)
+        return CypherQueryResponse(results=[_to_json_value(r) for r in results])
 
     except HTTPException:
         raise
@@ -156,7 +201,11 @@ async def cypher_query(q: str = Query(..., description="Cypher query to execute"
         raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}")
 
 
-@router.get("/similar/{node_id}", response_model=SemanticQueryResponse)
+@router.get(
+    "/similar/{node_id}",
+    response_model=SemanticQueryResponse,
+    response_class=ORJSONResponse,
+)
 async def find_similar(
     node_id: str,
     node_type: str = Query("Architecture", description="Node type (Architecture or Design)"),
@@ -182,7 +231,8 @@ async def find_similar(
         results = await ops.find_similar_documents(
             document_id=node_id,
             node_label=node_type,
-            limit=limit
+            limit=limit,
+            content_chars=RESULT_CONTENT_CHARS
         )
 
         # Format results
@@ -192,7 +242,7 @@ async def find_similar(
             formatted_results.append({
                 "id": node.get('id', 'unknown'),
                 "type": node.get('doc_type', 'unknown'),
-                "content": node.get('content', '')[:500],
+                "content": node.get('content', ''),
                 "relevance_score": result['score'],
                 "metadata": {
                     "title": node.get('title'),
@@ -203,7 +253,7 @@ async def find_similar(
 
         logger.info(f"Found {len(formatted_results)} similar documents")
 
-        return SemanticQueryResponse(results=formatted_results)
+        return ORJSONResponse({"results": formatted_results})
 
     except Exception as e:
         logger.error(f"Similar document search failed: {e}", exc_info=True)
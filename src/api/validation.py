@@ -1,39 +1,95 @@
 """Validation endpoints for drift detection and compliance checking."""
 
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from functools import lru_cache
+from typing import Optional
 import logging
 
 from src.api.models import DriftCheckResponse, ComplianceCheckResponse
-from src.validation.drift_detector import DriftDetector
-from src.graph.connection import get_connection
+from src.validation.drift_detector import (
+    DriftDetector,
+    DESIGN_DRIFT_QUERY,
+    UNDOCUMENTED_CODE_QUERY,
+    UNCOVERED_REQUIREMENTS_QUERY
+)
+from src.graph.connection import Neo4jConnection, get_connection
+from src.api.clients import get_neo4j_connection
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Initialize drift detector
-drift_detector = None
-
-
+# Characters of requirement text returned in compliance reports
+REQUIREMENT_TEXT_CHARS = 200
+
+# Default number of designs with violations and of uncovered requirements
+# returned per compliance report page
+COMPLIANCE_PAGE_SIZE = 50
+
+# Spec counts, unapproved modifications and uncovered requirements for a
+# subsystem in a single round-trip, one subquery per part of the report.
+# Violations are [design_id, modified_at, arch_id] and uncovered requirements
+# [req_id, text, priority]. Both lists are keyset-paginated by id: a page
+# starts after its cursor, and violations are paged by design so one design's
+# violations never straddle two pages
+COMPLIANCE_QUERY = """
+CALL {
+    MATCH (a:Architecture {subsystem: $subsystem})
+    RETURN count(a) as total
+}
+CALL {
+    MATCH (a:Architecture {subsystem: $subsystem})
+    WHERE exists((a)<-[:IMPLEMENTS]-(:Design))
+    RETURN count(a) as implemented
+}
+CALL {
+    MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture {subsystem: $subsystem})
+    WHERE d.modified_at > a.modified_at
+      AND NOT exists((:Decision)-[:APPROVES]->(:AgentRequest)-[:TARGETS]->(d))
+      AND ($violation_cursor IS NULL OR d.id > $violation_cursor)
+    WITH d, collect([d.id, d.modified_at, a.id]) as rows
+    ORDER BY d.id
+    LIMIT $page_size
+    WITH collect(rows) as pages, count(d) as designs
+    RETURN reduce(acc = [], rows IN pages | acc + rows) as violations, designs
+}
+CALL {
+    MATCH (r:Requirement {subsystem: $subsystem, status: 'active'})
+    WHERE NOT exists((r)<-[:SATISFIES]-())
+      AND ($requirement_cursor IS NULL OR r.id > $requirement_cursor)
+    WITH r
+    ORDER BY r.id
+    LIMIT $page_size
+    RETURN collect([r.id, substring(coalesce(r.text, ''), 0, $text_chars), r.priority]) as uncovered
+}
+RETURN total, implemented, violations, designs, uncovered
+"""
+
+# Queries whose execution plans are compiled at startup, with sample parameters
+PLAN_WARMUP_QUERIES = [
+    (COMPLIANCE_QUERY, {
+        "subsystem": "",
+        "violation_cursor": None,
+        "requirement_cursor": None,
+        "page_size": COMPLIANCE_PAGE_SIZE,
+        "text_chars": REQUIREMENT_TEXT_CHARS
+    }),
+    (DESIGN_DRIFT_QUERY, {}),
+    (UNDOCUMENTED_CODE_QUERY, {}),
+    (UNCOVERED_REQUIREMENTS_QUERY, {})
+]
+
+
+@lru_cache(maxsize=1)
 def get_drift_detector() -> DriftDetector:
     """Get or create drift detector instance."""
-    global drift_detector
-    if drift_detector is None:
-        conn = get_connection()
-
-        def sync_graph_query(query: str, params: dict = None):
-            """Synchronous wrapper for graph queries."""
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            return loop.run_until_complete(conn.execute_read(query, params or {}))
-
-        drift_detector = DriftDetector(graph_query=sync_graph_query)
-    return drift_detector
+    # Drift queries are unbounded, so stream their records rather than
+    # materializing each result set
+    conn = get_connection()
+    return DriftDetector(
+        graph_query=conn.execute_read,
+        graph_stream=conn.stream_read
+    )
 
 
 @router.get("/drift-check", response_model=DriftCheckResponse)
@@ -53,7 +109,7 @@ async def drift_check():
         logger.info("Running drift detection...")
 
         detector = get_drift_detector()
-        violations = detector.detect_all_drift()
+        violations = await detector.detect_all_drift()
 
         # Convert violations to response format
         mismatches = [v.to_dict() for v in violations]
@@ -74,16 +130,30 @@ async def drift_check():
 
 @router.get("/compliance/{subsystem}", response_model=ComplianceCheckResponse)
 async def compliance_check(
-    subsystem: str = Path(..., description="Subsystem to check compliance for")
+    subsystem: str = Path(..., description="Subsystem to check compliance for"),
+    violation_cursor: Optional[str] = Query(
+        None, description="Return violations for designs after this design id"
+    ),
+    requirement_cursor: Optional[str] = Query(
+        None, description="Return uncovered requirements after this requirement id"
+    ),
+    page_size: int = Query(COMPLIANCE_PAGE_SIZE, ge=1, le=500, description="Items per page"),
+    conn: Neo4jConnection = Depends(get_neo4j_connection)
 ):
     """
     Check compliance rate for a specific subsystem.
 
     Calculates what percentage of architecture specifications have corresponding
-    implementations and identifies violations.
+    implementations and identifies violations. Violations and uncovered
+    requirements are paginated; pass the returned next cursors to fetch the
+    following pages.
 
     Args:
         subsystem: Name of the subsystem to check
+        violation_cursor: Last design id of the previous violations page
+        requirement_cursor: Last requirement id of the previous uncovered page
+        page_size: Maximum designs with violations and uncovered requirements per page
+        conn: Neo4j connection from the app lifespan
 
     Returns:
         ComplianceCheckResponse with compliance metrics
@@ -91,63 +161,49 @@ async def compliance_check(
     try:
         logger.info(f"Checking compliance for subsystem: {subsystem}")
 
-        conn = get_connection()
-
-        # Query for architecture specs in this subsystem
-        arch_query = """
-        MATCH (a:Architecture {subsystem: $subsystem})
-        RETURN count(a) as total
-        """
-        arch_result = await conn.execute_read(arch_query, {"subsystem": subsystem})
-        total_specs = arch_result[0].get("total", 0) if arch_result else 0
-
-        # Query for implemented specs
-        impl_query = """
-        MATCH (a:Architecture {subsystem: $subsystem})
-        WHERE exists((a)<-[:IMPLEMENTS]-(:Design))
-        RETURN count(a) as implemented
-        """
-        impl_result = await conn.execute_read(impl_query, {"subsystem": subsystem})
-        implemented = impl_result[0].get("implemented", 0) if impl_result else 0
+        result = await conn.execute_read(
+            COMPLIANCE_QUERY,
+            {
+                "subsystem": subsystem,
+                "violation_cursor": violation_cursor,
+                "requirement_cursor": requirement_cursor,
+                "page_size": page_size,
+                "text_chars": REQUIREMENT_TEXT_CHARS
+            }
+        )
+        report = result[0] if result else {}
+
+        total_specs = report.get("total", 0)
+        implemented = report.get("implemented", 0)
+        violation_results = report.get("violations", [])
+        uncovered_results = report.get("uncovered", [])
+
+        # A full page means there may be more after its last id
+        next_violation_cursor = None
+        if report.get("designs", 0) == page_size and violation_results:
+            next_violation_cursor = violation_results[-1][0]
+        next_requirement_cursor = None
+        if len(uncovered_results) == page_size:
+            next_requirement_cursor = uncovered_results[-1][0]
 
         # Calculate compliance rate
         compliance_rate = (implemented / total_specs) if total_specs > 0 else 1.0
 
-        # Query for violations (unapproved changes)
-        violation_query = """
-        MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture {subsystem: $subsystem})
-        WHERE d.modified_at > a.modified_at
-          AND NOT exists((:Decision)-[:APPROVES]->(:AgentRequest)-[:TARGETS]->(d))
-        RETURN d.id as design_id, d.modified_at as modified, a.id as arch_id
-        LIMIT 50
-        """
-        violation_results = await conn.execute_read(violation_query, {"subsystem": subsystem})
-
-        violations = []
-        for v in violation_results:
-            violations.append({
+        # Rows are fixed-order lists, so unpack them rather than looking up keys
+        violations = [
+            {
                 "type": "unapproved_modification",
-                "design_id": v.get("design_id"),
-                "architecture_id": v.get("arch_id"),
-                "modified_at": str(v.get("modified"))
-            })
-
-        # Query for uncovered requirements
-        uncovered_query = """
-        MATCH (r:Requirement {subsystem: $subsystem, status: 'active'})
-        WHERE NOT exists((r)<-[:SATISFIES]-())
-        RETURN r.id as req_id, r.text as text, r.priority as priority
-        LIMIT 50
-        """
-        uncovered_results = await conn.execute_read(uncovered_query, {"subsystem": subsystem})
-
-        uncovered_requirements = []
-        for r in uncovered_results:
-            uncovered_requirements.append({
-                "id": r.get("req_id"),
-                "text": r.get("text", "")[:200],
-                "priority": r.get("priority", "medium")
-            })
+                "design_id": design_id,
+                "architecture_id": arch_id,
+                "modified_at": str(modified)
+            }
+            for design_id, modified, arch_id in violation_results
+        ]
+
+        uncovered_requirements = [
+            {"id": req_id, "text": text, "priority": priority or "medium"}
+            for req_id, text, priority in uncovered_results
+        ]
 
         logger.info(
             f"Compliance check for {subsystem}: "
@@ -159,7 +215,9 @@ async def compliance_check(
         return ComplianceCheckResponse(
             compliance_rate=compliance_rate,
             violations=violations,
-            uncovered_requirements=uncovered_requirements
+            uncovered_requirements=uncovered_requirements,
+            next_violation_cursor=next_violation_cursor,
+            next_requirement_cursor=next_requirement_cursor
         )
 
     except Exception as e:
@@ -181,7 +239,7 @@ async def drift_summary():
         logger.info("Generating drift summary...")
 
         detector = get_drift_detector()
-        summary = detector.get_drift_summary()
+        summary = await detector.get_drift_summary()
 
         logger.info(f"Drift summary: {summary['total_violations']} total violations")
 
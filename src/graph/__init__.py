@@ -42,13 +42,13 @@ Usage:
 """
 
 from .config import GraphConfig, get_config, reload_config
-from .connection import Neo4jConnection, get_connection, close_connection
+from .connection import Neo4jConnection, get_connection, close_connection, query_id
 from .schema import (
     SchemaManager,
     NodeLabels,
     RelationshipTypes
 )
-from .operations import GraphOperations
+from .operations import GraphOperations, WriteCoalescer, WritePipeline
 from .vector_ops import VectorOperations
 from .queries import QueryExecutor
 
@@ -62,6 +62,7 @@ __all__ = [
     "Neo4jConnection",
     "get_connection",
     "close_connection",
+    "query_id",
 
     # Schema
     "SchemaManager",
@@ -70,6 +71,8 @@ __all__ = [
 
     # Operations
     "GraphOperations",
+    "WriteCoalescer",
+    "WritePipeline",
     "VectorOperations",
     "QueryExecutor",
 ]
@@ -6,7 +6,7 @@ Loads configuration from environment variables using Pydantic BaseSettings.
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from typing import Optional
+from functools import lru_cache
 
 
 class GraphConfig(BaseSettings):
@@ -45,7 +45,13 @@ class GraphConfig(BaseSettings):
     )
     max_connection_pool_size: int = Field(
         default=50,
-        description="Maximum connection pool size (default: 50 connections)"
+        description="Maximum connection pool size for writes, and for reads when they "
+                    "share the pool (default: 50 connections)"
+    )
+    read_pool_size: int = Field(
+        default=32,
+        description="Maximum connection pool size of a separate driver used for reads, "
+                    "so slow writes can't starve them; 0 shares the write pool (default: 32)"
     )
     connection_acquisition_timeout: int = Field(
         default=60,
@@ -68,21 +74,35 @@ class GraphConfig(BaseSettings):
         description="Query execution timeout in milliseconds (default: 30s)"
     )
 
+    # Read Query Cache Settings
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache read query results in process (default: enabled)"
+    )
+    cache_size: int = Field(
+        default=256,
+        description="Maximum number of cached read query results (default: 256)"
+    )
+    cache_ttl: float = Field(
+        default=10.0,
+        description="Seconds a cached read query result stays valid (default: 10s)"
+    )
 
-# Global config instance
-_config: Optional[GraphConfig] = None
+    # APOC Settings
+    use_apoc: bool = Field(
+        default=False,
+        description="Create nodes and relationships through APOC procedures, passing "
+                    "labels and types as parameters (requires the APOC plugin)"
+    )
 
 
+@lru_cache(maxsize=1)
 def get_config() -> GraphConfig:
     """Get or create the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = GraphConfig()
-    return _config
+    return GraphConfig()
 
 
 def reload_config() -> GraphConfig:
     """Reload configuration from environment."""
-    global _config
-    _config = GraphConfig()
-    return _config
+    get_config.cache_clear()
+    return get_config()
@@ -2,15 +2,72 @@
 Neo4j async connection management with health checks and transaction support.
 """
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
-from typing import Optional, Any, Dict, List, Callable
+import neo4j
+from neo4j import (
+    AsyncGraphDatabase,
+    AsyncDriver,
+    AsyncSession,
+    Query,
+    RoutingControl,
+    READ_ACCESS,
+    WRITE_ACCESS
+)
+from typing import Optional, Any, AsyncIterator, Dict, Iterable, List, Callable, Tuple, Union
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import hashlib
 import logging
+import time
 
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Seconds a health check result is reused before Neo4j is pinged again
+HEALTH_CHECK_TTL = 5.0
+
+# Database statistics for health checks. Each subquery is a bare count, which
+# Neo4j answers from its count store in constant time instead of scanning
+# every node and relationship
+HEALTH_STATS_QUERY = """
+CALL { MATCH (n) RETURN count(n) as nodeCount }
+CALL { MATCH ()-[r]->() RETURN count(r) as relCount }
+RETURN nodeCount, relCount
+"""
+
+# PackStream codec in use: neo4j-rust-ext replaces the pure-Python one when installed
+try:
+    import neo4j._rust  # noqa: F401
+    PACKSTREAM_BACKEND = "rust"
+except ImportError:
+    PACKSTREAM_BACKEND = "python"
+
+
+@lru_cache(maxsize=1024)
+def query_id(query: str) -> str:
+    """
+    Fingerprint a Cypher query string.
+
+    Identical query text always gets the same id, so log lines for one
+    query can be grouped and the read cache can key on a short id instead
+    of the full text. Results are memoized, so module-level query constants
+    are only hashed once.
+
+    Args:
+        query: Cypher query string
+
+    Returns:
+        16-character hex digest of the query text
+    """
+    return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+
+
+def _query_text(query: Union[str, Query]) -> str:
+    """Get the Cypher text of a query string or neo4j.Query."""
+    return query.text if isinstance(query, Query) else query
+
 
 class Neo4jConnection:
     """Manages async Neo4j driver connection with connection pooling."""
@@ -36,34 +93,116 @@ class Neo4jConnection:
         self.driver: Optional[AsyncDriver] = None
         self._is_connected = False
 
+        # Separate driver, and so connection pool, for reads when
+        # read_pool_size is set, so slow writes holding connections can't
+        # starve reads. None means reads share self.driver
+        self.read_driver: Optional[AsyncDriver] = None
+
+        # Serializes connect() so concurrent first requests create one driver
+        self._connect_lock = asyncio.Lock()
+
+        # Last health check result: (monotonic expiry, health dict)
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # LRU cache of read results: (query, params) -> (monotonic expiry, records).
+        # Only touched from the event loop between awaits, so it needs no lock
+        self.cache_enabled = config.cache_enabled
+        self.cache_size = config.cache_size
+        self.cache_ttl = config.cache_ttl
+        self._query_cache: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+
+        # Bumped by every write so reads that overlap a write aren't cached
+        self._cache_version = 0
+
+        # Cacheable reads currently running, so identical concurrent reads
+        # wait for the one already sent instead of stampeding Neo4j
+        self._inflight_reads: Dict[Tuple, asyncio.Task] = {}
+
+        # Read cache counters reported by cache_stats()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_coalesced = 0
+
     async def connect(self) -> None:
         """Establish connection to Neo4j database."""
         if self._is_connected:
             logger.warning("Already connected to Neo4j")
             return
 
-        try:
-            config = get_config()
-
-            self.driver = AsyncGraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password),
-                max_connection_lifetime=config.max_connection_lifetime,
-                max_connection_pool_size=config.max_connection_pool_size,
-                connection_acquisition_timeout=config.connection_acquisition_timeout
-            )
+        async with self._connect_lock:
+            # Another caller may have connected while we waited
+            if self._is_connected:
+                return
+
+            driver = None
+            read_driver = None
+            try:
+                config = get_config()
+
+                driver = self._create_driver(config.max_connection_pool_size)
+                if config.read_pool_size > 0:
+                    read_driver = self._create_driver(config.read_pool_size)
+
+                # Verify connection
+                await driver.verify_connectivity()
+                if read_driver is not None:
+                    await read_driver.verify_connectivity()
+
+                self.driver = driver
+                self.read_driver = read_driver
+                self._is_connected = True
+                logger.info(
+                    f"Connected to Neo4j at {self.uri} "
+                    f"(driver {neo4j.__version__}, {PACKSTREAM_BACKEND} PackStream, "
+                    f"{'separate' if read_driver else 'shared'} read pool)"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to connect to Neo4j: {e}")
+                for d in (driver, read_driver):
+                    if d is not None:
+                        await d.close()
+                raise
+
+    def _create_driver(self, pool_size: int) -> AsyncDriver:
+        """
+        Create a driver with its own connection pool.
 
-            # Verify connection
-            await self.driver.verify_connectivity()
-            self._is_connected = True
-            logger.info(f"Connected to Neo4j at {self.uri}")
+        Args:
+            pool_size: Maximum connections in the driver's pool
 
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            raise
+        Returns:
+            New async driver (not yet verified)
+        """
+        config = get_config()
+        return AsyncGraphDatabase.driver(
+            self.uri,
+            auth=(self.user, self.password),
+            max_connection_lifetime=config.max_connection_lifetime,
+            max_connection_pool_size=pool_size,
+            connection_acquisition_timeout=config.connection_acquisition_timeout
+        )
+
+    def _driver_for(self, read: bool) -> AsyncDriver:
+        """
+        Pick the driver whose pool serves a read or a write.
+
+        Args:
+            read: Whether the work is read-only
+
+        Returns:
+            The read driver for reads when one exists, otherwise the main driver
+        """
+        if read and self.read_driver is not None:
+            return self.read_driver
+        return self.driver
 
     async def close(self) -> None:
         """Close connection to Neo4j database."""
+        if self.read_driver:
+            await self.read_driver.close()
+            self.read_driver = None
+
         if self.driver:
             await self.driver.close()
             self._is_connected = False
@@ -87,36 +226,209 @@ class Neo4jConnection:
             return False
 
     @asynccontextmanager
-    async def session(self, **kwargs) -> AsyncSession:
+    async def session(self, access_mode: Optional[str] = None, **kwargs) -> AsyncSession:
         """
         Get async session context manager.
 
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS; read sessions can be
+                served by cluster read replicas and come from the read pool.
+                Defaults to the driver's (write) mode
+            **kwargs: Additional driver session options
+
         Yields:
             AsyncSession for executing queries
         """
         if not self.driver:
             await self.connect()
 
-        async with self.driver.session(database=self.database, **kwargs) as session:
+        if access_mode is not None:
+            kwargs["default_access_mode"] = access_mode
+
+        driver = self._driver_for(access_mode == READ_ACCESS)
+        async with driver.session(database=self.database, **kwargs) as session:
             yield session
 
-    async def execute_read(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+    async def execute_read(self, query: Union[str, Query], parameters: Optional[Dict] = None,
+                           ttl: Optional[float] = None) -> List[Dict]:
         """
         Execute read query and return results.
 
+        Results are cached for ``cache_ttl`` seconds, keyed on the query and
+        its parameters; any write through this connection clears the cache.
+        Identical reads issued while one is already running share its result.
+        Queries with unhashable parameters (e.g. embedding lists) are never
+        cached.
+
         Args:
-            query: Cypher query string
+            query: Cypher query string, or a neo4j.Query carrying metadata
+                and a timeout
             parameters: Query parameters
+            ttl: Seconds to cache this result, overriding ``cache_ttl``
 
         Returns:
             List of result records as dictionaries
         """
         parameters = parameters or {}
 
-        async with self.session() as session:
-            result = await session.run(query, parameters)
-            records = await result.data()
-            return records
+        key = self._cache_key(query, parameters) if self.cache_enabled else None
+        if key is None:
+            return await self._execute_query(query, parameters, RoutingControl.READ)
+
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            expires, records = cached
+            if time.monotonic() < expires:
+                self._query_cache.move_to_end(key)
+                self._cache_hits += 1
+                return list(records)
+            del self._query_cache[key]
+
+        inflight = self._inflight_reads.get(key)
+        if inflight is not None:
+            self._cache_coalesced += 1
+        else:
+            # The shared read runs in its own task, so cancelling whichever
+            # caller started it doesn't cancel it for the others
+            self._cache_misses += 1
+            inflight = asyncio.create_task(
+                self._read_and_cache(key, query, parameters, ttl, self._cache_version)
+            )
+            inflight.add_done_callback(lambda task: self._read_done(key, task))
+            self._inflight_reads[key] = inflight
+
+        # Shielded so a cancelled caller doesn't cancel the shared read
+        return list(await asyncio.shield(inflight))
+
+    async def _read_and_cache(self, key: Tuple, query: Union[str, Query], parameters: Dict,
+                              ttl: Optional[float], version: int) -> List[Dict]:
+        """
+        Run a cacheable read and cache its records unless a write overlapped it.
+
+        Args:
+            key: Cache key from _cache_key
+            query: Cypher query string or neo4j.Query
+            parameters: Query parameters
+            ttl: Seconds to cache the result, overriding ``cache_ttl``
+            version: Cache version when the read was requested
+
+        Returns:
+            List of result records as dictionaries
+        """
+        records = await self._execute_query(query, parameters, RoutingControl.READ)
+
+        if version == self._cache_version:
+            expires = time.monotonic() + (self.cache_ttl if ttl is None else ttl)
+            self._query_cache[key] = (expires, records)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > self.cache_size:
+                self._query_cache.popitem(last=False)
+
+        return records
+
+    def _read_done(self, key: Tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared read; its callers may all have gone."""
+        if self._inflight_reads.get(key) is task:
+            del self._inflight_reads[key]
+        if not task.cancelled():
+            # Mark any error retrieved; there may be no caller left to re-raise it
+            task.exception()
+
+    async def stream_read(self, query: Union[str, Query],
+                          parameters: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """
+        Execute read query and yield results one record at a time.
+
+        Records are decoded as the server sends them, so callers can process
+        large result sets without holding them all in memory. Use execute_read
+        for small or bounded queries; streamed results are neither cached nor
+        retried on transient errors.
+
+        Args:
+            query: Cypher query string or neo4j.Query
+            parameters: Query parameters
+
+        Yields:
+            Result records as dictionaries
+        """
+        async with self.session(access_mode=READ_ACCESS) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record.data()
+
+    @staticmethod
+    def _cache_key(query: Union[str, Query], parameters: Dict) -> Optional[Tuple]:
+        """
+        Build the read cache key for a query.
+
+        Args:
+            query: Cypher query string or neo4j.Query
+            parameters: Query parameters
+
+        Returns:
+            Hashable key, or None if the parameters can't be hashed
+        """
+        key = (query_id(_query_text(query)), tuple(sorted(parameters.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def invalidate_query_cache(self) -> None:
+        """Discard cached read results, including any reads still in flight."""
+        self._query_cache.clear()
+        # Reads started after this point mustn't join ones that predate it
+        self._inflight_reads.clear()
+        self._cache_version += 1
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Report read cache effectiveness.
+
+        Returns:
+            Dictionary with hits, misses (reads sent to Neo4j), coalesced
+            (reads that shared an in-flight read) and current size
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "coalesced": self._cache_coalesced,
+            "size": len(self._query_cache),
+        }
+
+    async def _execute_query(self, query: Union[str, Query], parameters: Dict,
+                             routing: RoutingControl) -> List[Dict]:
+        """
+        Run a query through the driver's managed execute_query API.
+
+        The driver routes the query to a reader or writer, retries transient
+        failures and fetches the result eagerly.
+
+        Args:
+            query: Cypher query string or neo4j.Query
+            parameters: Query parameters
+            routing: Whether to route to a reader or the writer
+
+        Returns:
+            List of result records as dictionaries
+        """
+        if not self.driver:
+            await self.connect()
+
+        logger.debug("Running Neo4j query", extra={
+            "qid": query_id(_query_text(query)),
+            "routing": routing.value
+        })
+
+        driver = self._driver_for(routing == RoutingControl.READ)
+        records, _, _ = await driver.execute_query(
+            query,
+            parameters,
+            database_=self.database,
+            routing_=routing
+        )
+        return [record.data() for record in records]
 
     async def execute_write(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
         """
@@ -131,10 +443,34 @@ class Neo4jConnection:
         """
         parameters = parameters or {}
 
-        async with self.session() as session:
-            result = await session.run(query, parameters)
-            records = await result.data()
-            return records
+        try:
+            return await self._execute_query(query, parameters, RoutingControl.WRITE)
+        finally:
+            self.invalidate_query_cache()
+
+    async def execute_autocommit(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Execute a write query in an auto-commit transaction and return results.
+
+        Needed for queries that manage their own transactions, such as
+        ``CALL { ... } IN TRANSACTIONS``, which can't run inside the managed
+        transaction used by execute_write. Not retried on transient errors.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of result records as dictionaries
+        """
+        parameters = parameters or {}
+
+        try:
+            async with self.session(access_mode=WRITE_ACCESS) as session:
+                result = await session.run(query, parameters)
+                return await result.data()
+        finally:
+            self.invalidate_query_cache()
 
     async def execute_write_transaction(self, transaction_function: Callable, *args, **kwargs) -> Any:
         """
@@ -148,8 +484,11 @@ class Neo4jConnection:
         Returns:
             Result from transaction function
         """
-        async with self.session() as session:
-            return await session.execute_write(transaction_function, *args, **kwargs)
+        try:
+            async with self.session(access_mode=WRITE_ACCESS) as session:
+                return await session.execute_write(transaction_function, *args, **kwargs)
+        finally:
+            self.invalidate_query_cache()
 
     async def execute_read_transaction(self, transaction_function: Callable, *args, **kwargs) -> Any:
         """
@@ -163,13 +502,56 @@ class Neo4jConnection:
         Returns:
             Result from transaction function
         """
-        async with self.session() as session:
+        async with self.session(access_mode=READ_ACCESS) as session:
             return await session.execute_read(transaction_function, *args, **kwargs)
 
+    async def warm_query_plans(self, queries: Iterable[Tuple[str, Dict]]) -> int:
+        """
+        Compile and cache execution plans for parameterized queries.
+
+        Each query is run with EXPLAIN, which plans it without touching the
+        store. Neo4j caches plans by query text, so later executions with any
+        parameter values skip planning.
+
+        Args:
+            queries: (query, sample parameters) pairs
+
+        Returns:
+            Number of queries planned successfully
+        """
+        planned = 0
+        async with self.session(access_mode=READ_ACCESS) as session:
+            for query, parameters in queries:
+                try:
+                    result = await session.run(f"EXPLAIN {query}", parameters)
+                    await result.consume()
+                    planned += 1
+                except Exception as e:
+                    logger.warning(f"Failed to warm query plan: {e}")
+        return planned
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform comprehensive health check.
 
+        Results are reused for HEALTH_CHECK_TTL seconds so frequent probes
+        don't each cost Neo4j round-trips.
+
+        Returns:
+            Dictionary with health status information
+        """
+        now = time.monotonic()
+        if self._health_cache is not None and now < self._health_cache[0]:
+            return dict(self._health_cache[1])
+
+        health = await self._run_health_check()
+        self._health_cache = (now + HEALTH_CHECK_TTL, health)
+        return dict(health)
+
+    async def _run_health_check(self) -> Dict[str, Any]:
+        """
+        Ping Neo4j and collect database statistics.
+
         Returns:
             Dictionary with health status information
         """
@@ -189,15 +571,7 @@ class Neo4jConnection:
 
             health["connected"] = True
 
-            # Get database statistics
-            stats_query = """
-            MATCH (n)
-            WITH count(n) as nodeCount
-            MATCH ()-[r]->()
-            RETURN nodeCount, count(r) as relCount
-            """
-
-            results = await self.execute_read(stats_query)
+            results = await self.execute_read(HEALTH_STATS_QUERY)
             if results:
                 health["node_count"] = results[0].get("nodeCount", 0)
                 health["relationship_count"] = results[0].get("relCount", 0)
@@ -209,21 +583,14 @@ class Neo4jConnection:
         return health
 
 
-# Global connection instance
-_connection: Optional[Neo4jConnection] = None
-
-
+@lru_cache(maxsize=1)
 def get_connection() -> Neo4jConnection:
     """Get or create the global connection instance."""
-    global _connection
-    if _connection is None:
-        _connection = Neo4jConnection()
-    return _connection
+    return Neo4jConnection()
 
 
 async def close_connection() -> None:
     """Close the global connection instance."""
-    global _connection
-    if _connection:
-        await _connection.close()
-        _connection = None
+    if get_connection.cache_info().currsize:
+        await get_connection().close()
+        get_connection.cache_clear()
@@ -5,118 +5,411 @@ Provides a high-level interface for creating, reading, updating, and deleting
 nodes and relationships in the Neo4j graph database.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import repeat
+import asyncio
 import logging
 import hashlib
-import json
 import re
 
+from .config import get_config
 from .connection import Neo4jConnection
 from .schema import (
     NodeLabels,
     RelationshipTypes,
     validate_node_label,
     validate_relationship_type,
-    ALLOWED_NODE_LABELS,
 )
 
 logger = logging.getLogger(__name__)
 
+# BLAKE3 is an optional, faster alternative to SHA-256 for content hashes
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Clauses that might indicate injection attempts, each with what has to follow
+# the keyword for it to count as a clause
+_DANGEROUS_CLAUSES = (
+    ("match", r'\s+\('),   # MATCH clause
+    ("create", r'\s+\('),  # CREATE clause
+    ("merge", r'\s+\('),   # MERGE clause
+    ("delete", r'\s+'),    # DELETE clause
+    ("set", r'\s+'),       # SET clause
+    ("remove", r'\s+'),    # REMOVE clause
+    ("drop", r'\s+'),      # DROP clause
+    ("detach", r'\s+'),    # DETACH clause
+    ("call", r'\s+'),      # CALL clause (procedures)
+    ("return", r'\s+'),    # RETURN clause
+    ("where", r'\s+'),     # WHERE clause
+    ("with", r'\s+'),      # WITH clause
+    ("union", r'\s+'),     # UNION clause
+)
+
+# One pattern per clause, searched only when its keyword occurs at all. A
+# single case-insensitive alternation tries every branch at every character,
+# which was over 10x slower on prose that merely mentions a keyword
+# ("settings", "called")
+_CLAUSE_PATTERNS = tuple(
+    (keyword, re.compile(keyword + follow, re.IGNORECASE)) for keyword, follow in _DANGEROUS_CLAUSES
+)
+
+# Every dangerous clause needs whitespace after its keyword, so
+# values without any (IDs, paths, names) can't match it
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Block (/* */) and line (--) comment markers
+_COMMENT_RE = re.compile(r'/\*|\*/|--')
+
+# Parameter value types that can't carry injected Cypher
+_SAFE_PARAM_TYPES = frozenset({int, float, bool, type(None)})
+
 
 def sanitize_cypher_params(params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Validate and sanitize Cypher query parameters to prevent injection attacks.
+    Validate Cypher query parameters to prevent injection attacks.
+
+    Values are only checked, never rewritten, so nothing is copied: the
+    parameters come back as the same dictionary that was passed in.
 
     Args:
         params: Dictionary of query parameters
 
     Returns:
-        Sanitized parameters
+        The validated parameters
 
     Raises:
         ValueError: If parameters contain suspicious patterns
     """
-    sanitized = {}
-
-    # Patterns that might indicate injection attempts
-    dangerous_patterns = [
-        r'MATCH\s+\(',  # MATCH clause
-        r'CREATE\s+\(', # CREATE clause
-        r'MERGE\s+\(',  # MERGE clause
-        r'DELETE\s+',   # DELETE clause
-        r'SET\s+',      # SET clause
-        r'REMOVE\s+',   # REMOVE clause
-        r'DROP\s+',     # DROP clause
-        r'DETACH\s+',   # DETACH clause
-        r'CALL\s+',     # CALL clause (procedures)
-        r'RETURN\s+',   # RETURN clause
-        r'WHERE\s+',    # WHERE clause
-        r'WITH\s+',     # WITH clause
-        r'UNION\s+',    # UNION clause
-    ]
-
-    for key, value in params.items():
-        if isinstance(value, str):
-            # Check for suspicious patterns in string values
-            for pattern in dangerous_patterns:
-                if re.search(pattern, value, re.IGNORECASE):
+    # Walk nested dictionaries and lists with an explicit stack rather than
+    # recursion, so deep payloads don't pay a Python call per level. Exact
+    # type checks are tried before isinstance, which only subclasses reach
+    pending = [params.items()]
+    while pending:
+        for key, value in pending.pop():
+            kind = type(value)
+            if kind in _SAFE_PARAM_TYPES:
+                # Numbers, booleans, None are safe
+                continue
+
+            if kind is str or isinstance(value, str):
+                _check_param_string(key, value)
+
+            elif kind is dict or isinstance(value, dict):
+                # Check nested dictionaries too
+                pending.append(value.items())
+
+            elif isinstance(value, (list, tuple)):
+                # Check list elements, reported under the list's key
+                pending.append(zip(repeat(key), value))
+
+    return params
+
+
+def _check_param_string(key: str, value: str) -> None:
+    """
+    Reject a string parameter value that looks like Cypher injection.
+
+    Args:
+        key: Parameter name, used in the error message
+        value: Parameter value to check
+
+    Raises:
+        ValueError: If the value contains a clause or comment pattern
+    """
+    # Most values have no whitespace or none of the clause keywords, which
+    # are both ruled out far faster than the clause patterns. Lowercasing
+    # only rules a keyword out exactly for ASCII text: IGNORECASE also
+    # matches non-ASCII letters such as "İ", "ı" and "ſ" against the
+    # keywords, so other text always goes through the patterns
+    if _WHITESPACE_RE.search(value):
+        lowered = value.lower() if value.isascii() else None
+        for keyword, pattern in _CLAUSE_PATTERNS:
+            if lowered is None or keyword in lowered:
+                match = pattern.search(value)
+                if match:
                     raise ValueError(
-                        f"Potentially dangerous pattern detected in parameter '{key}': {pattern}"
+                        f"Potentially dangerous pattern detected in parameter '{key}': "
+                        f"{match.group(0)!r}"
                     )
 
-            # Check for common injection techniques
-            if '/*' in value or '*/' in value:
-                raise ValueError(f"SQL-style comments not allowed in parameter '{key}'")
-
-            if '--' in value:
+    # Check for common injection techniques. Every comment marker contains
+    # "*" or "--", and those substring checks are much cheaper than the regex
+    if '*' in value or '--' in value:
+        match = _COMMENT_RE.search(value)
+        if match:
+            if match.group(0) == '--':
                 raise ValueError(f"Comment syntax not allowed in parameter '{key}'")
+            raise ValueError(f"SQL-style comments not allowed in parameter '{key}'")
 
-            sanitized[key] = value
-        elif isinstance(value, dict):
-            # Recursively sanitize nested dictionaries
-            sanitized[key] = sanitize_cypher_params(value)
-        else:
-            # Numbers, booleans, None are safe
-            sanitized[key] = value
 
-    return sanitized
+# Clauses that make a query a write; word boundaries keep property and
+# variable names such as "dataset" or "offset" from counting. A keyword that
+# starts a camelCase procedure name (db.index.vector.createNodeIndex,
+# apoc.refactor.mergeNodes) also counts
+_WRITE_KEYWORDS = "CREATE|MERGE|SET|DELETE|REMOVE|DROP|DETACH"
+_WRITE_RE = re.compile(
+    rf'\b(?:{_WRITE_KEYWORDS})\b|(?<=\.)(?:{_WRITE_KEYWORDS})(?=(?-i:[A-Z]))',
+    re.IGNORECASE
+)
 
 
-def validate_label(label: str) -> bool:
+# Generated query text repeats, so classification is memoized per string; sized
+# for the query templates a process uses, not for ad hoc queries
+@lru_cache(maxsize=512)
+def _is_write_query(cypher: str) -> bool:
+    """Classify a query as a write, so it can be routed to the writer."""
+    return _WRITE_RE.search(cypher) is not None
+
+
+# Unique identifier property for each node label that nodes can be created with
+NODE_ID_PROPERTIES = {
+    NodeLabels.ARCHITECTURE: "id",
+    NodeLabels.DESIGN: "id",
+    NodeLabels.REQUIREMENT: "rid",
+    NodeLabels.CODE_ARTIFACT: "path",
+    NodeLabels.DECISION: "id",
+    NodeLabels.AGENT_REQUEST: "id"
+}
+
+# Properties nodes can be looked up by. ID property names are written into
+# query text, so they're limited to this closed set: injection-safe, and the
+# (label x id property) query texts stay few and identical across calls, so
+# Neo4j's plan cache keeps hitting
+ID_PROPERTIES = frozenset(NODE_ID_PROPERTIES.values())
+
+
+def _validate_id_property(id_property: str) -> None:
+    """Reject an ID property name that isn't in ID_PROPERTIES."""
+    if id_property not in ID_PROPERTIES:
+        raise ValueError(
+            f"Invalid ID property: {id_property!r}. Allowed: {sorted(ID_PROPERTIES)}"
+        )
+
+
+# Labels whose nodes get created_at/modified_at timestamps automatically,
+# stamped by the server with Cypher datetime(), and a has_embedding flag
+TIMESTAMPED_LABELS = frozenset({NodeLabels.ARCHITECTURE, NodeLabels.DESIGN})
+
+# Rows written per transaction by the batch create methods
+WRITE_BATCH_SIZE = 10000
+
+# Defaults for the write coalescer: queued single writes are flushed once this
+# many have arrived, or this long after the first of them
+COALESCE_MAX_BATCH = 500
+COALESCE_MAX_DELAY_MS = 10
+
+# Query text builders for GraphOperations. Labels, relationship types and id
+# properties come from small fixed sets, so each distinct query is formatted
+# once and every call sends identical text, which keeps Neo4j's plan cache hits
+# reliable. Callers validate labels and types before building a query. The
+# APOC variants take the created node's label or relationship's type as a
+# parameter; matched endpoints keep literal labels so they can use indexes
+
+
+def _node_timestamps(var: str, prefix: str = ", ") -> str:
+    """Cypher that stamps a new node's created_at/modified_at server-side unless supplied."""
+    return (
+        f"{prefix}{var}.created_at = coalesce({var}.created_at, datetime()), "
+        f"{var}.modified_at = coalesce({var}.modified_at, datetime()), "
+        f"{_embedding_flag(var)}"
+    )
+
+
+def _embedding_flag(var: str) -> str:
+    """Cypher that sets a node's indexed has_embedding flag from its embedding."""
+    return f"{var}.has_embedding = {var}.embedding IS NOT NULL"
+
+
+@lru_cache(maxsize=256)
+def _create_node_query(label: str, id_property: str) -> str:
+    """Build the query that creates a node and returns its id."""
+    return f"""
+    CREATE (n:{label})
+    SET n = $properties{_node_timestamps("n") if label in TIMESTAMPED_LABELS else ""}
+    RETURN n.{id_property} as node_id
     """
-    Validate that a label is from the allowed set.
 
-    DEPRECATED: Use validate_node_label() from schema module instead.
 
-    Args:
-        label: Node label to validate
+@lru_cache(maxsize=256)
+def _create_nodes_query(label: str, id_property: str) -> str:
+    """Build the query that creates one node per row and returns their ids."""
+    return f"""
+    UNWIND $rows AS row
+    CREATE (n:{label})
+    SET n = row{_node_timestamps("n") if label in TIMESTAMPED_LABELS else ""}
+    RETURN n.{id_property} as node_id
+    """
 
-    Returns:
-        True if valid, False otherwise
+
+@lru_cache(maxsize=16)
+def _apoc_create_node_query(id_property: str, timestamped: bool) -> str:
+    """Build the APOC query that creates a node whose label is the $label parameter."""
+    stamp = _node_timestamps("node", "SET ") if timestamped else ""
+    return f"""
+    CALL apoc.create.node([$label], $properties) YIELD node
+    {stamp}
+    RETURN node.{id_property} as node_id
+    """
+
+
+@lru_cache(maxsize=256)
+def _get_node_query(label: str, id_property: str) -> str:
+    """Build the query that fetches a node by id."""
+    return f"""
+    MATCH (n:{label} {{{id_property}: $node_id}})
+    RETURN n
+    """
+
+
+@lru_cache(maxsize=256)
+def _update_node_query(label: str, id_property: str) -> str:
+    """Build the query that merges properties into a node by id."""
+    return f"""
+    MATCH (n:{label} {{{id_property}: $node_id}})
+    SET n += $properties{", n.modified_at = datetime()" if label in TIMESTAMPED_LABELS else ""}
+    RETURN n.{id_property} as node_id
+    """
+
+
+@lru_cache(maxsize=256)
+def _delete_node_query(label: str, id_property: str, detach: bool) -> str:
+    """Build the query that deletes a node by id, optionally with its relationships."""
+    detach_clause = "DETACH" if detach else ""
+    return f"""
+    MATCH (n:{label} {{{id_property}: $node_id}})
+    {detach_clause} DELETE n
+    RETURN count(n) as deleted_count
+    """
+
+
+@lru_cache(maxsize=256)
+def _create_relationship_query(from_label: str, from_id_prop: str, rel_type: str,
+                               to_label: str, to_id_prop: str) -> str:
+    """Build the query that creates a relationship between two nodes by id."""
+    return f"""
+    MATCH (from:{from_label} {{{from_id_prop}: $from_id}})
+    MATCH (to:{to_label} {{{to_id_prop}: $to_id}})
+    CREATE (from)-[r:{rel_type}]->(to)
+    SET r = $properties, r.created_at = datetime()
+    RETURN id(r) as rel_id
     """
-    return label in ALLOWED_NODE_LABELS
+
+
+@lru_cache(maxsize=256)
+def _apoc_create_relationship_query(from_label: str, from_id_prop: str,
+                                    to_label: str, to_id_prop: str) -> str:
+    """Build the APOC query that creates a relationship whose type is the $rel_type parameter."""
+    return f"""
+    MATCH (from:{from_label} {{{from_id_prop}: $from_id}})
+    MATCH (to:{to_label} {{{to_id_prop}: $to_id}})
+    CALL apoc.create.relationship(from, $rel_type, $properties, to) YIELD rel
+    SET rel.created_at = datetime()
+    RETURN id(rel) as rel_id
+    """
+
+
+@lru_cache(maxsize=256)
+def _create_relationships_query(from_label: str, from_id_prop: str, rel_type: str,
+                                to_label: str, to_id_prop: str) -> str:
+    """Build the query that creates one relationship per row and counts them."""
+    return f"""
+    UNWIND $rows AS row
+    MATCH (from:{from_label} {{{from_id_prop}: row.from_id}})
+    MATCH (to:{to_label} {{{to_id_prop}: row.to_id}})
+    CREATE (from)-[r:{rel_type}]->(to)
+    SET r = row.properties, r.created_at = datetime()
+    RETURN count(r) as created
+    """
+
+
+@lru_cache(maxsize=256)
+def _create_indexed_relationships_query(from_label: str, from_id_prop: str, rel_type: str,
+                                        to_label: str, to_id_prop: str) -> str:
+    """Build the query that creates one relationship per row and returns the rows' indexes."""
+    return f"""
+    UNWIND $rows AS row
+    MATCH (from:{from_label} {{{from_id_prop}: row.from_id}})
+    MATCH (to:{to_label} {{{to_id_prop}: row.to_id}})
+    CREATE (from)-[r:{rel_type}]->(to)
+    SET r = row.properties, r.created_at = datetime()
+    RETURN row.i as i
+    """
+
+
+@lru_cache(maxsize=64)
+def _count_nodes_query(label: Optional[str]) -> str:
+    """Build the query that counts nodes, optionally of one label."""
+    if label:
+        return f"MATCH (n:{label}) RETURN count(n) as count"
+    return "MATCH (n) RETURN count(n) as count"
+
+
+@lru_cache(maxsize=64)
+def _count_relationships_query(rel_type: Optional[str]) -> str:
+    """Build the query that counts relationships, optionally of one type."""
+    if rel_type:
+        return f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
+    return "MATCH ()-[r]->() RETURN count(r) as count"
 
 
 class GraphOperations:
     """High-level graph database operations."""
 
-    def __init__(self, connection: Neo4jConnection):
+    def __init__(self, connection: Neo4jConnection, use_apoc: Optional[bool] = None):
         """
         Initialize graph operations.
 
         Args:
             connection: Neo4j connection instance
+            use_apoc: Create nodes and relationships through APOC procedures so
+                labels and relationship types are query parameters, giving one
+                cached plan for all labels (defaults to config)
         """
         self.conn = connection
+        self.use_apoc = get_config().use_apoc if use_apoc is None else use_apoc
+        self._coalescer: Optional[WriteCoalescer] = None
 
-    async def create_node(self, label: str, properties: Dict[str, Any]) -> str:
+    def start_write_coalescer(self, max_batch: int = COALESCE_MAX_BATCH,
+                              max_delay_ms: float = COALESCE_MAX_DELAY_MS) -> "WriteCoalescer":
+        """
+        Start merging batched single writes into UNWIND queries.
+
+        While it runs, create_node and create_relationship calls made with
+        batched=True are queued and written together by a background task, so
+        concurrent callers share round-trips instead of paying one each.
+
+        Args:
+            max_batch: Queued writes that trigger a flush
+            max_delay_ms: Longest a queued write waits for others to join it
+
+        Returns:
+            The running coalescer (the existing one if already started)
+        """
+        if self._coalescer is None:
+            self._coalescer = WriteCoalescer(self.conn, max_batch, max_delay_ms)
+            self._coalescer.start()
+        return self._coalescer
+
+    async def stop_write_coalescer(self) -> None:
+        """Write everything still queued and stop the write coalescer."""
+        if self._coalescer is not None:
+            coalescer, self._coalescer = self._coalescer, None
+            await coalescer.stop()
+
+    async def create_node(self, label: str, properties: Dict[str, Any],
+                          batched: bool = False) -> str:
         """
         Create a new node with the given label and properties.
 
         Args:
             label: Node label (e.g., "Architecture", "Design")
             properties: Dictionary of node properties
+            batched: Queue the write on the write coalescer, if it is running,
+                to be sent in one UNWIND query with other nodes of this label
 
         Returns:
             Node ID (value of 'id', 'rid', or 'path' property depending on node type)
@@ -124,55 +417,68 @@ class GraphOperations:
         Raises:
             ValueError: If node already exists or required properties missing
         """
-        # Validate label (prevents Cypher injection)
-        validate_node_label(label)
+        if batched and self._coalescer is not None:
+            id_prop = self._validate_node(label, properties)
+            node_id = await self._coalescer.submit(("node", label, id_prop), properties)
+            logger.info(f"Created {label} node: {node_id}")
+            return node_id
 
-        # Sanitize properties
-        properties = sanitize_cypher_params(properties)
+        query, params = self._create_node_statement(label, properties)
 
-        # Determine the unique identifier property based on label
-        id_props = {
-            NodeLabels.ARCHITECTURE: "id",
-            NodeLabels.DESIGN: "id",
-            NodeLabels.REQUIREMENT: "rid",
-            NodeLabels.CODE_ARTIFACT: "path",
-            NodeLabels.DECISION: "id",
-            NodeLabels.AGENT_REQUEST: "id"
-        }
-
-        id_prop = id_props.get(label)
-        if not id_prop:
-            raise ValueError(f"Unknown node label: {label}")
+        try:
+            result = await self.conn.execute_write(query, params)
+            if result:
+                node_id = result[0]["node_id"]
+                logger.info(f"Created {label} node: {node_id}")
+                return node_id
+            else:
+                raise RuntimeError(f"Failed to create {label} node")
 
-        if id_prop not in properties:
-            raise ValueError(f"Missing required property '{id_prop}' for {label} node")
+        except Exception as e:
+            logger.error(f"Failed to create {label} node: {e}")
+            raise
 
-        node_id = properties[id_prop]
+    async def create_nodes(self, label: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create many nodes with the same label in batched queries.
 
-        # Add timestamps if not present
-        if "created_at" not in properties and label in [NodeLabels.ARCHITECTURE, NodeLabels.DESIGN]:
-            properties["created_at"] = datetime.utcnow().isoformat()
+        Each batch of up to WRITE_BATCH_SIZE rows is written with a single
+        UNWIND query, so the number of round-trips doesn't grow with the
+        number of nodes.
 
-        if "modified_at" not in properties and label in [NodeLabels.ARCHITECTURE, NodeLabels.DESIGN]:
-            properties["modified_at"] = datetime.utcnow().isoformat()
+        Args:
+            label: Node label (e.g., "Architecture", "Design")
+            rows: Property dictionaries, one per node
 
-        # Create node query
-        query = f"""
-        CREATE (n:{label})
-        SET n = $properties
-        RETURN n.{id_prop} as node_id
+        Returns:
+            Node IDs of the created nodes, in row order
+
+        Raises:
+            ValueError: If the label is unknown or a row is missing its ID property
         """
+        id_prop = self._validate_node(label, None)
+
+        for properties in rows:
+            sanitize_cypher_params(properties)
+
+            if id_prop not in properties:
+                raise ValueError(f"Missing required property '{id_prop}' for {label} node")
+
+        prepared = list(rows)
+        query = _create_nodes_query(label, id_prop)
+        node_ids = []
 
         try:
-            result = await self.conn.execute_write(query, {"properties": properties})
-            if result:
-                logger.info(f"Created {label} node: {node_id}")
-                return result[0]["node_id"]
-            else:
-                raise RuntimeError(f"Failed to create {label} node")
+            for start in range(0, len(prepared), WRITE_BATCH_SIZE):
+                batch = prepared[start:start + WRITE_BATCH_SIZE]
+                result = await self.conn.execute_write(query, {"rows": batch})
+                node_ids.extend(r["node_id"] for r in result)
+
+            logger.info(f"Created {len(node_ids)} {label} nodes")
+            return node_ids
 
         except Exception as e:
-            logger.error(f"Failed to create {label} node: {e}")
+            logger.error(f"Failed to create {label} nodes: {e}")
             raise
 
     async def get_node(self, label: str, node_id: str, id_property: str = "id") -> Optional[Dict[str, Any]]:
@@ -187,13 +493,11 @@ class GraphOperations:
         Returns:
             Dictionary of node properties, or None if not found
         """
-        # Validate label (prevents Cypher injection)
+        # Validate label and ID property (prevents Cypher injection)
         validate_node_label(label)
+        _validate_id_property(id_property)
 
-        query = f"""
-        MATCH (n:{label} {{{id_property}: $node_id}})
-        RETURN n
-        """
+        query = _get_node_query(label, id_property)
 
         try:
             result = await self.conn.execute_read(query, {"node_id": node_id})
@@ -220,18 +524,11 @@ class GraphOperations:
         Returns:
             True if updated successfully, False if node not found
         """
-        # Validate label (prevents Cypher injection)
+        # Validate label and ID property (prevents Cypher injection)
         validate_node_label(label)
+        _validate_id_property(id_property)
 
-        # Update modified_at timestamp
-        if label in [NodeLabels.ARCHITECTURE, NodeLabels.DESIGN]:
-            properties["modified_at"] = datetime.utcnow().isoformat()
-
-        query = f"""
-        MATCH (n:{label} {{{id_property}: $node_id}})
-        SET n += $properties
-        RETURN n.{id_property} as node_id
-        """
+        query = _update_node_query(label, id_property)
 
         try:
             result = await self.conn.execute_write(query, {
@@ -266,16 +563,11 @@ class GraphOperations:
             In production, consider marking nodes as deprecated instead of deleting
             to maintain immutable audit trail.
         """
-        # Validate label (prevents Cypher injection)
+        # Validate label and ID property (prevents Cypher injection)
         validate_node_label(label)
+        _validate_id_property(id_property)
 
-        detach_clause = "DETACH" if detach else ""
-
-        query = f"""
-        MATCH (n:{label} {{{id_property}: $node_id}})
-        {detach_clause} DELETE n
-        RETURN count(n) as deleted_count
-        """
+        query = _delete_node_query(label, id_property, detach)
 
         try:
             result = await self.conn.execute_write(query, {"node_id": node_id})
@@ -292,7 +584,8 @@ class GraphOperations:
     async def create_relationship(self, from_label: str, from_id: str, rel_type: str,
                                  to_label: str, to_id: str,
                                  properties: Optional[Dict[str, Any]] = None,
-                                 from_id_prop: str = "id", to_id_prop: str = "id") -> bool:
+                                 from_id_prop: str = "id", to_id_prop: str = "id",
+                                 batched: bool = False) -> bool:
         """
         Create a relationship between two nodes.
 
@@ -305,6 +598,8 @@ class GraphOperations:
             properties: Optional relationship properties
             from_id_prop: Source node ID property name (default: "id")
             to_id_prop: Target node ID property name (default: "id")
+            batched: Queue the write on the write coalescer, if it is running,
+                to be sent in one UNWIND query with others of the same shape
 
         Returns:
             True if relationship created successfully
@@ -312,33 +607,24 @@ class GraphOperations:
         Raises:
             ValueError: If either node doesn't exist
         """
-        # Validate labels and relationship type (raises ValueError if invalid)
-        validate_node_label(from_label)
-        validate_node_label(to_label)
-        validate_relationship_type(rel_type)
-
-        properties = properties or {}
-
-        # Sanitize properties
-        properties = sanitize_cypher_params(properties)
-
-        # Add timestamp to relationship
-        properties["created_at"] = datetime.utcnow().isoformat()
-
-        query = f"""
-        MATCH (from:{from_label} {{{from_id_prop}: $from_id}})
-        MATCH (to:{to_label} {{{to_id_prop}: $to_id}})
-        CREATE (from)-[r:{rel_type}]->(to)
-        SET r = $properties
-        RETURN id(r) as rel_id
-        """
+        if batched and self._coalescer is not None:
+            properties = self._validate_relationship(
+                from_label, rel_type, to_label, properties, from_id_prop, to_id_prop
+            )
+            key = ("relationship", from_label, from_id_prop, rel_type, to_label, to_id_prop)
+            await self._coalescer.submit(
+                key, {"from_id": from_id, "to_id": to_id, "properties": properties}
+            )
+            logger.info(f"Created {rel_type} relationship: {from_id} -> {to_id}")
+            return True
+
+        query, params = self._create_relationship_statement(
+            from_label, from_id, rel_type, to_label, to_id,
+            properties, from_id_prop, to_id_prop
+        )
 
         try:
-            result = await self.conn.execute_write(query, {
-                "from_id": from_id,
-                "to_id": to_id,
-                "properties": properties
-            })
+            result = await self.conn.execute_write(query, params)
 
             if result:
                 logger.info(f"Created {rel_type} relationship: {from_id} -> {to_id}")
@@ -350,6 +636,202 @@ class GraphOperations:
             logger.error(f"Failed to create relationship: {e}")
             raise
 
+    async def create_relationships(self, from_label: str, rel_type: str, to_label: str,
+                                   rows: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+                                   from_id_prop: str = "id", to_id_prop: str = "id") -> int:
+        """
+        Create many relationships of one type in batched queries.
+
+        Each batch of up to WRITE_BATCH_SIZE rows is written with a single
+        UNWIND query. Rows whose source or target node doesn't exist are
+        skipped.
+
+        Args:
+            from_label: Source node label
+            rel_type: Relationship type (e.g., "IMPLEMENTS", "DEFINES")
+            to_label: Target node label
+            rows: (from_id, to_id, properties) triples; properties may be None
+            from_id_prop: Source node ID property name (default: "id")
+            to_id_prop: Target node ID property name (default: "id")
+
+        Returns:
+            Number of relationships created
+        """
+        # Validate labels, relationship type and ID properties (raises ValueError if invalid)
+        self._validate_relationship(from_label, rel_type, to_label, None, from_id_prop, to_id_prop)
+
+        prepared = []
+        for from_id, to_id, properties in rows:
+            properties = sanitize_cypher_params(properties or {})
+            prepared.append({"from_id": from_id, "to_id": to_id, "properties": properties})
+
+        query = _create_relationships_query(
+            from_label, from_id_prop, rel_type, to_label, to_id_prop
+        )
+        created = 0
+
+        try:
+            for start in range(0, len(prepared), WRITE_BATCH_SIZE):
+                batch = prepared[start:start + WRITE_BATCH_SIZE]
+                result = await self.conn.execute_write(query, {"rows": batch})
+                created += result[0]["created"] if result else 0
+
+            logger.info(f"Created {created} {rel_type} relationships")
+            return created
+
+        except Exception as e:
+            logger.error(f"Failed to create {rel_type} relationships: {e}")
+            raise
+
+    def _validate_node(self, label: str, properties: Optional[Dict[str, Any]]) -> str:
+        """
+        Validate a node about to be created.
+
+        Args:
+            label: Node label
+            properties: Dictionary of node properties, or None to check only the label
+
+        Returns:
+            Name of the label's unique identifier property
+
+        Raises:
+            ValueError: If the label is unknown or the ID property is missing
+        """
+        # Validate label (prevents Cypher injection)
+        validate_node_label(label)
+
+        # Determine the unique identifier property based on label
+        id_prop = NODE_ID_PROPERTIES.get(label)
+        if not id_prop:
+            raise ValueError(f"Unknown node label: {label}")
+
+        if properties is not None:
+            # Sanitize properties
+            sanitize_cypher_params(properties)
+
+            if id_prop not in properties:
+                raise ValueError(f"Missing required property '{id_prop}' for {label} node")
+
+        return id_prop
+
+    def _validate_relationship(self, from_label: str, rel_type: str, to_label: str,
+                               properties: Optional[Dict[str, Any]],
+                               from_id_prop: str, to_id_prop: str) -> Dict[str, Any]:
+        """
+        Validate a relationship about to be created.
+
+        Args:
+            from_label: Source node label
+            rel_type: Relationship type
+            to_label: Target node label
+            properties: Optional relationship properties
+            from_id_prop: Source node ID property name
+            to_id_prop: Target node ID property name
+
+        Returns:
+            The sanitized properties ({} if none were given)
+        """
+        # Validate labels, relationship type and ID properties (raises ValueError if invalid)
+        validate_node_label(from_label)
+        validate_node_label(to_label)
+        validate_relationship_type(rel_type)
+        _validate_id_property(from_id_prop)
+        _validate_id_property(to_id_prop)
+
+        # Sanitize properties
+        return sanitize_cypher_params(properties or {})
+
+    def _create_node_statement(self, label: str,
+                               properties: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Validate a node and build the query and parameters that create it.
+
+        Args:
+            label: Node label
+            properties: Dictionary of node properties
+
+        Returns:
+            (query, parameters) tuple
+
+        Raises:
+            ValueError: If the label is unknown or the ID property is missing
+        """
+        id_prop = self._validate_node(label, properties)
+
+        if self.use_apoc:
+            query = _apoc_create_node_query(id_prop, label in TIMESTAMPED_LABELS)
+            params = {"label": label, "properties": properties}
+        else:
+            query = _create_node_query(label, id_prop)
+            params = {"properties": properties}
+
+        return query, params
+
+    def _create_relationship_statement(self, from_label: str, from_id: str, rel_type: str,
+                                       to_label: str, to_id: str,
+                                       properties: Optional[Dict[str, Any]],
+                                       from_id_prop: str,
+                                       to_id_prop: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Validate a relationship and build the query and parameters that create it.
+
+        Args:
+            from_label: Source node label
+            from_id: Source node ID
+            rel_type: Relationship type
+            to_label: Target node label
+            to_id: Target node ID
+            properties: Optional relationship properties
+            from_id_prop: Source node ID property name
+            to_id_prop: Target node ID property name
+
+        Returns:
+            (query, parameters) tuple
+        """
+        properties = self._validate_relationship(
+            from_label, rel_type, to_label, properties, from_id_prop, to_id_prop
+        )
+
+        params = {"from_id": from_id, "to_id": to_id, "properties": properties}
+        if self.use_apoc:
+            query = _apoc_create_relationship_query(from_label, from_id_prop, to_label, to_id_prop)
+            params["rel_type"] = rel_type
+        else:
+            query = _create_relationship_query(
+                from_label, from_id_prop, rel_type, to_label, to_id_prop
+            )
+
+        return query, params
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator["WritePipeline"]:
+        """
+        Collect writes and run them together in one transaction.
+
+        Statements queued on the yielded pipeline are sent when the block
+        exits, all in a single managed write transaction on one session,
+        instead of one transaction and round-trip setup per call. Nothing is
+        written if the block raises.
+
+        Example:
+            async with graph_ops.pipeline() as batch:
+                batch.create_node("Design", {"id": "design-001"})
+                batch.create_relationship("Design", "design-001", "IMPLEMENTS",
+                                          "Architecture", "arch-001")
+
+        Yields:
+            WritePipeline to queue statements on; its results are filled in
+            after the block exits
+        """
+        batch = WritePipeline(self)
+        yield batch
+
+        if batch.statements:
+            batch.results = await self.conn.execute_write_transaction(
+                _run_statements, batch.statements
+            )
+            logger.info(f"Ran {len(batch.statements)} pipelined write statements")
+
     async def query(self, cypher: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict]:
         """
         Execute a custom Cypher query.
@@ -364,11 +846,7 @@ class GraphOperations:
         parameters = parameters or {}
 
         try:
-            # Determine if it's a read or write query
-            is_write = any(keyword in cypher.upper() for keyword in
-                          ["CREATE", "MERGE", "SET", "DELETE", "REMOVE"])
-
-            if is_write:
+            if _is_write_query(cypher):
                 result = await self.conn.execute_write(cypher, parameters)
             else:
                 result = await self.conn.execute_read(cypher, parameters)
@@ -396,16 +874,7 @@ class GraphOperations:
         set_properties = set_properties or {}
 
         # Determine ID property
-        id_props = {
-            NodeLabels.ARCHITECTURE: "id",
-            NodeLabels.DESIGN: "id",
-            NodeLabels.REQUIREMENT: "rid",
-            NodeLabels.CODE_ARTIFACT: "path",
-            NodeLabels.DECISION: "id",
-            NodeLabels.AGENT_REQUEST: "id"
-        }
-
-        id_prop = id_props.get(label, "id")
+        id_prop = NODE_ID_PROPERTIES.get(label, "id")
 
         # Build match clause
         match_parts = [f"{k}: ${k}" for k in match_properties.keys()]
@@ -413,12 +882,12 @@ class GraphOperations:
 
         # Combine parameters
         all_params = {**match_properties, **set_properties}
-        set_properties["modified_at"] = datetime.utcnow().isoformat()
-
+        flag = f", {_embedding_flag('n')}" if label in TIMESTAMPED_LABELS else ""
         query = f"""
         MERGE (n:{label} {{{match_clause}}})
         ON CREATE SET n += $set_properties, n.created_at = datetime()
         ON MATCH SET n += $set_properties
+        SET n.modified_at = datetime(){flag}
         RETURN n.{id_prop} as node_id
         """
 
@@ -449,12 +918,7 @@ class GraphOperations:
         Returns:
             Number of nodes
         """
-        if label:
-            query = f"MATCH (n:{label}) RETURN count(n) as count"
-        else:
-            query = "MATCH (n) RETURN count(n) as count"
-
-        result = await self.conn.execute_read(query)
+        result = await self.conn.execute_read(_count_nodes_query(label))
         return result[0]["count"] if result else 0
 
     async def count_relationships(self, rel_type: Optional[str] = None) -> int:
@@ -467,22 +931,217 @@ class GraphOperations:
         Returns:
             Number of relationships
         """
-        if rel_type:
-            query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-        else:
-            query = "MATCH ()-[r]->() RETURN count(r) as count"
-
-        result = await self.conn.execute_read(query)
+        result = await self.conn.execute_read(_count_relationships_query(rel_type))
         return result[0]["count"] if result else 0
 
-    def compute_content_hash(self, content: str) -> str:
+    def compute_content_hash(self, content: Union[str, bytes], algorithm: str = "sha256") -> str:
         """
-        Compute SHA-256 hash of content for change detection.
+        Compute a hash of content for change detection.
 
         Args:
-            content: Content to hash
+            content: Content to hash; bytes are hashed as-is without a copy
+            algorithm: Any hashlib algorithm name, or "blake3" if the blake3
+                package is installed (default: "sha256")
 
         Returns:
             Hexadecimal hash string
+
+        Raises:
+            ValueError: If the algorithm is unknown or blake3 isn't installed
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+
+        if algorithm == "blake3":
+            if blake3 is None:
+                raise ValueError("blake3 hashing requested but the blake3 package is not installed")
+            return blake3.blake3(data).hexdigest()
+
+        return hashlib.new(algorithm, data).hexdigest()
+
+
+async def _run_statements(tx, statements: List[Tuple[str, Dict[str, Any]]]) -> List[List[Dict]]:
+    """Transaction function running queued statements in order."""
+    results = []
+    for query, parameters in statements:
+        result = await tx.run(query, parameters)
+        results.append(await result.data())
+    return results
+
+
+class WritePipeline:
+    """Write statements queued by GraphOperations.pipeline()."""
+
+    def __init__(self, graph_ops: GraphOperations):
+        """
+        Initialize an empty pipeline.
+
+        Args:
+            graph_ops: Graph operations used to validate and build statements
+        """
+        self._graph_ops = graph_ops
+        self.statements: List[Tuple[str, Dict[str, Any]]] = []
+        self.results: List[List[Dict]] = []
+
+    def add(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Queue a raw write query.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        """
+        self.statements.append((query, parameters or {}))
+
+    def create_node(self, label: str, properties: Dict[str, Any]) -> None:
+        """
+        Queue a node creation; same validation as GraphOperations.create_node.
+
+        Args:
+            label: Node label
+            properties: Dictionary of node properties
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        self.statements.append(self._graph_ops._create_node_statement(label, properties))
+
+    def create_relationship(self, from_label: str, from_id: str, rel_type: str,
+                            to_label: str, to_id: str,
+                            properties: Optional[Dict[str, Any]] = None,
+                            from_id_prop: str = "id", to_id_prop: str = "id") -> None:
+        """
+        Queue a relationship creation; same validation as GraphOperations.create_relationship.
+
+        Args:
+            from_label: Source node label
+            from_id: Source node ID
+            rel_type: Relationship type
+            to_label: Target node label
+            to_id: Target node ID
+            properties: Optional relationship properties
+            from_id_prop: Source node ID property name (default: "id")
+            to_id_prop: Target node ID property name (default: "id")
+        """
+        self.statements.append(self._graph_ops._create_relationship_statement(
+            from_label, from_id, rel_type, to_label, to_id,
+            properties, from_id_prop, to_id_prop
+        ))
+
+
+class WriteCoalescer:
+    """Background task that merges queued single writes into UNWIND batches."""
+
+    def __init__(self, connection: Neo4jConnection, max_batch: int, max_delay_ms: float):
+        """
+        Initialize the coalescer; call start() to begin draining the queue.
+
+        Args:
+            connection: Neo4j connection batches are written through
+            max_batch: Queued writes that trigger a flush
+            max_delay_ms: Longest a queued write waits for others to join it
+        """
+        self.conn = connection
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background task that drains the queue."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything queued so far, then stop the background task."""
+        if self._task is not None:
+            # None marks the end of the queue
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+    def submit(self, key: Tuple, row: Dict[str, Any]) -> "asyncio.Future":
+        """
+        Queue one write.
+
+        Args:
+            key: ("node", label, id_property) or ("relationship", from_label,
+                from_id_prop, rel_type, to_label, to_id_prop); writes with the
+                same key share a query
+            row: Node properties, or the relationship's from_id, to_id and properties
+
+        Returns:
+            Future resolved with the node ID, or True for a relationship
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((key, row, future))
+        return future
+
+    async def _run(self) -> None:
+        """Collect queued writes into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            # Wait up to max_delay after the first write for others to join it
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[Tuple, Dict[str, Any], "asyncio.Future"]]) -> None:
+        """
+        Write a batch with one query per key and resolve each write's future.
+
+        Nodes are written before relationships, so a relationship can connect
+        nodes queued in the same batch.
+
+        Args:
+            batch: (key, row, future) entries taken from the queue
+        """
+        groups: Dict[Tuple, List[Tuple[Dict[str, Any], "asyncio.Future"]]] = {}
+        for key, row, future in batch:
+            groups.setdefault(key, []).append((row, future))
+
+        for key, entries in sorted(groups.items(), key=lambda group: group[0][0] != "node"):
+            kind, *shape = key
+            try:
+                if kind == "node":
+                    rows = [row for row, _ in entries]
+                    result = await self.conn.execute_write(
+                        _create_nodes_query(*shape), {"rows": rows}
+                    )
+                    outcomes = [r["node_id"] for r in result]
+                else:
+                    rows = [{**row, "i": i} for i, (row, _) in enumerate(entries)]
+                    result = await self.conn.execute_write(
+                        _create_indexed_relationships_query(*shape), {"rows": rows}
+                    )
+                    created = {r["i"] for r in result}
+                    outcomes = [
+                        True if i in created
+                        else ValueError("Failed to create relationship: nodes may not exist")
+                        for i in range(len(entries))
+                    ]
+            except Exception as e:
+                logger.error(f"Failed to write coalesced {kind} batch: {e}")
+                outcomes = [e] * len(entries)
+
+            for (_, future), outcome in zip(entries, outcomes):
+                # Callers may have been cancelled while waiting
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+            logger.debug(f"Flushed {len(entries)} coalesced {kind} writes")
@@ -5,86 +5,143 @@ Contains all the critical queries from the architecture specification for
 detecting drift, validating compliance, and maintaining graph integrity.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Any, Union
+from functools import lru_cache
+import asyncio
 import logging
 
+from neo4j import Query
+from neo4j.time import Duration
+
 from .connection import Neo4jConnection
 
 logger = logging.getLogger(__name__)
 
+# Seconds governance query results are cached by the connection. They only
+# change as documents are ingested, while health checks and dashboards re-run
+# them constantly
+GOVERNANCE_CACHE_TTL = 30.0
+
+# Agent requests arrive continuously, so recent ones are cached only briefly
+RECENT_REQUESTS_CACHE_TTL = 5.0
+
+# Server-side time limit for governance queries, in seconds. Streaming exports
+# are sent without it (see _without_timeout)
+GOVERNANCE_QUERY_TIMEOUT = 30.0
+
+
+def _named_query(name: str, text: str) -> Query:
+    """
+    Wrap a query constant once, at import, with its name and time limit.
+
+    The name is sent as transaction metadata, so the query can be picked out
+    in SHOW TRANSACTIONS and the query log.
 
-# Query constants from architecture specification (lines 469-501)
+    Args:
+        name: Query name reported to the server
+        text: Cypher query text
 
-FIND_UNCOVERED_REQUIREMENTS = """
-MATCH (a:Architecture)-[:DEFINES]->(req:Requirement)
+    Returns:
+        Query to pass to the connection's read methods
+    """
+    return Query(text, metadata={"query_name": name}, timeout=GOVERNANCE_QUERY_TIMEOUT)
+
+
+def _without_timeout(query: Query) -> Query:
+    """Copy a named query without its time limit, for unbounded streaming exports."""
+    return Query(query.text, metadata=query.metadata)
+
+
+# Query constants from architecture specification (lines 469-501). Variable
+# values such as look-back windows are parameters, so each query's text is
+# fixed and Neo4j plans it once
+
+# Status is matched inline, so the planner can seek the (status, priority)
+# index and the anti-join only runs for active requirements
+FIND_UNCOVERED_REQUIREMENTS = _named_query("find_uncovered_requirements", """
+MATCH (a:Architecture)-[:DEFINES]->(req:Requirement {status: 'active'})
 WHERE NOT exists((req)<-[:SATISFIES]-(:Design))
-  AND req.status = 'active'
 RETURN req.rid, req.text, req.priority, a.id as source
 ORDER BY req.priority DESC
-"""
+""")
 
-DETECT_DESIGN_DRIFT = """
+DETECT_DESIGN_DRIFT = _named_query("detect_design_drift", """
 MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture)
 WHERE d.version > a.version
   AND NOT exists((:Decision)-[:SUPERSEDES]->(d))
 RETURN d.id, d.version, a.id, a.version,
        d.last_reviewed as last_design_update
-"""
+""")
 
-FIND_UNDOCUMENTED_CODE = """
+FIND_UNDOCUMENTED_CODE = _named_query("find_undocumented_code", """
 MATCH (c:CodeArtifact)
 WHERE NOT exists((c)-[:IMPLEMENTS]->(:Design|:Requirement))
-  AND c.last_modified > datetime() - duration('P7D')
+  AND c.last_modified > datetime() - duration({days: $days})
 RETURN c.path, c.lang, c.last_modified
 ORDER BY c.last_modified DESC
-"""
+""")
 
-CHECK_AGENT_COMPLIANCE_RATE = """
+CHECK_AGENT_COMPLIANCE_RATE = _named_query("check_agent_compliance_rate", """
 MATCH (r:AgentRequest)
-WHERE r.timestamp > datetime() - duration('P30D')
+WHERE r.timestamp > datetime() - duration({days: $days})
 WITH r.agent_id as agent,
      count(CASE WHEN r.status = 'approved' THEN 1 END) as approved,
      count(*) as total
 RETURN agent,
        toFloat(approved) / total * 100 as compliance_rate
 ORDER BY compliance_rate DESC
-"""
+""")
 
 # Additional governance queries
 
-FIND_ORPHANED_REQUIREMENTS = """
+FIND_ORPHANED_REQUIREMENTS = _named_query("find_orphaned_requirements", """
 MATCH (r:Requirement)
 WHERE NOT exists((:Architecture)-[:DEFINES]->(r))
 RETURN r.rid, r.text, r.status
-"""
+""")
 
-FIND_CIRCULAR_DEPENDENCIES = """
-MATCH p=(n)-[:SUPERSEDES*]->(n)
-RETURN n.id as node_id, length(p) as cycle_length
-"""
+# Longest SUPERSEDES cycle looked for. Variable-length bounds can't be query
+# parameters, so this is part of the query text; it keeps the traversal from
+# growing without limit on large version chains
+CIRCULAR_DEPENDENCY_MAX_DEPTH = 10
 
-FIND_MISSING_EMBEDDINGS = """
-MATCH (n:Architecture|Design)
-WHERE n.embedding IS NULL
-RETURN labels(n)[0] as node_type, n.id as node_id, n.title
-"""
+# Default number of circular dependencies reported
+CIRCULAR_DEPENDENCY_LIMIT = 100
 
-GET_DOCUMENT_HIERARCHY = """
+# Starts only from labeled versioned documents, so the planner scans those
+# labels instead of every node in the graph
+FIND_CIRCULAR_DEPENDENCIES = _named_query("find_circular_dependencies", f"""
+MATCH p=(n:Architecture|Design|Requirement|Decision)-[:SUPERSEDES*1..{CIRCULAR_DEPENDENCY_MAX_DEPTH}]->(n)
+RETURN n.id as node_id, length(p) as cycle_length
+LIMIT $limit
+""")
+
+# One branch per label so each is a seek on its has_embedding index rather
+# than a scan of both labels filtered on IS NULL
+FIND_MISSING_EMBEDDINGS = _named_query("find_missing_embeddings", """
+MATCH (a:Architecture) WHERE a.has_embedding = false
+RETURN 'Architecture' as node_type, a.id as node_id, a.title as title
+UNION ALL
+MATCH (d:Design) WHERE d.has_embedding = false
+RETURN 'Design' as node_type, d.id as node_id, d.title as title
+""")
+
+GET_DOCUMENT_HIERARCHY = _named_query("get_document_hierarchy", """
 MATCH (d:Design {id: $design_id})
 OPTIONAL MATCH (d)-[:IMPLEMENTS]->(a:Architecture)
 OPTIONAL MATCH (d)-[:SATISFIES]->(r:Requirement)
 OPTIONAL MATCH (c:CodeArtifact)-[:IMPLEMENTS]->(d)
 RETURN d, a, collect(DISTINCT r) as requirements,
        collect(DISTINCT c) as code_artifacts
-"""
+""")
 
-FIND_SUPERSEDED_DOCUMENTS = """
+FIND_SUPERSEDED_DOCUMENTS = _named_query("find_superseded_documents", """
 MATCH (new:Architecture)-[:SUPERSEDES]->(old:Architecture)
 WHERE old.id = $doc_id
 RETURN new
-"""
+""")
 
-DETECT_DRIFT_BY_TIMESTAMP = """
+DETECT_DRIFT_BY_TIMESTAMP = _named_query("detect_drift_by_timestamp", """
 MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture)
 WHERE d.modified_at > a.modified_at
   AND NOT exists((decision:Decision)-[:APPROVES]->
@@ -92,21 +149,24 @@ WHERE d.modified_at > a.modified_at
 RETURN d.id as design, a.id as architecture,
        d.modified_at as design_modified,
        a.modified_at as arch_modified
-"""
+""")
 
-FIND_RECENT_AGENT_REQUESTS = """
+FIND_RECENT_AGENT_REQUESTS = _named_query("find_recent_agent_requests", """
 MATCH (ar:AgentRequest)
-WHERE ar.timestamp > datetime() - duration('P7D')
+WHERE ar.timestamp > datetime() - duration({days: $days})
 OPTIONAL MATCH (ar)-[:TARGETS]->(target)
 OPTIONAL MATCH (ar)-[:RESULTED_IN]->(decision:Decision)
 RETURN ar, labels(target)[0] as target_type,
        target.id as target_id, decision
 ORDER BY ar.timestamp DESC
 LIMIT $limit
-"""
+""")
 
-GET_COMPLIANCE_BY_SUBSYSTEM = """
+# Pinned to the arch_subsystem index, so the plan starts from the subsystem's
+# architectures even when skewed requirement counts mislead the planner
+GET_COMPLIANCE_BY_SUBSYSTEM = _named_query("get_compliance_by_subsystem", """
 MATCH (a:Architecture)
+USING INDEX a:Architecture(subsystem)
 WHERE a.subsystem = $subsystem
 OPTIONAL MATCH (a)-[:DEFINES]->(req:Requirement)
 OPTIONAL MATCH (req)<-[:SATISFIES]-(d:Design)
@@ -116,21 +176,23 @@ RETURN a.subsystem,
        total_requirements,
        satisfied_requirements,
        toFloat(satisfied_requirements) / total_requirements * 100 as compliance_rate
-"""
+""")
 
-FIND_HIGH_IMPACT_NODES = """
-MATCH (n)
-WHERE (n:Architecture OR n:Design)
-WITH n, size((n)<-[:IMPLEMENTS|SATISFIES]-()) as impact_score
+# The label disjunction lets the planner scan just those labels, and COUNT {}
+# over a single-hop pattern is read from each node's relationship degree
+# counts instead of expanding the relationships row by row
+FIND_HIGH_IMPACT_NODES = _named_query("find_high_impact_nodes", """
+MATCH (n:Architecture|Design)
+WITH n, COUNT { (n)<-[:IMPLEMENTS|SATISFIES]-() } as impact_score
 WHERE impact_score > $threshold
 RETURN labels(n)[0] as node_type, n.id, n.title, impact_score
 ORDER BY impact_score DESC
 LIMIT $limit
-"""
+""")
 
-GET_AGENT_ACTIVITY_SUMMARY = """
+GET_AGENT_ACTIVITY_SUMMARY = _named_query("get_agent_activity_summary", """
 MATCH (ar:AgentRequest)
-WHERE ar.timestamp > datetime() - duration($period)
+WHERE ar.timestamp > datetime() - $period
 WITH ar.agent_id as agent,
      count(*) as total_requests,
      count(CASE WHEN ar.status = 'approved' THEN 1 END) as approved,
@@ -141,7 +203,89 @@ RETURN agent, total_requests, approved, rejected, escalated,
        toFloat(approved) / total_requests * 100 as approval_rate,
        avg_processing_ms
 ORDER BY total_requests DESC
-"""
+""")
+
+
+@lru_cache(maxsize=32)
+def _parse_period(period: str) -> Duration:
+    """
+    Parse an ISO 8601 duration once, so it is sent as a Duration parameter.
+
+    Args:
+        period: ISO 8601 duration (e.g., 'P30D')
+
+    Returns:
+        The equivalent Duration
+
+    Raises:
+        ValueError: If period isn't an ISO 8601 duration
+    """
+    return Duration.from_iso_format(period)
+
+
+def _validate_days(days: int) -> None:
+    """
+    Check a look-back window before it is sent as a query parameter.
+
+    Args:
+        days: Number of days
+
+    Raises:
+        ValueError: If days is not a non-negative integer
+    """
+    # bool is an int subclass but never a meaningful window
+    if not isinstance(days, int) or isinstance(days, bool) or days < 0:
+        raise ValueError(f"days must be a non-negative integer, got {days!r}")
+
+
+# Number of issues each health check would report, counted inside Neo4j so
+# one row of integers crosses the wire instead of every offending row. Each
+# subquery mirrors the MATCH/WHERE of the check's own query
+HEALTH_SUMMARY_COUNTS = _named_query("health_summary_counts", f"""
+CALL {{
+    MATCH (a:Architecture)-[:DEFINES]->(req:Requirement {{status: 'active'}})
+    WHERE NOT exists((req)<-[:SATISFIES]-(:Design))
+    RETURN count(*) as uncovered_requirements
+}}
+CALL {{
+    MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture)
+    WHERE d.version > a.version
+      AND NOT exists((:Decision)-[:SUPERSEDES]->(d))
+    RETURN count(*) as design_drift
+}}
+CALL {{
+    MATCH (c:CodeArtifact)
+    WHERE NOT exists((c)-[:IMPLEMENTS]->(:Design|:Requirement))
+      AND c.last_modified > datetime() - duration({{days: $days}})
+    RETURN count(*) as undocumented_code
+}}
+CALL {{
+    MATCH (r:Requirement)
+    WHERE NOT exists((:Architecture)-[:DEFINES]->(r))
+    RETURN count(*) as orphaned_requirements
+}}
+CALL {{
+    MATCH p=(n:Architecture|Design|Requirement|Decision)-[:SUPERSEDES*1..{CIRCULAR_DEPENDENCY_MAX_DEPTH}]->(n)
+    WITH p LIMIT $limit
+    RETURN count(p) as circular_dependencies
+}}
+CALL {{
+    RETURN COUNT {{ (a:Architecture) WHERE a.has_embedding = false }}
+         + COUNT {{ (d:Design) WHERE d.has_embedding = false }} as missing_embeddings
+}}
+RETURN uncovered_requirements, design_drift, undocumented_code,
+       orphaned_requirements, circular_dependencies, missing_embeddings
+""")
+
+# Health checks run by run_health_checks, in report order
+HEALTH_CHECKS = (
+    "uncovered_requirements",
+    "design_drift",
+    "undocumented_code",
+    "orphaned_requirements",
+    "circular_dependencies",
+    "missing_embeddings",
+)
 
 
 class QueryExecutor:
@@ -164,13 +308,30 @@ class QueryExecutor:
             List of uncovered requirements with priority
         """
         try:
-            results = await self.conn.execute_read(FIND_UNCOVERED_REQUIREMENTS)
+            results = await self.conn.execute_read(
+                FIND_UNCOVERED_REQUIREMENTS, ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} uncovered requirements")
             return results
         except Exception as e:
             logger.error(f"Failed to find uncovered requirements: {e}")
             raise
 
+    async def find_uncovered_requirements_iter(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream requirements not covered by any design, one row at a time.
+
+        Unlike find_uncovered_requirements, rows aren't collected into a list
+        (or cached), so memory use doesn't grow with the result. The query is
+        sent without GOVERNANCE_QUERY_TIMEOUT, so a long export isn't cut
+        off; the driver's own transaction timeout, if any, still applies.
+
+        Yields:
+            Uncovered requirements with priority
+        """
+        async for row in self.conn.stream_read(_without_timeout(FIND_UNCOVERED_REQUIREMENTS)):
+            yield row
+
     async def detect_design_drift(self) -> List[Dict[str, Any]]:
         """
         Detect designs that have drifted ahead of architecture versions.
@@ -179,7 +340,7 @@ class QueryExecutor:
             List of drifted designs
         """
         try:
-            results = await self.conn.execute_read(DETECT_DESIGN_DRIFT)
+            results = await self.conn.execute_read(DETECT_DESIGN_DRIFT, ttl=GOVERNANCE_CACHE_TTL)
             logger.info(f"Found {len(results)} drifted designs")
             return results
         except Exception as e:
@@ -196,16 +357,12 @@ class QueryExecutor:
         Returns:
             List of undocumented code artifacts
         """
+        _validate_days(days)
+
         try:
-            # Modify query to use custom days parameter
-            query = f"""
-            MATCH (c:CodeArtifact)
-            WHERE NOT exists((c)-[:IMPLEMENTS]->(:Design|:Requirement))
-              AND c.last_modified > datetime() - duration('P{days}D')
-            RETURN c.path, c.lang, c.last_modified
-            ORDER BY c.last_modified DESC
-            """
-            results = await self.conn.execute_read(query)
+            results = await self.conn.execute_read(
+                FIND_UNDOCUMENTED_CODE, {"days": days}, ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} undocumented code artifacts")
             return results
         except Exception as e:
@@ -222,18 +379,10 @@ class QueryExecutor:
         Returns:
             List of agents with compliance rates
         """
+        _validate_days(days)
+
         try:
-            query = f"""
-            MATCH (r:AgentRequest)
-            WHERE r.timestamp > datetime() - duration('P{days}D')
-            WITH r.agent_id as agent,
-                 count(CASE WHEN r.status = 'approved' THEN 1 END) as approved,
-                 count(*) as total
-            RETURN agent,
-                   toFloat(approved) / total * 100 as compliance_rate
-            ORDER BY compliance_rate DESC
-            """
-            results = await self.conn.execute_read(query)
+            results = await self.conn.execute_read(CHECK_AGENT_COMPLIANCE_RATE, {"days": days})
             logger.info(f"Calculated compliance for {len(results)} agents")
             return results
         except Exception as e:
@@ -248,22 +397,35 @@ class QueryExecutor:
             List of orphaned requirements
         """
         try:
-            results = await self.conn.execute_read(FIND_ORPHANED_REQUIREMENTS)
+            results = await self.conn.execute_read(
+                FIND_ORPHANED_REQUIREMENTS, ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} orphaned requirements")
             return results
         except Exception as e:
             logger.error(f"Failed to find orphaned requirements: {e}")
             raise
 
-    async def find_circular_dependencies(self) -> List[Dict[str, Any]]:
+    async def find_circular_dependencies(
+        self, limit: int = CIRCULAR_DEPENDENCY_LIMIT
+    ) -> List[Dict[str, Any]]:
         """
         Find circular SUPERSEDES relationships.
 
+        Only cycles of up to CIRCULAR_DEPENDENCY_MAX_DEPTH hops are found.
+
+        Args:
+            limit: Maximum number of results
+
         Returns:
             List of nodes involved in circular dependencies
         """
         try:
-            results = await self.conn.execute_read(FIND_CIRCULAR_DEPENDENCIES)
+            results = await self.conn.execute_read(
+                FIND_CIRCULAR_DEPENDENCIES,
+                {"limit": limit},
+                ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} circular dependencies")
             return results
         except Exception as e:
@@ -278,7 +440,9 @@ class QueryExecutor:
             List of nodes missing embeddings
         """
         try:
-            results = await self.conn.execute_read(FIND_MISSING_EMBEDDINGS)
+            results = await self.conn.execute_read(
+                FIND_MISSING_EMBEDDINGS, ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} nodes without embeddings")
             return results
         except Exception as e:
@@ -316,7 +480,9 @@ class QueryExecutor:
             List of designs modified after their architecture
         """
         try:
-            results = await self.conn.execute_read(DETECT_DRIFT_BY_TIMESTAMP)
+            results = await self.conn.execute_read(
+                DETECT_DRIFT_BY_TIMESTAMP, ttl=GOVERNANCE_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} timestamp-based drifts")
             return results
         except Exception as e:
@@ -334,24 +500,43 @@ class QueryExecutor:
         Returns:
             List of recent agent requests
         """
+        _validate_days(days)
+
         try:
-            query = f"""
-            MATCH (ar:AgentRequest)
-            WHERE ar.timestamp > datetime() - duration('P{days}D')
-            OPTIONAL MATCH (ar)-[:TARGETS]->(target)
-            OPTIONAL MATCH (ar)-[:RESULTED_IN]->(decision:Decision)
-            RETURN ar, labels(target)[0] as target_type,
-                   target.id as target_id, decision
-            ORDER BY ar.timestamp DESC
-            LIMIT $limit
-            """
-            results = await self.conn.execute_read(query, {"limit": limit})
+            results = await self.conn.execute_read(
+                FIND_RECENT_AGENT_REQUESTS,
+                {"days": days, "limit": limit},
+                ttl=RECENT_REQUESTS_CACHE_TTL
+            )
             logger.info(f"Found {len(results)} recent agent requests")
             return results
         except Exception as e:
             logger.error(f"Failed to find recent agent requests: {e}")
             raise
 
+    async def find_recent_agent_requests_iter(self, days: int = 7,
+                                              limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream recent agent requests, one row at a time.
+
+        Sent without GOVERNANCE_QUERY_TIMEOUT, like
+        find_uncovered_requirements_iter, so a long export isn't cut off.
+
+        Args:
+            days: Number of days to look back
+            limit: Maximum number of results
+
+        Yields:
+            Recent agent requests
+        """
+        _validate_days(days)
+
+        async for row in self.conn.stream_read(
+            _without_timeout(FIND_RECENT_AGENT_REQUESTS),
+            {"days": days, "limit": limit}
+        ):
+            yield row
+
     async def get_compliance_by_subsystem(self, subsystem: str) -> Optional[Dict[str, Any]]:
         """
         Calculate requirement compliance for a subsystem.
@@ -397,16 +582,21 @@ class QueryExecutor:
             logger.error(f"Failed to find high-impact nodes: {e}")
             raise
 
-    async def get_agent_activity_summary(self, period: str = "P30D") -> List[Dict[str, Any]]:
+    async def get_agent_activity_summary(
+        self, period: Union[str, Duration] = "P30D"
+    ) -> List[Dict[str, Any]]:
         """
         Get activity summary for all agents.
 
         Args:
-            period: ISO 8601 duration (e.g., 'P30D' for 30 days)
+            period: ISO 8601 duration (e.g., 'P30D' for 30 days) or Duration
 
         Returns:
             Summary of agent activity
         """
+        if isinstance(period, str):
+            period = _parse_period(period)
+
         try:
             results = await self.conn.execute_read(
                 GET_AGENT_ACTIVITY_SUMMARY,
@@ -418,41 +608,64 @@ class QueryExecutor:
             logger.error(f"Failed to get agent activity summary: {e}")
             raise
 
-    async def run_health_checks(self) -> Dict[str, Any]:
+    async def get_health_summary_counts(self, days: int = 7,
+                                        limit: int = CIRCULAR_DEPENDENCY_LIMIT) -> Dict[str, int]:
+        """
+        Count the issues each health check would report, in one query.
+
+        Args:
+            days: Look-back window for undocumented code (default: 7)
+            limit: Most circular dependencies counted, as in find_circular_dependencies
+
+        Returns:
+            Issue count per health check name
+        """
+        _validate_days(days)
+
+        try:
+            results = await self.conn.execute_read(
+                HEALTH_SUMMARY_COUNTS,
+                {"days": days, "limit": limit},
+                ttl=GOVERNANCE_CACHE_TTL
+            )
+            counts = {check: results[0][check] if results else 0 for check in HEALTH_CHECKS}
+            logger.info(f"Counted health check issues: {counts}")
+            return counts
+        except Exception as e:
+            logger.error(f"Failed to count health check issues: {e}")
+            raise
+
+    async def run_health_checks(self, detailed: bool = False) -> Dict[str, Any]:
         """
         Run all health check queries and return combined results.
 
+        By default only the number of issues per check is fetched, counted
+        server-side in one query. With detailed=True every offending row is
+        fetched as well, one query per check.
+
+        Args:
+            detailed: Also return the rows behind each check (default: False)
+
         Returns:
-            Dictionary with all health check results
+            Dictionary with issue counts, errors and a summary; when detailed,
+            also each check's rows under the check's name
         """
         logger.info("Running comprehensive health checks...")
 
-        health = {
-            "uncovered_requirements": [],
-            "design_drift": [],
-            "undocumented_code": [],
-            "orphaned_requirements": [],
-            "circular_dependencies": [],
-            "missing_embeddings": [],
-            "errors": []
-        }
+        health: Dict[str, Any] = {"counts": {}, "errors": []}
 
-        try:
-            health["uncovered_requirements"] = await self.find_uncovered_requirements()
-            health["design_drift"] = await self.detect_design_drift()
-            health["undocumented_code"] = await self.find_undocumented_code()
-            health["orphaned_requirements"] = await self.find_orphaned_requirements()
-            health["circular_dependencies"] = await self.find_circular_dependencies()
-            health["missing_embeddings"] = await self.find_missing_embeddings()
-
-            total_issues = sum([
-                len(health["uncovered_requirements"]),
-                len(health["design_drift"]),
-                len(health["undocumented_code"]),
-                len(health["orphaned_requirements"]),
-                len(health["circular_dependencies"]),
-                len(health["missing_embeddings"])
-            ])
+        if detailed:
+            await self._collect_health_details(health)
+        else:
+            try:
+                health["counts"] = await self.get_health_summary_counts()
+            except Exception as e:
+                health["errors"].append(str(e))
+
+        if health["errors"]:
+            health["summary"] = {"health_status": "error"}
+        else:
+            total_issues = sum(health["counts"].values())
 
             health["summary"] = {
                 "total_issues": total_issues,
@@ -461,9 +674,33 @@ class QueryExecutor:
 
             logger.info(f"Health check completed: {total_issues} total issues found")
 
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            health["errors"].append(str(e))
-            health["summary"] = {"health_status": "error"}
-
         return health
+
+    async def _collect_health_details(self, health: Dict[str, Any]) -> None:
+        """
+        Fetch the rows behind every health check into a health report.
+
+        Args:
+            health: Report to fill with each check's rows, counts and errors
+        """
+        # The checks are independent, so run them concurrently; each takes
+        # its own pooled connection and the total wait is the slowest check
+        results = await asyncio.gather(
+            self.find_uncovered_requirements(),
+            self.detect_design_drift(),
+            self.find_undocumented_code(),
+            self.find_orphaned_requirements(),
+            self.find_circular_dependencies(),
+            self.find_missing_embeddings(),
+            return_exceptions=True
+        )
+
+        for check, result in zip(HEALTH_CHECKS, results):
+            if isinstance(result, Exception):
+                logger.error(f"Health check failed: {check}: {result}")
+                health["errors"].append(f"{check}: {result}")
+                health[check] = []
+                continue
+
+            health[check] = result
+            health["counts"][check] = len(result)
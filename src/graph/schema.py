@@ -5,7 +5,8 @@ Defines the complete graph schema for the Librarian Agent system based on
 the architecture specification.
 """
 
-from typing import Optional
+from typing import List, Optional
+import asyncio
 import logging
 
 from .connection import Neo4jConnection
@@ -28,7 +29,7 @@ class NodeLabels:
 
 
 # Allowed node labels whitelist (for security - prevent Cypher injection)
-ALLOWED_NODE_LABELS = {
+ALLOWED_NODE_LABELS = frozenset({
     NodeLabels.ARCHITECTURE,
     NodeLabels.DESIGN,
     NodeLabels.REQUIREMENT,
@@ -38,7 +39,7 @@ ALLOWED_NODE_LABELS = {
     NodeLabels.PERSON,
     NodeLabels.CHUNK,
     NodeLabels.AUDIT_EVENT,
-}
+})
 
 
 # Relationship type constants
@@ -65,7 +66,7 @@ class RelationshipTypes:
 
 
 # Allowed relationship types whitelist (for security - prevent Cypher injection)
-ALLOWED_RELATIONSHIP_TYPES = {
+ALLOWED_RELATIONSHIP_TYPES = frozenset({
     RelationshipTypes.DEFINES,
     RelationshipTypes.IMPLEMENTS,
     RelationshipTypes.SATISFIES,
@@ -84,7 +85,7 @@ ALLOWED_RELATIONSHIP_TYPES = {
     RelationshipTypes.CONTAINS,
     RelationshipTypes.AUDITS,
     RelationshipTypes.RECORDS,
-}
+})
 
 
 def validate_node_label(label: str) -> None:
@@ -226,6 +227,45 @@ COMPOSITE_INDEX_QUERIES = [
     """
     CREATE INDEX audit_event_type IF NOT EXISTS
     FOR (a:AuditEvent) ON (a.event_type)
+    """,
+    # Compliance and drift checks look up by subsystem alone, which the
+    # (status, subsystem) index above can't serve, and compare modified_at
+    """
+    CREATE INDEX arch_subsystem IF NOT EXISTS
+    FOR (a:Architecture) ON (a.subsystem)
+    """,
+    """
+    CREATE INDEX req_subsystem_status IF NOT EXISTS
+    FOR (r:Requirement) ON (r.subsystem, r.status)
+    """,
+    """
+    CREATE INDEX arch_modified_at IF NOT EXISTS
+    FOR (a:Architecture) ON (a.modified_at)
+    """,
+    """
+    CREATE INDEX design_modified_at IF NOT EXISTS
+    FOR (d:Design) ON (d.modified_at)
+    """,
+    # Agent compliance, activity and recent-request queries filter on a
+    # timestamp window alone, which the (agent_id, timestamp) index above
+    # can't range-scan; undocumented code is found by a last_modified window
+    """
+    CREATE INDEX request_timestamp IF NOT EXISTS
+    FOR (ar:AgentRequest) ON (ar.timestamp)
+    """,
+    """
+    CREATE INDEX code_last_modified IF NOT EXISTS
+    FOR (c:CodeArtifact) ON (c.last_modified)
+    """,
+    # IS NULL can't be answered from an index, so missing embeddings are
+    # found by seeking on the has_embedding flag kept alongside the vector
+    """
+    CREATE INDEX arch_has_embedding IF NOT EXISTS
+    FOR (a:Architecture) ON (a.has_embedding)
+    """,
+    """
+    CREATE INDEX design_has_embedding IF NOT EXISTS
+    FOR (d:Design) ON (d.has_embedding)
     """
 ]
 
@@ -251,17 +291,39 @@ class SchemaManager:
         """
         self.conn = connection
 
+    async def _run_schema_queries(self, queries: List[str], kind: str) -> None:
+        """
+        Run independent schema statements concurrently.
+
+        Every statement is IF NOT EXISTS and none depends on another, so they
+        are sent together rather than one round-trip after another. All of
+        them finish before the first failure, if any, is raised.
+
+        Args:
+            queries: Schema creation statements
+            kind: What the statements create, for log messages
+
+        Raises:
+            Exception: The first statement failure
+        """
+        results = await asyncio.gather(
+            *(self.conn.execute_write(query.strip()) for query in queries),
+            return_exceptions=True
+        )
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        for error in errors:
+            logger.error(f"Failed to create {kind}: {error}")
+        if errors:
+            raise errors[0]
+
+        logger.debug(f"{len(queries)} {kind}s created/verified")
+
     async def create_constraints(self) -> None:
         """Create all unique constraints."""
         logger.info("Creating constraints...")
 
-        for query in CONSTRAINT_QUERIES:
-            try:
-                await self.conn.execute_write(query.strip())
-                logger.debug(f"Constraint created/verified")
-            except Exception as e:
-                logger.error(f"Failed to create constraint: {e}")
-                raise
+        await self._run_schema_queries(CONSTRAINT_QUERIES, "constraint")
 
         logger.info("All constraints created successfully")
 
@@ -283,13 +345,7 @@ class SchemaManager:
                                  dimensions, similarity)
         ]
 
-        for query in vector_queries:
-            try:
-                await self.conn.execute_write(query.strip())
-                logger.debug("Vector index created/verified")
-            except Exception as e:
-                logger.error(f"Failed to create vector index: {e}")
-                raise
+        await self._run_schema_queries(vector_queries, "vector index")
 
         logger.info("All vector indexes created successfully")
 
@@ -297,13 +353,7 @@ class SchemaManager:
         """Create composite indexes for query optimization."""
         logger.info("Creating composite indexes...")
 
-        for query in COMPOSITE_INDEX_QUERIES:
-            try:
-                await self.conn.execute_write(query.strip())
-                logger.debug("Composite index created/verified")
-            except Exception as e:
-                logger.error(f"Failed to create composite index: {e}")
-                raise
+        await self._run_schema_queries(COMPOSITE_INDEX_QUERIES, "composite index")
 
         logger.info("All composite indexes created successfully")
 
@@ -311,13 +361,7 @@ class SchemaManager:
         """Create full-text search indexes."""
         logger.info("Creating full-text indexes...")
 
-        for query in FULLTEXT_INDEX_QUERIES:
-            try:
-                await self.conn.execute_write(query.strip())
-                logger.debug("Full-text index created/verified")
-            except Exception as e:
-                logger.error(f"Failed to create full-text index: {e}")
-                raise
+        await self._run_schema_queries(FULLTEXT_INDEX_QUERIES, "full-text index")
 
         logger.info("All full-text indexes created successfully")
 
@@ -326,6 +370,9 @@ class SchemaManager:
         """
         Create all schema elements: constraints, vector indexes, composite indexes, and full-text indexes.
 
+        Constraints go first, since unique constraints create backing indexes;
+        the index groups are independent and are created concurrently.
+
         Args:
             vector_dimensions: Vector dimensions for embedding indexes
             vector_similarity: Similarity function for vector search
@@ -333,9 +380,17 @@ class SchemaManager:
         logger.info("Creating complete schema...")
 
         await self.create_constraints()
-        await self.create_vector_indexes(vector_dimensions, vector_similarity)
-        await self.create_composite_indexes()
-        await self.create_fulltext_indexes()
+        results = await asyncio.gather(
+            self.create_vector_indexes(vector_dimensions, vector_similarity),
+            self.create_composite_indexes(),
+            self.create_fulltext_indexes(),
+            return_exceptions=True
+        )
+
+        # Each group has logged its own failures
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
         logger.info("Schema creation completed successfully")
 
@@ -15,6 +15,31 @@ from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Node properties kept when search results are projected to a summary
+SUMMARY_PROPERTIES = ("id", "doc_type", "title", "version", "status", "subsystem")
+
+
+def _result_node(content_chars: Optional[int]) -> str:
+    """
+    Build the Cypher RETURN expression for a search result node.
+
+    Args:
+        content_chars: If set, return only the summary properties plus the
+            first content_chars characters of content (via $content_chars)
+            instead of the whole node with its embedding and full content
+
+    Returns:
+        Cypher expression aliased as node
+    """
+    if content_chars is None:
+        return "node"
+
+    fields = ", ".join(f".{prop}" for prop in SUMMARY_PROPERTIES)
+    return (
+        f"node {{{fields}, "
+        f"content: substring(coalesce(node.content, ''), 0, $content_chars)}} AS node"
+    )
+
 
 class VectorOperations:
     """Vector storage and search operations."""
@@ -57,7 +82,8 @@ class VectorOperations:
         MATCH (n:{node_label} {{{id_property}: $node_id}})
         SET n.embedding = $embedding,
             n.embedding_model = $model,
-            n.embedding_date = datetime()
+            n.embedding_date = datetime(),
+            n.has_embedding = true
         RETURN n.{id_property} as node_id
         """
 
@@ -81,7 +107,8 @@ class VectorOperations:
     async def vector_search(self, query_embedding: List[float],
                            node_label: str = "Architecture",
                            limit: int = 10,
-                           threshold: float = 0.0) -> List[Dict[str, Any]]:
+                           threshold: float = 0.0,
+                           content_chars: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Perform vector similarity search.
 
@@ -90,6 +117,8 @@ class VectorOperations:
             node_label: Node label to search (Architecture or Design)
             limit: Maximum number of results
             threshold: Minimum similarity score (0.0 to 1.0)
+            content_chars: If set, return summary properties with content
+                truncated to this many characters in Neo4j instead of full nodes
 
         Returns:
             List of dictionaries with 'node' and 'score' keys, sorted by score descending
@@ -117,7 +146,7 @@ class VectorOperations:
         CALL db.index.vector.queryNodes($index_name, $limit, $embedding)
         YIELD node, score
         WHERE score > $threshold
-        RETURN node, score
+        RETURN {_result_node(content_chars)}, score
         ORDER BY score DESC
         """
 
@@ -126,7 +155,8 @@ class VectorOperations:
                 "index_name": index_name,
                 "limit": limit,
                 "embedding": query_embedding,
-                "threshold": threshold
+                "threshold": threshold,
+                "content_chars": content_chars
             })
 
             # Convert results to a more usable format
@@ -229,7 +259,8 @@ class VectorOperations:
     async def find_similar_documents(self, document_id: str,
                                     node_label: str = "Architecture",
                                     limit: int = 5,
-                                    id_property: str = "id") -> List[Dict[str, Any]]:
+                                    id_property: str = "id",
+                                    content_chars: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Find documents similar to a given document.
 
@@ -238,6 +269,8 @@ class VectorOperations:
             node_label: Node label of the source document
             limit: Maximum number of similar documents to return
             id_property: Property name that holds the ID
+            content_chars: If set, return summary properties with content
+                truncated to this many characters in Neo4j instead of full nodes
 
         Returns:
             List of similar documents with similarity scores
@@ -272,7 +305,7 @@ class VectorOperations:
             CALL db.index.vector.queryNodes($index_name, $limit + 1, $embedding)
             YIELD node, score
             WHERE node.{id_property} <> $document_id
-            RETURN node, score
+            RETURN {_result_node(content_chars)}, score
             ORDER BY score DESC
             LIMIT $limit
             """
@@ -281,7 +314,8 @@ class VectorOperations:
                 "index_name": index_name,
                 "limit": limit,
                 "embedding": source_embedding,
-                "document_id": document_id
+                "document_id": document_id,
+                "content_chars": content_chars
             })
 
             formatted_results = []
@@ -6,7 +6,8 @@ graph database nodes and relationships with proper embedding storage.
 """
 
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
 import logging
 import hashlib
 
@@ -17,6 +18,9 @@ from ..graph.schema import NodeLabels, RelationshipTypes
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of chunks written to Neo4j concurrently
+CHUNK_WRITE_CONCURRENCY = 10
+
 
 class DocumentGraphAdapter:
     """Adapter for storing documents and chunks in graph database."""
@@ -111,64 +115,94 @@ class DocumentGraphAdapter:
         Returns:
             Number of chunks stored
         """
-        stored_count = 0
+        # Chunks are independent, so write them concurrently (each write opens
+        # its own session from the driver pool); a failed chunk doesn't stop the rest
+        semaphore = asyncio.Semaphore(CHUNK_WRITE_CONCURRENCY)
 
-        for idx, chunk in enumerate(chunks):
-            try:
-                # Create unique chunk ID
-                chunk_id = self._generate_chunk_id(document_id, idx)
-
-                # Prepare chunk properties
-                chunk_props = {
-                    "id": chunk_id,
-                    "content": chunk.content,
-                    "start_index": chunk.start_index,
-                    "end_index": chunk.end_index,
-                    "chunk_index": idx,
-                    "doc_type": document.doc_type,
-                    "source_path": document.path,
-                    "section_title": chunk.section_title,
-                    "section_level": chunk.section_level,
-                    "created_at": datetime.utcnow().isoformat(),
-                    **chunk.metadata
-                }
-
-                # Create chunk node
-                await self.graph_ops.create_node(
-                    label="Chunk",
-                    properties=chunk_props
-                )
-
-                # Store embedding
-                await self.vector_ops.store_embedding(
-                    node_label="Chunk",
-                    node_id=chunk_id,
-                    embedding=chunk.embedding,
-                    id_property="id"
-                )
-
-                # Create CONTAINS relationship
-                await self.graph_ops.create_relationship(
-                    from_label=document_label,
-                    from_id=document_id,
-                    rel_type=RelationshipTypes.CONTAINS,
-                    to_label="Chunk",
-                    to_id=chunk_id,
-                    properties={
-                        "chunk_index": idx
-                    },
-                    from_id_prop="id",
-                    to_id_prop="id"
-                )
+        async def store_one(idx: int, chunk: ProcessedChunk) -> None:
+            async with semaphore:
+                await self._store_chunk(document_id, document_label, idx, chunk, document)
 
-                stored_count += 1
+        results = await asyncio.gather(
+            *(store_one(idx, chunk) for idx, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to store chunk {idx}: {e}")
-                # Continue with other chunks
+        stored_count = 0
+        for idx, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to store chunk {idx}: {result}")
+            else:
+                stored_count += 1
 
         return stored_count
 
+    async def _store_chunk(
+        self,
+        document_id: str,
+        document_label: str,
+        idx: int,
+        chunk: ProcessedChunk,
+        document: ParsedDocument
+    ) -> None:
+        """
+        Store a single chunk, its embedding, and its CONTAINS relationship.
+
+        Args:
+            document_id: Parent document ID
+            document_label: Parent document node label
+            idx: Chunk index within the document
+            chunk: Chunk to store
+            document: Original document (for metadata)
+        """
+        # Create unique chunk ID
+        chunk_id = self._generate_chunk_id(document_id, idx)
+
+        # Prepare chunk properties
+        chunk_props = {
+            "id": chunk_id,
+            "content": chunk.content,
+            "start_index": chunk.start_index,
+            "end_index": chunk.end_index,
+            "chunk_index": idx,
+            "doc_type": document.doc_type,
+            "source_path": document.path,
+            "section_title": chunk.section_title,
+            "section_level": chunk.section_level,
+            # A timezone-aware datetime is stored as a Neo4j DateTime, so it
+            # compares with the server-stamped document timestamps
+            "created_at": datetime.now(timezone.utc),
+            **chunk.metadata
+        }
+
+        # Create chunk node
+        await self.graph_ops.create_node(
+            label="Chunk",
+            properties=chunk_props
+        )
+
+        # Store embedding
+        await self.vector_ops.store_embedding(
+            node_label="Chunk",
+            node_id=chunk_id,
+            embedding=chunk.embedding,
+            id_property="id"
+        )
+
+        # Create CONTAINS relationship
+        await self.graph_ops.create_relationship(
+            from_label=document_label,
+            from_id=document_id,
+            rel_type=RelationshipTypes.CONTAINS,
+            to_label="Chunk",
+            to_id=chunk_id,
+            properties={
+                "chunk_index": idx
+            },
+            from_id_prop="id",
+            to_id_prop="id"
+        )
+
     async def update_document_embedding(
         self,
         document_id: str,
@@ -288,6 +322,10 @@ class DocumentGraphAdapter:
         """
         Convert ParsedDocument to graph node properties.
 
+        created_at and modified_at are left out; merge_node stamps them with
+        Cypher datetime(), so drift and compliance comparisons see DateTime
+        values on every document.
+
         Args:
             document: Parsed document
 
@@ -306,8 +344,6 @@ class DocumentGraphAdapter:
             "content_hash": document.hash,
             "path": document.path,
             "size_bytes": document.size_bytes,
-            "modified_at": document.modified_at.isoformat() if document.modified_at else None,
-            "created_at": datetime.utcnow().isoformat(),
         }
 
         # Add owners as JSON string (Neo4j handles lists)
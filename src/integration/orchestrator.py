@@ -8,8 +8,9 @@ Orchestrates the end-to-end process:
 4. Audit trail creation
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -121,7 +122,7 @@ class LibrarianOrchestrator:
         Returns:
             OrchestrationResult with outcome details
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         logger.info(f"Processing document: {file_path}")
 
         try:
@@ -219,7 +220,7 @@ class LibrarianOrchestrator:
                 logger.debug("Stored audit event")
 
             # Calculate processing time
-            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             return OrchestrationResult(
                 success=should_store,
@@ -231,7 +232,7 @@ class LibrarianOrchestrator:
 
         except Exception as e:
             logger.error(f"Orchestration failed: {e}", exc_info=True)
-            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             return OrchestrationResult(
                 success=False,
@@ -239,15 +240,18 @@ class LibrarianOrchestrator:
                 processing_time_ms=processing_time_ms
             )
 
-    async def process_directory(
+    async def iter_process_directory(
         self,
         directory: str,
         pattern: str = "**/*.md",
         skip_validation: bool = False,
         force_update: bool = False
-    ) -> Dict[str, Any]:
+    ) -> AsyncIterator[Tuple[str, Optional[OrchestrationResult]]]:
         """
-        Process all documents in a directory.
+        Process documents in a directory, yielding each result as it completes.
+
+        Files are discovered lazily and nothing is retained between
+        iterations, so memory stays flat regardless of directory size.
 
         Args:
             directory: Directory path
@@ -255,29 +259,19 @@ class LibrarianOrchestrator:
             skip_validation: Skip validation for all files
             force_update: Force storage even if validation fails
 
-        Returns:
-            Summary report with results for each file
+        Yields:
+            Tuples of (file path, result); result is None for files the
+            parser does not support
         """
         logger.info(f"Processing directory: {directory} (pattern: {pattern})")
 
-        # Find all matching files
-        dir_path = Path(directory)
-        files = list(dir_path.glob(pattern))
-
-        logger.info(f"Found {len(files)} files to process")
-
-        results = []
-        successful = 0
-        failed = 0
-        skipped = 0
-
-        for file_path in files:
+        for file_path in Path(directory).glob(pattern):
             file_str = str(file_path)
 
             # Check if parser can handle this file
             if not self.pipeline.parser.can_parse(file_str):
                 logger.info(f"Skipping unsupported file: {file_str}")
-                skipped += 1
+                yield file_str, None
                 continue
 
             # Process file
@@ -287,6 +281,45 @@ class LibrarianOrchestrator:
                 force_update=force_update
             )
 
+            yield file_str, result
+
+    async def process_directory(
+        self,
+        directory: str,
+        pattern: str = "**/*.md",
+        skip_validation: bool = False,
+        force_update: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Process all documents in a directory.
+
+        Collects every per-file result; use iter_process_directory to
+        stream results for large directories.
+
+        Args:
+            directory: Directory path
+            pattern: Glob pattern for file matching
+            skip_validation: Skip validation for all files
+            force_update: Force storage even if validation fails
+
+        Returns:
+            Summary report with results for each file
+        """
+        results = []
+        successful = 0
+        failed = 0
+        skipped = 0
+
+        async for file_str, result in self.iter_process_directory(
+            directory=directory,
+            pattern=pattern,
+            skip_validation=skip_validation,
+            force_update=force_update
+        ):
+            if result is None:
+                skipped += 1
+                continue
+
             results.append({
                 "file": file_str,
                 "result": result.to_dict()
@@ -305,7 +338,7 @@ class LibrarianOrchestrator:
         return {
             "directory": directory,
             "pattern": pattern,
-            "total_files": len(files),
+            "total_files": successful + failed + skipped,
             "successful": successful,
             "failed": failed,
             "skipped": skipped,
@@ -330,7 +363,7 @@ class LibrarianOrchestrator:
         Returns:
             OrchestrationResult
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         logger.info(f"Updating document: {file_path}")
 
         try:
@@ -407,7 +440,7 @@ class LibrarianOrchestrator:
                 }
                 await self.audit_storage.store_audit_record(audit_record)
 
-            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             return OrchestrationResult(
                 success=should_store,
@@ -419,7 +452,7 @@ class LibrarianOrchestrator:
 
         except Exception as e:
             logger.error(f"Update failed: {e}", exc_info=True)
-            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             return OrchestrationResult(
                 success=False,
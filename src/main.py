@@ -6,6 +6,7 @@ Main entry point for the AI Agent Governance System API.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 import json
@@ -13,7 +14,11 @@ from datetime import datetime
 
 from src.graph.connection import get_connection, close_connection
 from src.api import agent, query, validation, admin, health
-from src.api.middleware import TimingMiddleware, JSONLoggingMiddleware
+from src.api.middleware import (
+    ObservabilityMiddleware,
+    configure_request_logging,
+    shutdown_request_logging
+)
 from src.api.metrics import get_metrics_collector
 
 # Configure logging
@@ -30,14 +35,36 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Librarian Agent API...")
 
+    # Request logs are JSON-formatted off the event loop
+    configure_request_logging()
+
     # Initialize Neo4j connection
     try:
         conn = get_connection()
         await conn.connect()
+        app.state.neo4j = conn
         logger.info("Neo4j connection established")
+
+        # Plan the hot parameterized queries now rather than on first request
+        planned = await conn.warm_query_plans(validation.PLAN_WARMUP_QUERIES)
+        logger.info(f"Warmed {planned} query plans")
     except Exception as e:
         logger.error(f"Failed to connect to Neo4j: {e}")
 
+    # Build shared services before serving so the first burst of requests
+    # doesn't pay for (or repeat) their construction
+    try:
+        admin.get_graph_ops()
+        agent.get_validation_engine()
+        agent.get_audit_trail()
+        query.get_vector_ops()
+        query.get_embedder()
+        validation.get_drift_detector()
+        admin.get_doc_processor()
+        logger.info("API services initialized")
+    except Exception as e:
+        logger.error(f"Failed to initialize API services: {e}")
+
     yield
 
     # Shutdown
@@ -45,13 +72,16 @@ async def lifespan(app: FastAPI):
     await close_connection()
     logger.info("Connections closed")
 
+    shutdown_request_logging()
+
 
 # Create FastAPI application
 app = FastAPI(
     title="Librarian Agent API",
     description="AI Agent Governance System - Specification-driven development oversight",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -63,9 +93,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add timing and logging middleware
-app.add_middleware(TimingMiddleware)
-app.add_middleware(JSONLoggingMiddleware)
+# Add request timing and logging middleware
+app.add_middleware(ObservabilityMiddleware)
 
 
 # Include routers
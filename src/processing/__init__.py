@@ -33,7 +33,7 @@ from .models import (
 
 from .parser import DocumentParser
 from .chunker import TextChunker
-from .embedder import EmbeddingGenerator
+from .embedder import EmbeddingGenerator, quantize_int8, dequantize_int8
 from .pipeline import IngestionPipeline
 
 
@@ -51,7 +51,11 @@ __all__ = [
     'DocumentParser',
     'TextChunker',
     'EmbeddingGenerator',
-    'IngestionPipeline'
+    'IngestionPipeline',
+
+    # Embedding helpers
+    'quantize_int8',
+    'dequantize_int8'
 ]
 
 __version__ = '0.1.0'
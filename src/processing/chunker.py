@@ -7,11 +7,44 @@ accurate token counting.
 """
 
 import re
-from typing import List, Dict, Any
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 import tiktoken
 from .models import ParsedDocument, Chunk
 
 
+# Maximum number of distinct strings whose token counts are memoized
+TOKEN_COUNT_CACHE_SIZE = 8192
+
+# Fenced code blocks are never split across paragraphs
+CODE_BLOCK_PATTERN = re.compile(r'```.*?```', re.DOTALL)
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
+    """Get a shared tiktoken encoding.
+
+    Loading an encoding builds its BPE tables, so every chunker reuses one
+    instance per encoding name.
+
+    Args:
+        encoding_name: Tiktoken encoding name
+
+    Returns:
+        Tiktoken encoding
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def _cached_token_count(encoding_name: str, text: str) -> int:
+    """Count tokens in text, memoized per (encoding, text)."""
+    return len(get_tokenizer(encoding_name).encode(text))
+
+
 class TextChunker:
     """Intelligent text chunker that preserves semantic boundaries."""
 
@@ -33,18 +66,22 @@ class TextChunker:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding_name = encoding_name
+        self.encoding = get_tokenizer(encoding_name)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using tiktoken.
 
+        Results are memoized, so re-counting the same paragraph or chunk
+        (e.g. during overlap calculation) does not re-tokenize it.
+
         Args:
             text: Text to count tokens for
 
         Returns:
             Number of tokens
         """
-        return len(self.encoding.encode(text))
+        return _cached_token_count(self.encoding_name, text)
 
     def chunk_document(self, doc: ParsedDocument) -> List[Chunk]:
         """Create chunks from a parsed document.
@@ -68,6 +105,8 @@ class TextChunker:
 
         # Add document metadata to each chunk
         for i, chunk in enumerate(chunks):
+            if chunk.token_count is None:
+                chunk.token_count = self.count_tokens(chunk.content)
             chunk.metadata.update({
                 'doc_id': doc.frontmatter.get('id'),
                 'doc_type': doc.doc_type,
@@ -81,6 +120,41 @@ class TextChunker:
 
         return chunks
 
+    def _token_offsets(self, text: str) -> List[int]:
+        """Tokenize text once and return the character offset of each token.
+
+        Token counts for any span of ``text`` can then be read off this list
+        with :meth:`_tokens_in_span` instead of re-encoding the span.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Start offset of every token, in ascending order
+        """
+        _, offsets = self.encoding.decode_with_offsets(self.encoding.encode(text))
+        return offsets
+
+    @staticmethod
+    def _tokens_in_span(offsets: List[int], start: int, end: int) -> int:
+        """Count the tokens that overlap ``[start, end)``.
+
+        Spans are stripped of whitespace, but the tokenizer fuses a leading
+        space into the next word (" World"), so that token starts just before
+        the span. It is counted here, as it would be if the span were encoded
+        on its own.
+
+        Args:
+            offsets: Token offsets from :meth:`_token_offsets`
+            start: Span start (character index)
+            end: Span end (character index, exclusive)
+
+        Returns:
+            Number of tokens in the span
+        """
+        first = max(bisect_right(offsets, start) - 1, 0)
+        return max(bisect_left(offsets, end) - first, 0)
+
     def _chunk_by_sections(self, doc: ParsedDocument) -> List[Chunk]:
         """Chunk structured documents by sections.
 
@@ -105,23 +179,27 @@ class TextChunker:
             # Build full section text with header
             full_section = f"{'#' * section_level} {section_title}\n\n{section_content}"
 
-            token_count = self.count_tokens(full_section)
+            # Tokenize the section once; sub-chunk counts are sliced from this
+            offsets = self._token_offsets(full_section)
+            token_count = len(offsets)
 
             if token_count > self.chunk_size:
                 # Section too large, split it
                 sub_chunks = self._split_large_section(
                     full_section,
+                    offsets,
                     section_title,
                     section_level
                 )
 
-                for sub_chunk in sub_chunks:
+                for sub_chunk, sub_tokens in sub_chunks:
                     chunk = Chunk(
                         content=sub_chunk,
                         start_index=content_position,
                         end_index=content_position + len(sub_chunk),
                         section_title=section_title,
                         section_level=section_level,
+                        token_count=sub_tokens,
                         metadata={}
                     )
                     chunks.append(chunk)
@@ -134,6 +212,7 @@ class TextChunker:
                     end_index=content_position + len(full_section),
                     section_title=section_title,
                     section_level=section_level,
+                    token_count=token_count,
                     metadata={}
                 )
                 chunks.append(chunk)
@@ -144,68 +223,73 @@ class TextChunker:
     def _split_large_section(
         self,
         section_text: str,
+        offsets: List[int],
         section_title: str,
         section_level: int
-    ) -> List[str]:
+    ) -> List[Tuple[str, int]]:
         """Split a large section into smaller chunks while preserving structure.
 
         Args:
             section_text: Full section text with header
+            offsets: Token offsets of ``section_text``
             section_title: Section title
             section_level: Header level
 
         Returns:
-            List of chunk strings
+            List of (chunk text, token count) tuples
         """
-        # Try to split by paragraphs first
-        paragraphs = self._split_by_paragraphs(section_text)
-
         chunks = []
         current_chunk = []
         current_tokens = 0
 
         header = f"{'#' * section_level} {section_title}\n\n"
-        header_tokens = self.count_tokens(header)
+        header_tokens = self._tokens_in_span(offsets, 0, len(header))
+
+        def build_chunk(parts: List[Tuple[str, int]]) -> Tuple[str, int]:
+            text = header + '\n\n'.join(part for part, _ in parts)
+            return text, header_tokens + sum(tokens for _, tokens in parts)
 
-        for para in paragraphs:
-            para_tokens = self.count_tokens(para)
+        # Try to split by paragraphs first
+        for start, end in self._paragraph_spans(section_text):
+            para = section_text[start:end]
+            para_tokens = self._tokens_in_span(offsets, start, end)
 
             # If single paragraph exceeds chunk size, split it
             if para_tokens > self.chunk_size:
                 # Save current chunk if it has content
                 if current_chunk:
-                    chunks.append(header + '\n\n'.join(current_chunk))
+                    chunks.append(build_chunk(current_chunk))
                     current_chunk = []
                     current_tokens = 0
 
                 # Split paragraph by sentences
-                sentences = self._split_by_sentences(para)
-                for sentence in sentences:
-                    sentence_tokens = self.count_tokens(sentence)
+                for s_start, s_end in self._sentence_spans(section_text, start, end):
+                    sentence = section_text[s_start:s_end]
+                    sentence_tokens = self._tokens_in_span(offsets, s_start, s_end)
 
                     if current_tokens + sentence_tokens > self.chunk_size:
                         if current_chunk:
-                            chunks.append(header + '\n\n'.join(current_chunk))
-                        current_chunk = [sentence]
+                            chunks.append(build_chunk(current_chunk))
+                        current_chunk = [(sentence, sentence_tokens)]
                         current_tokens = header_tokens + sentence_tokens
                     else:
-                        current_chunk.append(sentence)
+                        current_chunk.append((sentence, sentence_tokens))
                         current_tokens += sentence_tokens
             else:
                 # Check if adding paragraph exceeds limit
                 if current_tokens + para_tokens > self.chunk_size:
                     # Save current chunk and start new one
                     if current_chunk:
-                        chunks.append(header + '\n\n'.join(current_chunk))
-                    current_chunk = [para]
+                        chunks.append(build_chunk(current_chunk))
+                    current_chunk = [(para, para_tokens)]
                     current_tokens = header_tokens + para_tokens
                 else:
-                    current_chunk.append(para)
+                    current_chunk.append((para, para_tokens))
                     current_tokens += para_tokens
 
         # Add remaining content
         if current_chunk:
-            chunks.append(header + '\n\n'.join(current_chunk))
+            chunks.append(build_chunk(current_chunk))
 
         return chunks
 
@@ -244,25 +328,28 @@ class TextChunker:
         Returns:
             List of chunks
         """
-        # Split into paragraphs to preserve boundaries
-        paragraphs = self._split_by_paragraphs(content)
+        # Tokenize once, then split into paragraphs to preserve boundaries
+        offsets = self._token_offsets(content)
+        paragraphs = [
+            (content[start:end], self._tokens_in_span(offsets, start, end))
+            for start, end in self._paragraph_spans(content)
+        ]
 
         chunks = []
         current_chunk = []
         current_tokens = 0
         position = 0
 
-        for para in paragraphs:
-            para_tokens = self.count_tokens(para)
-
+        for para, para_tokens in paragraphs:
             if current_tokens + para_tokens > self.chunk_size:
                 # Save current chunk
                 if current_chunk:
-                    chunk_text = '\n\n'.join(current_chunk)
+                    chunk_text = '\n\n'.join(p for p, _ in current_chunk)
                     chunk = Chunk(
                         content=chunk_text,
                         start_index=position - len(chunk_text),
                         end_index=position,
+                        token_count=current_tokens,
                         metadata={}
                     )
                     chunks.append(chunk)
@@ -272,10 +359,9 @@ class TextChunker:
                     overlap_paras = []
                     overlap_tokens = 0
 
-                    for p in reversed(current_chunk):
-                        p_tokens = self.count_tokens(p)
+                    for p, p_tokens in reversed(current_chunk):
                         if overlap_tokens + p_tokens <= self.chunk_overlap:
-                            overlap_paras.insert(0, p)
+                            overlap_paras.insert(0, (p, p_tokens))
                             overlap_tokens += p_tokens
                         else:
                             break
@@ -283,23 +369,82 @@ class TextChunker:
                     current_chunk = overlap_paras
                     current_tokens = overlap_tokens
 
-            current_chunk.append(para)
+            current_chunk.append((para, para_tokens))
             current_tokens += para_tokens
             position += len(para) + 2  # +2 for \n\n
 
         # Add final chunk
         if current_chunk and current_tokens >= self.min_chunk_size:
-            chunk_text = '\n\n'.join(current_chunk)
+            chunk_text = '\n\n'.join(p for p, _ in current_chunk)
             chunk = Chunk(
                 content=chunk_text,
                 start_index=position - len(chunk_text),
                 end_index=position,
+                token_count=current_tokens,
                 metadata={}
             )
             chunks.append(chunk)
 
         return chunks
 
+    def _paragraph_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Find paragraph boundaries in text without copying it.
+
+        Paragraphs are separated by blank lines; fenced code blocks are kept
+        whole even if they contain blank lines. Spans exclude surrounding
+        whitespace and empty paragraphs are dropped.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (start, end) character spans
+        """
+        code_spans = [m.span() for m in CODE_BLOCK_PATTERN.finditer(text)]
+
+        spans = []
+        start = 0
+        for match in PARAGRAPH_BREAK_PATTERN.finditer(text):
+            if any(cs <= match.start() < ce for cs, ce in code_spans):
+                continue
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(text)))
+
+        return [span for span in (self._strip_span(text, s, e) for s, e in spans) if span]
+
+    def _sentence_spans(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Find sentence boundaries within ``text[start:end]``.
+
+        Args:
+            text: Text containing the paragraph
+            start: Paragraph start
+            end: Paragraph end
+
+        Returns:
+            List of (start, end) character spans
+        """
+        spans = []
+        for match in SENTENCE_BREAK_PATTERN.finditer(text, start, end):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, end))
+
+        return [span for span in (self._strip_span(text, s, e) for s, e in spans) if span]
+
+    @staticmethod
+    def _strip_span(text: str, start: int, end: int):
+        """Shrink a span to exclude leading/trailing whitespace.
+
+        Returns:
+            Stripped (start, end) span, or None if the span is blank
+        """
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return (start, end) if start < end else None
+
     def _split_by_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs.
 
@@ -309,36 +454,7 @@ class TextChunker:
         Returns:
             List of paragraphs
         """
-        # Split by double newlines, but preserve code blocks
-        code_block_pattern = r'```.*?```'
-        code_blocks = []
-
-        # Extract code blocks
-        def save_code_block(match):
-            code_blocks.append(match.group(0))
-            return f"<<<CODE_BLOCK_{len(code_blocks) - 1}>>>"
-
-        text_with_placeholders = re.sub(
-            code_block_pattern,
-            save_code_block,
-            text,
-            flags=re.DOTALL
-        )
-
-        # Split by paragraphs
-        paragraphs = re.split(r'\n\s*\n', text_with_placeholders)
-
-        # Restore code blocks
-        result = []
-        for para in paragraphs:
-            # Check for code block placeholders
-            if '<<<CODE_BLOCK_' in para:
-                for i, code_block in enumerate(code_blocks):
-                    para = para.replace(f'<<<CODE_BLOCK_{i}>>>', code_block)
-            if para.strip():
-                result.append(para.strip())
-
-        return result
+        return [text[start:end] for start, end in self._paragraph_spans(text)]
 
     def _split_by_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -350,5 +466,4 @@ class TextChunker:
             List of sentences
         """
         # Simple sentence splitting (can be improved with NLTK if needed)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [text[start:end] for start, end in self._sentence_spans(text, 0, len(text))]
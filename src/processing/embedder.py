@@ -6,14 +6,52 @@ for efficiency and connection pooling for reliability.
 """
 
 import logging
-from typing import List, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import numpy as np
-from ollama import Client, ResponseError
+from ollama import AsyncClient, Client, ResponseError
 from .models import Chunk, ProcessedChunk
 
 
 logger = logging.getLogger(__name__)
 
+# How long connection/model availability checks are reused, in seconds
+STATUS_CACHE_TTL = 60.0
+
+
+def quantize_int8(embedding: Union[np.ndarray, List[float]]) -> Tuple[bytes, float]:
+    """Quantize an embedding to int8 with a per-vector scale.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        Tuple of (int8 values as bytes, scale); multiply the int8 values
+        by the scale to recover the approximate vector
+    """
+    arr = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.max(np.abs(arr))) / 127 if arr.size else 0.0
+
+    # An all-zero vector quantizes to zeros with any scale
+    if scale == 0.0:
+        scale = 1.0
+
+    quantized = np.round(arr / scale).astype(np.int8)
+    return quantized.tobytes(), scale
+
+
+def dequantize_int8(data: bytes, scale: float) -> np.ndarray:
+    """Recover an approximate float32 embedding from :func:`quantize_int8` output.
+
+    Args:
+        data: int8 values as bytes
+        scale: Per-vector scale
+
+    Returns:
+        Float32 embedding array
+    """
+    return np.frombuffer(data, dtype=np.int8).astype(np.float32) * scale
+
 
 class EmbeddingGenerator:
     """Generate vector embeddings using Ollama."""
@@ -38,13 +76,51 @@ class EmbeddingGenerator:
         self.embedding_dim = embedding_dim
         self.batch_size = batch_size
         self.client = Client(host=host)
+        self._async_client: Optional[AsyncClient] = None
+        self._status_cache: Dict[str, Tuple[float, bool]] = {}
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async Ollama client, created on first use.
+
+        The client keeps its HTTP connections alive, so every async batch
+        request from this generator reuses the same pool.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncClient(host=self.host)
+        return self._async_client
+
+    def _cached_status(self, key: str, check: Callable[[], bool]) -> bool:
+        """Return a recent status check result, re-running it after the TTL.
+
+        Args:
+            key: Cache key for the check
+            check: Function performing the actual check
+
+        Returns:
+            Result of the check
+        """
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+
+        result = check()
+        self._status_cache[key] = (now, result)
+        return result
 
     def check_connection(self) -> bool:
         """Check if Ollama server is accessible.
 
+        The result is reused for ``STATUS_CACHE_TTL`` seconds.
+
         Returns:
             True if server is accessible, False otherwise
         """
+        return self._cached_status('connection', self._check_connection)
+
+    def _check_connection(self) -> bool:
+        """Query Ollama to verify the server is reachable."""
         try:
             # Try to list models to verify connection
             self.client.list()
@@ -56,9 +132,15 @@ class EmbeddingGenerator:
     def check_model_available(self) -> bool:
         """Check if embedding model is available.
 
+        The result is reused for ``STATUS_CACHE_TTL`` seconds.
+
         Returns:
             True if model is available, False otherwise
         """
+        return self._cached_status('model', self._check_model_available)
+
+    def _check_model_available(self) -> bool:
+        """Query Ollama's model list for the embedding model."""
         try:
             response = self.client.list()
 
@@ -134,32 +216,136 @@ class EmbeddingGenerator:
             logger.error(f"Error generating embedding: {e}")
             raise
 
-    def generate_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
-        """Generate embeddings for multiple texts.
+    def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate embeddings for multiple texts using Ollama's batch API.
+
+        Sends up to ``batch_size`` texts per request to ``/api/embed`` so a
+        document of K chunks costs ceil(K / batch_size) round-trips instead of K.
 
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding arrays
+            List of embedding arrays, in the same order as ``texts``
+
+        Raises:
+            ValueError: If Ollama returns the wrong number or size of embeddings
+            ResponseError: If Ollama API call fails
+        """
+        embeddings = []
+        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
+
+        for i in range(0, len(texts), self.batch_size):
+            batch = [self._prepare_text(text) for text in texts[i:i + self.batch_size]]
+
+            logger.info(f"Processing batch {i // self.batch_size + 1}/{total_batches}")
+
+            try:
+                response = self.client.embed(model=self.model_name, input=batch)
+            except ResponseError as e:
+                logger.error(f"Ollama API error: {e}")
+                raise
+
+            embeddings.extend(self._parse_batch_response(response, len(batch)))
+
+        return embeddings
+
+    async def generate_embeddings_async(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate embeddings for multiple texts without blocking the event loop.
+
+        Async counterpart of :meth:`generate_embeddings`, sending batches
+        through :attr:`async_client`.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding arrays, in the same order as ``texts``
+
+        Raises:
+            ValueError: If Ollama returns the wrong number or size of embeddings
+            ResponseError: If Ollama API call fails
         """
         embeddings = []
+        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
 
-        # Process in batches
         for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
+            batch = [self._prepare_text(text) for text in texts[i:i + self.batch_size]]
+
+            logger.info(f"Processing batch {i // self.batch_size + 1}/{total_batches}")
+
+            try:
+                response = await self.async_client.embed(model=self.model_name, input=batch)
+            except ResponseError as e:
+                logger.error(f"Ollama API error: {e}")
+                raise
+
+            embeddings.extend(self._parse_batch_response(response, len(batch)))
+
+        return embeddings
 
-            logger.info(
-                f"Processing batch {i // self.batch_size + 1}/"
-                f"{(len(texts) + self.batch_size - 1) // self.batch_size}"
+    def _parse_batch_response(self, response, expected: int) -> List[np.ndarray]:
+        """Convert an ``/api/embed`` response into validated embedding arrays.
+
+        Args:
+            response: Ollama embed response
+            expected: Number of texts sent in the batch
+
+        Returns:
+            List of embedding arrays
+
+        Raises:
+            ValueError: If the number or size of embeddings is wrong
+        """
+        batch_embeddings = response['embeddings']
+        if len(batch_embeddings) != expected:
+            raise ValueError(
+                f"Expected {expected} embeddings, got {len(batch_embeddings)}"
             )
 
-            for text in batch:
-                embedding = self.generate_embedding(text)
-                embeddings.append(embedding)
+        embeddings = []
+        for vector in batch_embeddings:
+            embedding = np.array(vector, dtype=np.float32)
+
+            if len(embedding) != self.embedding_dim:
+                raise ValueError(
+                    f"Expected {self.embedding_dim} dimensions, "
+                    f"got {len(embedding)}"
+                )
+
+            embeddings.append(embedding)
 
         return embeddings
 
+    def generate_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate embeddings for multiple texts.
+
+        Alias of :meth:`generate_embeddings`, kept for existing callers.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding arrays
+        """
+        return self.generate_embeddings(texts)
+
+    def warmup(self) -> bool:
+        """Load the embedding model into Ollama before real work starts.
+
+        The first request after Ollama starts pays the model load time; calling
+        this up front keeps that cost out of batch timings.
+
+        Returns:
+            True if the model responded, False otherwise
+        """
+        try:
+            self.client.embed(model=self.model_name, input="warmup")
+            return True
+        except Exception as e:
+            logger.warning(f"Embedding model warmup failed: {e}")
+            return False
+
     def embed_chunks(self, chunks: List[Chunk]) -> List[ProcessedChunk]:
         """Generate embeddings for chunks and return ProcessedChunks.
 
@@ -172,10 +358,39 @@ class EmbeddingGenerator:
         # Prepare texts with metadata context
         texts = [self._prepare_chunk_text(chunk) for chunk in chunks]
 
-        # Generate embeddings
-        embeddings = self.generate_embeddings_batch(texts)
+        # Generate embeddings (one Ollama request per batch)
+        embeddings = self.generate_embeddings(texts)
+
+        return self._build_processed_chunks(chunks, embeddings)
+
+    async def embed_chunks_async(self, chunks: List[Chunk]) -> List[ProcessedChunk]:
+        """Async counterpart of :meth:`embed_chunks`.
+
+        Args:
+            chunks: List of chunks to embed
+
+        Returns:
+            List of ProcessedChunk objects with embeddings
+        """
+        texts = [self._prepare_chunk_text(chunk) for chunk in chunks]
+        embeddings = await self.generate_embeddings_async(texts)
+
+        return self._build_processed_chunks(chunks, embeddings)
+
+    def _build_processed_chunks(
+        self,
+        chunks: List[Chunk],
+        embeddings: List[np.ndarray]
+    ) -> List[ProcessedChunk]:
+        """Pair chunks with their embeddings.
+
+        Args:
+            chunks: Source chunks
+            embeddings: Embeddings in the same order as ``chunks``
 
-        # Create ProcessedChunk objects
+        Returns:
+            List of ProcessedChunk objects
+        """
         processed_chunks = []
         for chunk, embedding in zip(chunks, embeddings):
             processed_chunk = ProcessedChunk(
@@ -186,6 +401,7 @@ class EmbeddingGenerator:
                 parent_id=chunk.parent_id,
                 section_title=chunk.section_title,
                 section_level=chunk.section_level,
+                token_count=chunk.token_count,
                 embedding=embedding.tolist()
             )
             processed_chunks.append(processed_chunk)
@@ -242,34 +458,33 @@ class EmbeddingGenerator:
 
         return self._prepare_text(text)
 
-    def validate_embedding(self, embedding: np.ndarray) -> bool:
+    def validate_embedding(self, embedding: Union[np.ndarray, List[float]]) -> bool:
         """Validate embedding array.
 
         Args:
-            embedding: Embedding to validate
+            embedding: Embedding to validate (array or list of floats)
 
         Returns:
             True if valid, False otherwise
         """
+        # Convert once so the checks below are vectorized, even for lists
+        arr = np.asarray(embedding, dtype=np.float32)
+
         # Check dimensions
-        if len(embedding) != self.embedding_dim:
+        if arr.shape != (self.embedding_dim,):
             logger.error(
                 f"Invalid dimensions: expected {self.embedding_dim}, "
-                f"got {len(embedding)}"
+                f"got {arr.shape}"
             )
             return False
 
         # Check for NaN or Inf
-        if np.isnan(embedding).any():
-            logger.error("Embedding contains NaN values")
-            return False
-
-        if np.isinf(embedding).any():
-            logger.error("Embedding contains Inf values")
+        if not np.isfinite(arr).all():
+            logger.error("Embedding contains NaN or Inf values")
             return False
 
         # Check if all zeros (unusual)
-        if np.allclose(embedding, 0):
+        if np.allclose(arr, 0):
             logger.warning("Embedding is all zeros")
             return False
 
@@ -71,6 +71,7 @@ class Chunk(BaseModel):
     parent_id: Optional[str] = Field(None, description="Parent chunk ID for hierarchical relationships")
     section_title: Optional[str] = Field(None, description="Section title if chunk is from a section")
     section_level: Optional[int] = Field(None, description="Header level (1-6)")
+    token_count: Optional[int] = Field(None, description="Number of tokens in content")
 
     def __hash__(self):
         """Generate hash for chunk content."""
@@ -14,6 +14,22 @@ import frontmatter
 from .models import ParsedDocument, Document
 
 
+# Suspicious path patterns rejected by validate_file_path
+DANGEROUS_PATH_PATTERNS = [
+    re.compile(r'\.\./+'),      # Parent directory traversal
+    re.compile(r'/\.\.'),       # Parent directory at end
+    re.compile(r'\.\.\\'),      # Windows path traversal
+    re.compile(r'~/'),          # Home directory expansion
+    re.compile(r'\$'),          # Variable expansion
+    re.compile(r'`'),           # Command substitution
+]
+
+# Markdown patterns shared by all parser instances
+HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+CODE_BLOCK_PATTERN = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+
 def validate_file_path(file_path: str, allowed_directories: Optional[List[str]] = None) -> bool:
     """
     Validate file path to prevent path traversal attacks.
@@ -36,17 +52,8 @@ def validate_file_path(file_path: str, allowed_directories: Optional[List[str]]
         raise ValueError(f"Path traversal detected: {file_path}")
 
     # Check for suspicious patterns
-    dangerous_patterns = [
-        r'\.\./+',      # Parent directory traversal
-        r'/\.\.',       # Parent directory at end
-        r'\.\.\\',      # Windows path traversal
-        r'~/',          # Home directory expansion
-        r'\$',          # Variable expansion
-        r'`',           # Command substitution
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, file_path):
+    for pattern in DANGEROUS_PATH_PATTERNS:
+        if pattern.search(file_path):
             raise ValueError(f"Dangerous pattern in path: {file_path}")
 
     # If allowed directories specified, check against them
@@ -176,7 +183,7 @@ class DocumentParser:
 
         for i, line in enumerate(lines):
             # Check if line is a header
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            header_match = HEADER_PATTERN.match(line)
 
             if header_match:
                 # Save previous section if exists
@@ -220,9 +227,8 @@ class DocumentParser:
             List of code block dictionaries with language and content
         """
         code_blocks = []
-        pattern = r'```(\w+)?\n(.*?)```'
 
-        for match in re.finditer(pattern, content, re.DOTALL):
+        for match in CODE_BLOCK_PATTERN.finditer(content):
             language = match.group(1) or 'text'
             code = match.group(2).strip()
             code_blocks.append({
@@ -242,10 +248,9 @@ class DocumentParser:
             List of URLs found in markdown links
         """
         # Match markdown links: [text](url)
-        pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
         links = []
 
-        for match in re.finditer(pattern, content):
+        for match in LINK_PATTERN.finditer(content):
             url = match.group(2)
             # Filter out internal anchors
             if not url.startswith('#'):
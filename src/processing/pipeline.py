@@ -60,6 +60,75 @@ class IngestionPipeline:
                 - success: bool
                 - error: Optional[str]
         """
+        try:
+            # Step 1: Parse document
+            logger.info(f"Parsing: {file_path}")
+            document = self.parser.parse(file_path)
+
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+            return {
+                'file_path': file_path,
+                'document': None,
+                'chunks': [],
+                'processed_chunks': [],
+                'success': False,
+                'error': str(e)
+            }
+
+        return self.process_document(document)
+
+    def process_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """Chunk and embed a document that has already been parsed.
+
+        Args:
+            document: Parsed document
+
+        Returns:
+            Dictionary with the same keys as :meth:`process_file`
+        """
+        file_path = document.path
+        result = {
+            'file_path': file_path,
+            'document': document,
+            'chunks': [],
+            'processed_chunks': [],
+            'success': False,
+            'error': None
+        }
+
+        try:
+            # Step 2: Create chunks
+            logger.info(f"Chunking: {file_path}")
+            chunks = self.chunker.chunk_document(document)
+            result['chunks'] = chunks
+            logger.info(f"Created {len(chunks)} chunks")
+
+            # Step 3: Generate embeddings
+            logger.info(f"Generating embeddings: {file_path}")
+            processed_chunks = self.embedder.embed_chunks(chunks)
+            result['processed_chunks'] = processed_chunks
+            logger.info(f"Generated {len(processed_chunks)} embeddings")
+
+            result['success'] = True
+
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+            result['error'] = str(e)
+
+        return result
+
+    async def process_file_async(self, file_path: str) -> Dict[str, Any]:
+        """Process a single document, awaiting embeddings instead of blocking.
+
+        Parsing and chunking run inline; only the Ollama requests are async.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Dictionary with the same keys as :meth:`process_file`
+        """
         result = {
             'file_path': file_path,
             'document': None,
@@ -70,20 +139,17 @@ class IngestionPipeline:
         }
 
         try:
-            # Step 1: Parse document
             logger.info(f"Parsing: {file_path}")
             document = self.parser.parse(file_path)
             result['document'] = document
 
-            # Step 2: Create chunks
             logger.info(f"Chunking: {file_path}")
             chunks = self.chunker.chunk_document(document)
             result['chunks'] = chunks
             logger.info(f"Created {len(chunks)} chunks")
 
-            # Step 3: Generate embeddings
             logger.info(f"Generating embeddings: {file_path}")
-            processed_chunks = self.embedder.embed_chunks(chunks)
+            processed_chunks = await self.embedder.embed_chunks_async(chunks)
             result['processed_chunks'] = processed_chunks
             logger.info(f"Generated {len(processed_chunks)} embeddings")
 
@@ -325,7 +325,9 @@ class AuditTrail:
         Returns:
             Audit record ID
         """
-        record_id = self.logger.log_decision(decision.to_dict())
+        # Serialize once; the graph record reuses the same timestamp string
+        decision_dict = decision.to_dict()
+        record_id = self.logger.log_decision(decision_dict)
 
         # Optionally store in graph database
         if self.connection:
@@ -343,7 +345,7 @@ class AuditTrail:
                 """
                 await self.connection.execute_write(query, {
                     "id": decision.id,
-                    "timestamp": decision.timestamp.isoformat(),
+                    "timestamp": decision_dict["timestamp"],
                     "decision_type": decision.decision_type,
                     "author": decision.author,
                     "author_type": decision.author_type,
@@ -1,36 +1,120 @@
 """Drift detection for specification compliance."""
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
+from collections import Counter
 from datetime import datetime
 
 from .models import DriftViolation, Severity
 
 
+# Designs modified after the architecture they implement, without approval
+DESIGN_DRIFT_QUERY = """
+MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture)
+WHERE d.modified_at > a.modified_at
+  AND NOT exists((:Decision)-[:APPROVES]->(:AgentRequest)-[:TARGETS]->(d))
+RETURN d.id as design_id,
+       a.id as arch_id,
+       d.modified_at as design_modified,
+       a.modified_at as arch_modified
+"""
+
+# Active code with no design it implements
+UNDOCUMENTED_CODE_QUERY = """
+MATCH (c:Code {status: 'active'})
+WHERE NOT exists((c)-[:IMPLEMENTS]->(:Design))
+RETURN c.id as code_id,
+       c.path as code_path,
+       c.created_at as created_at
+"""
+
+# Active requirements nothing satisfies. Text is cut server-side to one
+# character past the 100 shown, enough to tell whether it was truncated
+UNCOVERED_REQUIREMENTS_QUERY = """
+MATCH (r:Requirement {status: 'active'})
+WHERE NOT exists((r)<-[:SATISFIES]-())
+RETURN r.id as req_id,
+       r.priority as priority,
+       substring(coalesce(r.text, ''), 0, 101) as text,
+       r.created_at as created_at
+"""
+
+# Implementations whose major version differs from their parent
+VERSION_MISMATCH_QUERY = """
+MATCH (child)-[:IMPLEMENTS]->(parent)
+WHERE child.version IS NOT NULL
+  AND parent.version IS NOT NULL
+  AND NOT (child.version STARTS WITH split(parent.version, '.')[0])
+RETURN child.id as child_id,
+       parent.id as parent_id,
+       child.version as child_version,
+       parent.version as parent_version
+"""
+
+
+def _native_datetime(value: Any) -> Any:
+    """Convert a Neo4j temporal value to a Python datetime, leaving others as-is."""
+    to_native = getattr(value, "to_native", None)
+    return to_native() if to_native else value
+
+
+def _age_seconds(value: Any) -> Optional[float]:
+    """Seconds since a timestamp, or None if it isn't a datetime.
+
+    Timestamps stamped by Cypher datetime() are timezone-aware, so "now" is
+    taken in the same zone.
+    """
+    value = _native_datetime(value)
+    if not isinstance(value, datetime):
+        return None
+    return (datetime.now(value.tzinfo) - value).total_seconds()
+
+
 class DriftDetector:
     """Detects specification drift in the knowledge base."""
 
-    def __init__(self, graph_query: Optional[Callable] = None):
+    def __init__(self, graph_query: Optional[Callable] = None,
+                 graph_stream: Optional[Callable] = None):
         """Initialize drift detector.
 
         Args:
-            graph_query: Function to execute graph database queries
+            graph_query: Async function to execute graph database queries
+            graph_stream: Async generator function yielding query records one
+                at a time; preferred over graph_query when given, so large
+                result sets are never held in memory at once
         """
         self.graph_query = graph_query
+        self.graph_stream = graph_stream
+
+    async def _rows(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the records of a query, streaming them when possible.
+
+        Args:
+            query: Cypher query string
 
-    def detect_all_drift(self) -> List[DriftViolation]:
+        Yields:
+            Result records as dictionaries
+        """
+        if self.graph_stream:
+            async for record in self.graph_stream(query):
+                yield record
+        else:
+            for record in await self.graph_query(query):
+                yield record
+
+    async def detect_all_drift(self) -> List[DriftViolation]:
         """Run all drift detection queries.
 
         Returns:
             List of all drift violations found
         """
         violations = []
-        violations.extend(self.detect_design_drift())
-        violations.extend(self.detect_undocumented_code())
-        violations.extend(self.detect_uncovered_requirements())
+        violations.extend(await self.detect_design_drift())
+        violations.extend(await self.detect_undocumented_code())
+        violations.extend(await self.detect_uncovered_requirements())
 
         return violations
 
-    def detect_design_drift(self) -> List[DriftViolation]:
+    async def detect_design_drift(self) -> List[DriftViolation]:
         """Find designs that are ahead of their architecture.
 
         This detects when a design has been modified more recently than
@@ -39,197 +123,138 @@ class DriftDetector:
         Returns:
             List of design drift violations
         """
-        if not self.graph_query:
+        if not self.graph_query and not self.graph_stream:
             return []
 
-        query = """
-            MATCH (d:Design)-[:IMPLEMENTS]->(a:Architecture)
-            WHERE d.modified_at > a.modified_at
-              AND NOT exists((:Decision)-[:APPROVES]->(:AgentRequest)-[:TARGETS]->(d))
-            RETURN d.id as design_id,
-                   a.id as arch_id,
-                   d.modified_at as design_modified,
-                   a.modified_at as arch_modified
-        """
-
+        violations = []
         try:
-            results = self.graph_query(query)
+            async for r in self._rows(DESIGN_DRIFT_QUERY):
+                time_delta = None
+                design_modified = _native_datetime(r.get("design_modified"))
+                arch_modified = _native_datetime(r.get("arch_modified"))
+                if isinstance(design_modified, datetime) and isinstance(arch_modified, datetime):
+                    time_delta = (design_modified - arch_modified).total_seconds()
+
+                violations.append(DriftViolation(
+                    type="design_ahead_of_architecture",
+                    severity=Severity.HIGH,
+                    source=r["design_id"],
+                    target=r["arch_id"],
+                    description=f"Design '{r['design_id']}' modified after architecture "
+                               f"'{r['arch_id']}' without approval",
+                    time_delta=time_delta
+                ))
         except Exception as e:
             print(f"Error querying for design drift: {e}")
             return []
 
-        violations = []
-        for r in results:
-            time_delta = None
-            if isinstance(r.get("design_modified"), datetime) and \
-               isinstance(r.get("arch_modified"), datetime):
-                time_delta = (r["design_modified"] - r["arch_modified"]).total_seconds()
-
-            violations.append(DriftViolation(
-                type="design_ahead_of_architecture",
-                severity=Severity.HIGH,
-                source=r["design_id"],
-                target=r["arch_id"],
-                description=f"Design '{r['design_id']}' modified after architecture "
-                           f"'{r['arch_id']}' without approval",
-                time_delta=time_delta
-            ))
-
         return violations
 
-    def detect_undocumented_code(self) -> List[DriftViolation]:
+    async def detect_undocumented_code(self) -> List[DriftViolation]:
         """Find code implementations without corresponding documentation.
 
         Returns:
             List of undocumented code violations
         """
-        if not self.graph_query:
+        if not self.graph_query and not self.graph_stream:
             return []
 
-        query = """
-            MATCH (c:Code)
-            WHERE NOT exists((c)-[:IMPLEMENTS]->(:Design))
-              AND c.status = 'active'
-            RETURN c.id as code_id,
-                   c.path as code_path,
-                   c.created_at as created_at
-        """
-
+        violations = []
         try:
-            results = self.graph_query(query)
+            async for r in self._rows(UNDOCUMENTED_CODE_QUERY):
+                time_delta = _age_seconds(r.get("created_at"))
+
+                violations.append(DriftViolation(
+                    type="undocumented_code",
+                    severity=Severity.MEDIUM,
+                    source=r.get("code_id", "unknown"),
+                    description=(
+                        f"Code at '{r.get('code_path', 'unknown')}' "
+                        "has no corresponding design documentation"
+                    ),
+                    time_delta=time_delta
+                ))
         except Exception as e:
             print(f"Error querying for undocumented code: {e}")
             return []
 
-        violations = []
-        for r in results:
-            time_delta = None
-            if isinstance(r.get("created_at"), datetime):
-                time_delta = (datetime.now() - r["created_at"]).total_seconds()
-
-            violations.append(DriftViolation(
-                type="undocumented_code",
-                severity=Severity.MEDIUM,
-                source=r.get("code_id", "unknown"),
-                description=f"Code at '{r.get('code_path', 'unknown')}' has no corresponding design documentation",
-                time_delta=time_delta
-            ))
-
         return violations
 
-    def detect_uncovered_requirements(self) -> List[DriftViolation]:
+    async def detect_uncovered_requirements(self) -> List[DriftViolation]:
         """Find active requirements with no implementation.
 
         Returns:
             List of uncovered requirement violations
         """
-        if not self.graph_query:
+        if not self.graph_query and not self.graph_stream:
             return []
 
-        query = """
-            MATCH (r:Requirement {status: 'active'})
-            WHERE NOT exists((r)<-[:SATISFIES]-())
-            RETURN r.id as req_id,
-                   r.priority as priority,
-                   r.text as text,
-                   r.created_at as created_at
-        """
-
+        violations = []
         try:
-            results = self.graph_query(query)
+            async for r in self._rows(UNCOVERED_REQUIREMENTS_QUERY):
+                # Higher priority requirements are more severe
+                severity = Severity.HIGH if r.get("priority") == "high" else Severity.MEDIUM
+
+                time_delta = _age_seconds(r.get("created_at"))
+
+                req_text = r.get("text", "")
+                description = f"Requirement '{r['req_id']}' not satisfied: {req_text[:100]}"
+                if len(req_text) > 100:
+                    description += "..."
+
+                violations.append(DriftViolation(
+                    type="uncovered_requirement",
+                    severity=severity,
+                    source=r["req_id"],
+                    description=description,
+                    time_delta=time_delta
+                ))
         except Exception as e:
             print(f"Error querying for uncovered requirements: {e}")
             return []
 
-        violations = []
-        for r in results:
-            # Higher priority requirements are more severe
-            severity = Severity.HIGH if r.get("priority") == "high" else Severity.MEDIUM
-
-            time_delta = None
-            if isinstance(r.get("created_at"), datetime):
-                time_delta = (datetime.now() - r["created_at"]).total_seconds()
-
-            req_text = r.get("text", "")
-            description = f"Requirement '{r['req_id']}' not satisfied: {req_text[:100]}"
-            if len(req_text) > 100:
-                description += "..."
-
-            violations.append(DriftViolation(
-                type="uncovered_requirement",
-                severity=severity,
-                source=r["req_id"],
-                description=description,
-                time_delta=time_delta
-            ))
-
         return violations
 
-    def detect_version_mismatches(self) -> List[DriftViolation]:
+    async def detect_version_mismatches(self) -> List[DriftViolation]:
         """Find version inconsistencies in specification hierarchy.
 
         Returns:
             List of version mismatch violations
         """
-        if not self.graph_query:
+        if not self.graph_query and not self.graph_stream:
             return []
 
-        query = """
-            MATCH (child)-[:IMPLEMENTS]->(parent)
-            WHERE child.version IS NOT NULL
-              AND parent.version IS NOT NULL
-              AND NOT (child.version STARTS WITH split(parent.version, '.')[0])
-            RETURN child.id as child_id,
-                   parent.id as parent_id,
-                   child.version as child_version,
-                   parent.version as parent_version
-        """
-
+        violations = []
         try:
-            results = self.graph_query(query)
+            async for r in self._rows(VERSION_MISMATCH_QUERY):
+                violations.append(DriftViolation(
+                    type="version_mismatch",
+                    severity=Severity.HIGH,
+                    source=r["child_id"],
+                    target=r["parent_id"],
+                    description=f"Version mismatch: {r['child_id']} (v{r['child_version']}) "
+                               f"implements {r['parent_id']} (v{r['parent_version']})"
+                ))
         except Exception as e:
             print(f"Error querying for version mismatches: {e}")
             return []
 
-        violations = []
-        for r in results:
-            violations.append(DriftViolation(
-                type="version_mismatch",
-                severity=Severity.HIGH,
-                source=r["child_id"],
-                target=r["parent_id"],
-                description=f"Version mismatch: {r['child_id']} (v{r['child_version']}) "
-                           f"implements {r['parent_id']} (v{r['parent_version']})"
-            ))
-
         return violations
 
-    def get_drift_summary(self) -> Dict[str, Any]:
+    async def get_drift_summary(self) -> Dict[str, Any]:
         """Get summary of all drift violations.
 
         Returns:
             Dictionary with drift statistics
         """
-        all_violations = self.detect_all_drift()
+        all_violations = await self.detect_all_drift()
 
-        summary = {
+        # Counter tallies in C, so counting stays cheap for large violation sets
+        return {
             "total_violations": len(all_violations),
-            "by_type": {},
-            "by_severity": {},
-            "critical_violations": []
+            "by_type": dict(Counter(v.type for v in all_violations)),
+            "by_severity": dict(Counter(v.severity.value for v in all_violations)),
+            "critical_violations": [
+                v.to_dict() for v in all_violations if v.severity == Severity.CRITICAL
+            ]
         }
-
-        for v in all_violations:
-            # Count by type
-            v_type = v.type
-            summary["by_type"][v_type] = summary["by_type"].get(v_type, 0) + 1
-
-            # Count by severity
-            severity = v.severity.value
-            summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + 1
-
-            # Collect critical violations
-            if v.severity == Severity.CRITICAL:
-                summary["critical_violations"].append(v.to_dict())
-
-        return summary
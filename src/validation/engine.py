@@ -45,7 +45,7 @@ class ValidationEngine:
         Returns:
             ValidationResult with status and violations
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Create validation context
         val_context = ValidationContext(
@@ -63,7 +63,7 @@ class ValidationEngine:
         reasoning = self._generate_reasoning(status, violations)
 
         # Calculate processing time
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return ValidationResult(
             status=status,
@@ -3,12 +3,23 @@
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
+from pathlib import Path
 
 from src.main import app
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Ensure each test sees fresh health probe results."""
+    from src.api.health import reset_health_cache
+
+    reset_health_cache()
+    yield
+    reset_health_cache()
+
+
 def test_root_endpoint():
     """Test root endpoint returns API info."""
     response = client.get("/")
@@ -22,8 +33,8 @@ def test_root_endpoint():
 @pytest.mark.asyncio
 async def test_health_check_success():
     """Test health check endpoint when services are healthy."""
-    with patch('src.api.health.get_connection') as mock_conn, \
-         patch('src.api.health.EmbeddingGenerator') as mock_emb:
+    with patch('src.api.clients.get_connection') as mock_conn, \
+         patch('src.api.health.get_embedder') as mock_emb:
 
         # Mock Neo4j health check
         mock_conn_instance = AsyncMock()
@@ -53,8 +64,8 @@ async def test_health_check_success():
 
 def test_health_check_degraded():
     """Test health check when services are unavailable."""
-    with patch('src.api.health.get_connection') as mock_conn, \
-         patch('src.api.health.EmbeddingGenerator') as mock_emb:
+    with patch('src.api.clients.get_connection') as mock_conn, \
+         patch('src.api.health.get_embedder') as mock_emb:
 
         # Mock Neo4j failure
         mock_conn_instance = AsyncMock()
@@ -78,6 +89,79 @@ def test_health_check_degraded():
         assert data["ollama"] is False
 
 
+def test_liveness_touches_no_dependencies():
+    """Test liveness answers without Neo4j, Ollama or psutil."""
+    with patch('src.api.clients.get_connection') as mock_conn, \
+         patch('src.api.health.get_embedder') as mock_emb, \
+         patch('src.api.health.psutil') as mock_psutil:
+
+        response = client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+        mock_conn.assert_not_called()
+        mock_emb.assert_not_called()
+        assert not mock_psutil.method_calls
+
+
+def test_readiness_reads_system_resources_once():
+    """Test readiness shares one psutil snapshot between disk and memory checks."""
+    with patch('src.api.health.check_neo4j', AsyncMock(return_value=True)), \
+         patch('src.api.health.check_ollama', AsyncMock(return_value=True)), \
+         patch('src.api.health.psutil') as mock_psutil:
+
+        mock_psutil.cpu_percent.return_value = 5.0
+        mock_psutil.virtual_memory.return_value = Mock(percent=50.0, available=1 << 30)
+        mock_psutil.disk_usage.return_value = Mock(percent=40.0, free=1 << 30)
+
+        data = client.get("/health/ready").json()
+
+        assert data["status"] == "ready"
+        assert data["checks"]["disk"] is True
+        assert data["checks"]["memory"] is True
+        mock_psutil.virtual_memory.assert_called_once()
+        mock_psutil.disk_usage.assert_called_once()
+
+
+def test_readiness_without_psutil():
+    """Test resource checks pass and metrics are empty when psutil is missing."""
+    from src.api.health import get_system_metrics
+
+    with patch('src.api.health.check_neo4j', AsyncMock(return_value=True)), \
+         patch('src.api.health.check_ollama', AsyncMock(return_value=True)), \
+         patch('src.api.health._get_psutil', return_value=None):
+
+        data = client.get("/health/ready").json()
+
+    assert data["status"] == "ready"
+    assert data["checks"]["disk"] is True
+    assert data["checks"]["memory"] is True
+    assert get_system_metrics(None) == {}
+
+
+def test_health_check_is_cached():
+    """Test repeated health checks reuse the cached result."""
+    with patch('src.api.clients.get_connection') as mock_conn, \
+         patch('src.api.health.get_embedder') as mock_emb:
+
+        mock_conn_instance = AsyncMock()
+        mock_conn_instance.health_check = AsyncMock(return_value={"connected": True})
+        mock_conn.return_value = mock_conn_instance
+
+        mock_emb_instance = Mock()
+        mock_emb_instance.check_connection.return_value = True
+        mock_emb_instance.check_model_available.return_value = True
+        mock_emb_instance.model_name = "nomic-embed-text"
+        mock_emb.return_value = mock_emb_instance
+
+        first = client.get("/health").json()
+        second = client.get("/health").json()
+
+        assert mock_conn_instance.health_check.await_count == 1
+        assert first["details"]["timestamp"] == second["details"]["timestamp"]
+        assert "expires" in first["details"]
+
+
 def test_agent_request_approval():
     """Test agent request approval endpoint."""
     with patch('src.api.agent.get_validation_engine') as mock_engine, \
@@ -197,9 +281,64 @@ def test_report_completion():
         assert len(data["next_steps"]) > 0
 
 
+def test_semantic_search_merges_labels_by_score():
+    """Test results from both labels are merged in score order and limited."""
+    import numpy as np
+
+    with patch('src.api.query.get_embedder') as mock_emb, \
+         patch('src.api.query.get_vector_ops') as mock_ops:
+
+        mock_emb.return_value.generate_embedding.return_value = np.zeros(768, dtype=np.float32)
+
+        by_label = {
+            "Architecture": [
+                {"node": {"id": "arch-1"}, "score": 0.9},
+                {"node": {"id": "arch-2"}, "score": 0.5}
+            ],
+            "Design": [
+                {"node": {"id": "design-1"}, "score": 0.7},
+                {"node": {"id": "design-2"}, "score": 0.4}
+            ]
+        }
+
+        async def vector_search(query_embedding, node_label, limit, threshold, content_chars):
+            assert content_chars == 500
+            return by_label[node_label]
+
+        mock_ops.return_value.vector_search = AsyncMock(side_effect=vector_search)
+
+        response = client.post("/query/semantic", json={"query": "auth", "limit": 3})
+        assert response.status_code == 200
+
+        ids = [r["id"] for r in response.json()["results"]]
+        assert ids == ["arch-1", "design-1", "arch-2"]
+
+
+def test_semantic_search_skips_failed_label():
+    """Test a failing label search doesn't drop the other label's results."""
+    import numpy as np
+
+    with patch('src.api.query.get_embedder') as mock_emb, \
+         patch('src.api.query.get_vector_ops') as mock_ops:
+
+        mock_emb.return_value.generate_embedding.return_value = np.zeros(768, dtype=np.float32)
+
+        async def vector_search(query_embedding, node_label, limit, threshold, content_chars):
+            if node_label == "Design":
+                raise RuntimeError("index missing")
+            return [{"node": {"id": "arch-1"}, "score": 0.9}]
+
+        mock_ops.return_value.vector_search = AsyncMock(side_effect=vector_search)
+
+        response = client.post("/query/semantic", json={"query": "auth"})
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()["results"]] == ["arch-1"]
+        assert mock_ops.return_value.vector_search.await_count == 2
+
+
 def test_cypher_query_read_only():
     """Test Cypher query endpoint allows read queries."""
-    with patch('src.api.query.get_connection') as mock_conn:
+    with patch('src.api.clients.get_connection') as mock_conn:
 
         mock_conn_instance = AsyncMock()
         mock_conn_instance.execute_read = AsyncMock(return_value=[
@@ -230,6 +369,57 @@ def test_cypher_query_blocks_writes():
     response = client.get("/query/cypher?q=MATCH (n) SET n.prop = 'value'")
     assert response.status_code == 403
 
+    # Keywords are matched case-insensitively
+    response = client.get("/query/cypher?q=match (n) detach delete n")
+    assert response.status_code == 403
+
+    # Procedure names containing a keyword are still blocked
+    response = client.get("/query/cypher?q=CALL apoc.create.node(['X'], {})")
+    assert response.status_code == 403
+
+    # As are camelCase procedure names that start with one
+    response = client.get("/query/cypher?q=MATCH (a), (b) CALL apoc.refactor.mergeNodes([a, b]) YIELD node RETURN node")
+    assert response.status_code == 403
+    assert "MERGE" in response.json()["detail"]
+
+    response = client.get("/query/cypher?q=MATCH ()-[r]->() CALL apoc.refactor.setType(r, 'X') YIELD output RETURN output")
+    assert response.status_code == 403
+
+
+def test_cypher_query_allows_keywords_inside_words():
+    """Test that words merely containing a write keyword are not rejected."""
+    with patch('src.api.clients.get_connection') as mock_conn:
+
+        mock_conn_instance = AsyncMock()
+        mock_conn_instance.execute_read = AsyncMock(return_value=[])
+        mock_conn.return_value = mock_conn_instance
+
+        response = client.get(
+            "/query/cypher?q=MATCH (n:Settings) WHERE n.created_at IS NOT NULL RETURN n.offset"
+        )
+        assert response.status_code == 200
+
+
+def test_cypher_query_returns_temporals_as_iso_strings():
+    """Test that Neo4j DateTime properties in query rows are serialized as ISO strings."""
+    from neo4j.time import DateTime
+
+    with patch('src.api.clients.get_connection') as mock_conn:
+
+        mock_conn_instance = AsyncMock()
+        mock_conn_instance.execute_read = AsyncMock(return_value=[
+            {"d": {"id": "arch-001", "created_at": DateTime(2024, 1, 2, 3, 4, 5)},
+             "stamps": [DateTime(2024, 1, 3, 0, 0, 0)]}
+        ])
+        mock_conn.return_value = mock_conn_instance
+
+        response = client.get("/query/cypher?q=MATCH (d:Architecture) RETURN d")
+
+        assert response.status_code == 200
+        row = response.json()["results"][0]
+        assert row["d"] == {"id": "arch-001", "created_at": "2024-01-02T03:04:05.000000000"}
+        assert row["stamps"] == ["2024-01-03T00:00:00.000000000"]
+
 
 def test_drift_check():
     """Test drift detection endpoint."""
@@ -238,7 +428,7 @@ def test_drift_check():
         from src.validation.models import DriftViolation, Severity
 
         mock_detector_instance = Mock()
-        mock_detector_instance.detect_all_drift.return_value = [
+        mock_detector_instance.detect_all_drift = AsyncMock(return_value=[
             DriftViolation(
                 type="design_ahead_of_architecture",
                 severity=Severity.HIGH,
@@ -246,7 +436,7 @@ def test_drift_check():
                 target="arch-001",
                 description="Design modified after architecture"
             )
-        ]
+        ])
         mock_detector.return_value = mock_detector_instance
 
         response = client.get("/validation/drift-check")
@@ -257,6 +447,238 @@ def test_drift_check():
         assert len(data["mismatches"]) == 1
 
 
+def test_compliance_check():
+    """Test compliance endpoint combines counts, violations and uncovered requirements."""
+    report = {
+        "total": 4,
+        "implemented": 3,
+        "violations": [["design-001", "2024-01-01", "arch-001"]],
+        "uncovered": [["req-001", "Must log in", "high"]]
+    }
+
+    from src.api.clients import get_neo4j_connection
+
+    mock_conn = Mock()
+    mock_conn.execute_read = AsyncMock(return_value=[report])
+    app.dependency_overrides[get_neo4j_connection] = lambda: mock_conn
+    try:
+        response = client.get("/validation/compliance/auth")
+        assert response.status_code == 200
+
+        # Everything comes back from one query
+        mock_conn.execute_read.assert_awaited_once()
+
+        data = response.json()
+        assert data["compliance_rate"] == 0.75
+        assert data["violations"][0]["design_id"] == "design-001"
+        assert data["violations"][0]["architecture_id"] == "arch-001"
+        assert data["uncovered_requirements"][0]["id"] == "req-001"
+        assert data["uncovered_requirements"][0]["priority"] == "high"
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_compliance_check_returns_next_cursors_for_full_pages():
+    """Test compliance pagination hands back the last id of each full page."""
+    report = {
+        "total": 2,
+        "implemented": 2,
+        "violations": [["design-001", "2024-01-01", "arch-001"], ["design-002", "2024-01-02", "arch-001"]],
+        "designs": 2,
+        "uncovered": [["req-005", "Must log out", "medium"]]
+    }
+
+    from src.api.clients import get_neo4j_connection
+
+    mock_conn = Mock()
+    mock_conn.execute_read = AsyncMock(return_value=[report])
+    app.dependency_overrides[get_neo4j_connection] = lambda: mock_conn
+    try:
+        response = client.get(
+            "/validation/compliance/auth",
+            params={"page_size": 2, "requirement_cursor": "req-004"}
+        )
+        assert response.status_code == 200
+
+        params = mock_conn.execute_read.await_args.args[1]
+        assert params["page_size"] == 2
+        assert params["violation_cursor"] is None
+        assert params["requirement_cursor"] == "req-004"
+
+        data = response.json()
+        assert data["next_violation_cursor"] == "design-002"
+        assert data["next_requirement_cursor"] is None
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_ingest_document_writes_chunks_in_one_query(tmp_path):
+    """Test that ingestion stores all chunks with a single UNWIND write."""
+    doc_file = tmp_path / "arch.md"
+    doc_file.write_text("# Test")
+
+    with patch('src.api.admin.get_doc_processor') as mock_processor, \
+         patch('src.api.admin.get_graph_ops') as mock_ops:
+
+        document = Mock()
+        document.frontmatter = {"id": "arch-001", "title": "Test"}
+        document.content = "# Test"
+        chunks = [
+            Mock(content=f"chunk {i}", start_index=i, end_index=i + 1,
+                 section_title="Test", embedding=[0.0] * 768)
+            for i in range(3)
+        ]
+        mock_processor.return_value.process_file.return_value = {
+            "success": True,
+            "document": document,
+            "processed_chunks": chunks
+        }
+
+        ops = Mock()
+        ops.conn.execute_read = AsyncMock(return_value=[])
+        ops.create_node = AsyncMock(return_value="arch-001")
+        ops.conn.execute_write = AsyncMock(return_value=[{"created": 3}])
+        mock_ops.return_value = ops
+
+        response = client.post("/admin/ingest", json={
+            "document_path": str(doc_file),
+            "document_type": "architecture"
+        })
+        assert response.status_code == 200
+        assert response.json()["relationships_created"] == 3
+
+        ops.conn.execute_write.assert_called_once()
+        params = ops.conn.execute_write.call_args[0][1]
+        assert params["doc_id"] == "arch-001"
+        assert [c["chunk_index"] for c in params["chunks"]] == [0, 1, 2]
+        assert all(len(c["embedding_q"]) == 768 for c in params["chunks"])
+        assert all("embedding" not in c for c in params["chunks"])
+
+
+def test_ingest_document_skips_unchanged_content(tmp_path):
+    """Test that re-ingesting identical content skips processing."""
+    doc_file = tmp_path / "arch.md"
+    doc_file.write_text("# Test")
+
+    with patch('src.api.admin.get_doc_processor') as mock_processor, \
+         patch('src.api.admin.get_graph_ops') as mock_ops:
+
+        ops = Mock()
+        ops.conn.execute_read = AsyncMock(return_value=[{"id": "arch-001"}])
+        mock_ops.return_value = ops
+
+        response = client.post("/admin/ingest", json={
+            "document_path": str(doc_file),
+            "document_type": "architecture"
+        })
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "node_id": "arch-001",
+            "relationships_created": 0
+        }
+        mock_processor.return_value.process_file.assert_not_called()
+
+
+@pytest.mark.parametrize("size", [1024, 3 * 1024 * 1024])
+def test_ingest_file_upload_copies_content(size):
+    """Test uploads reach ingestion intact, whether spooled in memory or on disk."""
+    payload = bytes(i % 251 for i in range(size))
+    received = {}
+
+    async def fake_ingest(request):
+        received["data"] = Path(request.document_path).read_bytes()
+        return {"success": True, "node_id": "arch-001", "relationships_created": 0}
+
+    with patch('src.api.admin.ingest_document', side_effect=fake_ingest):
+        response = client.post(
+            "/admin/ingest-file",
+            files={"file": ("arch.md", payload, "text/markdown")}
+        )
+
+    assert response.status_code == 200
+    assert received["data"] == payload
+
+
+def test_delete_document_batches_server_side():
+    """Test document deletion runs as one batched query and reports its count."""
+    with patch('src.api.clients.get_connection') as mock_conn:
+
+        mock_conn_instance = AsyncMock()
+        mock_conn_instance.execute_autocommit = AsyncMock(return_value=[{"deleted_count": 4}])
+        mock_conn.return_value = mock_conn_instance
+
+        response = client.delete("/admin/document/arch-001")
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "deleted_count": 4}
+
+        query = mock_conn_instance.execute_autocommit.call_args[0][0]
+        assert "IN TRANSACTIONS" in query
+
+        mock_conn_instance.execute_autocommit.return_value = [{"deleted_count": 0}]
+        response = client.delete("/admin/document/missing")
+        assert response.status_code == 404
+
+
+def test_metrics_collector_keeps_running_duration_stats():
+    """Test request durations are summarized without storing every sample."""
+    from src.api.metrics import MetricsCollector
+
+    collector = MetricsCollector()
+    for duration_us in [1000, 2000, 3000, 4000, 100000]:
+        collector.record_request("GET", "/health", duration_us, 200)
+
+    requests = collector.get_metrics()["requests"]
+    assert requests["total"] == 5
+    assert requests["avg_duration_ms"]["GET:/health"] == 22.0
+    assert requests["max_duration_ms"]["GET:/health"] == 100.0
+    assert requests["p95_duration_ms"]["GET:/health"] == 100.0
+    assert collector.request_duration["GET:/health"].count == 5
+
+
+def test_requests_get_one_timing_header_and_log():
+    """Test the observability middleware times and logs each request once."""
+    with patch("src.api.middleware.logger") as mock_logger:
+        response = client.get("/?q=1")
+        client.get("/missing?q=2")
+
+    assert response.headers["x-process-time"].endswith("ms")
+    assert len(response.headers.get_list("x-process-time")) == 1
+
+    mock_logger.info.assert_called_once()
+    assert mock_logger.info.call_args.kwargs["extra"]["path"] == "/"
+    assert "query_params" not in mock_logger.info.call_args.kwargs["extra"]
+    assert "user_agent" not in mock_logger.info.call_args.kwargs["extra"]
+
+    warning_extra = mock_logger.warning.call_args.kwargs["extra"]
+    assert warning_extra["status_code"] == 404
+    assert warning_extra["query_params"] == {"q": "2"}
+    assert warning_extra["user_agent"] == "testclient"
+
+
+def test_request_logging_starts_with_lifespan_not_import():
+    """Test importing the app leaves request logs alone until startup configures them."""
+    from src.api import middleware
+
+    # Importing src.main doesn't start the listener or stop propagation
+    assert middleware._request_log_listener is None
+    assert middleware.logger.propagate
+
+    listener = middleware.configure_request_logging()
+    try:
+        assert middleware.configure_request_logging() is listener
+        assert not middleware.logger.propagate
+    finally:
+        middleware.shutdown_request_logging()
+
+    assert middleware._request_log_listener is None
+    assert middleware.logger.propagate
+    assert not middleware.logger.handlers
+
+    # Shutting down twice is harmless
+    middleware.shutdown_request_logging()
+
+
 def test_openapi_docs_available():
     """Test that OpenAPI documentation is available."""
     response = client.get("/docs")
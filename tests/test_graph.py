@@ -42,10 +42,373 @@ class TestConnection:
         assert "connected" in health
         assert "node_count" in health
 
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_result(self):
+        """Test repeated health checks within the TTL don't ping Neo4j again."""
+        from unittest.mock import AsyncMock
+
+        conn = Neo4jConnection()
+        conn.verify_connectivity = AsyncMock(return_value=True)
+        conn.execute_read = AsyncMock(return_value=[{"nodeCount": 3, "relCount": 2}])
+
+        first = await conn.health_check()
+        second = await conn.health_check()
+
+        assert first == second
+        assert second["connected"] and second["node_count"] == 3
+        assert conn.verify_connectivity.await_count == 1
+        assert conn.execute_read.await_count == 1
+
+
+    @pytest.mark.asyncio
+    async def test_execute_read_caches_until_write(self):
+        """Test repeated reads are served from cache and writes invalidate it."""
+        from unittest.mock import AsyncMock, Mock
+        from neo4j import RoutingControl
+
+        record = Mock(data=Mock(return_value={"n": 1}))
+        driver = Mock(execute_query=AsyncMock(return_value=([record], None, ["n"])))
+
+        conn = Neo4jConnection()
+        conn.driver = driver
+
+        assert await conn.execute_read("MATCH (n) RETURN 1 as n", {"a": 1}) == [{"n": 1}]
+        assert await conn.execute_read("MATCH (n) RETURN 1 as n", {"a": 1}) == [{"n": 1}]
+        assert driver.execute_query.await_count == 1
+        assert driver.execute_query.await_args.kwargs["routing_"] == RoutingControl.READ
+
+        # Unhashable parameters bypass the cache
+        await conn.execute_read("MATCH (n) RETURN 1 as n", {"embedding": [0.1]})
+        await conn.execute_read("MATCH (n) RETURN 1 as n", {"embedding": [0.1]})
+        assert driver.execute_query.await_count == 3
+
+        await conn.execute_write("CREATE (n)")
+        assert driver.execute_query.await_args.kwargs["routing_"] == RoutingControl.WRITE
+        await conn.execute_read("MATCH (n) RETURN 1 as n", {"a": 1})
+        assert driver.execute_query.await_count == 5
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_share_one_query(self):
+        """Test identical reads in flight together are sent once, honouring per-call TTL."""
+        from unittest.mock import AsyncMock, Mock
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def execute_query(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return [Mock(data=Mock(return_value={"n": 1}))], None, ["n"]
+
+        driver = Mock(execute_query=AsyncMock(side_effect=execute_query))
+        conn = Neo4jConnection()
+        conn.driver = driver
+
+        reads = [asyncio.create_task(conn.execute_read("MATCH (n) RETURN 1 as n", ttl=0))
+                 for _ in range(3)]
+        await started.wait()
+        release.set()
+
+        assert await asyncio.gather(*reads) == [[{"n": 1}]] * 3
+        assert driver.execute_query.await_count == 1
+        assert conn.cache_stats() == {"hits": 0, "misses": 1, "coalesced": 2, "size": 1}
+
+        # A zero TTL entry is already stale
+        await conn.execute_read("MATCH (n) RETURN 1 as n")
+        assert driver.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_read_owner_does_not_cancel_waiters(self):
+        """Test a waiter on a shared read still gets its records if the caller that started it is cancelled."""
+        from unittest.mock import AsyncMock, Mock
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def execute_query(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return [Mock(data=Mock(return_value={"n": 1}))], None, ["n"]
+
+        driver = Mock(execute_query=AsyncMock(side_effect=execute_query))
+        conn = Neo4jConnection()
+        conn.driver = driver
+
+        owner = asyncio.create_task(conn.execute_read("MATCH (n) RETURN 1 as n"))
+        await started.wait()
+        waiter = asyncio.create_task(conn.execute_read("MATCH (n) RETURN 1 as n"))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == [{"n": 1}]
+        assert owner.cancelled()
+        assert driver.execute_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_read_accepts_query_objects(self):
+        """Test neo4j.Query objects reach the driver intact and cache by their text."""
+        from unittest.mock import AsyncMock, Mock
+        from neo4j import Query
+
+        record = Mock(data=Mock(return_value={"n": 1}))
+        driver = Mock(execute_query=AsyncMock(return_value=([record], None, ["n"])))
+        conn = Neo4jConnection()
+        conn.driver = driver
+
+        query = Query("MATCH (n) RETURN 1 as n", metadata={"query_name": "one"}, timeout=5.0)
+        assert await conn.execute_read(query) == [{"n": 1}]
+        assert await conn.execute_read(Query(query.text)) == [{"n": 1}]
+
+        assert driver.execute_query.await_count == 1
+        assert driver.execute_query.await_args.args[0] is query
+
+    @pytest.mark.asyncio
+    async def test_reads_use_separate_read_pool(self):
+        """Test reads go through the read driver and writes through the main one."""
+        from unittest.mock import AsyncMock, Mock
+
+        record = Mock(data=Mock(return_value={"n": 1}))
+        write_driver = Mock(execute_query=AsyncMock(return_value=([record], None, ["n"])))
+        read_driver = Mock(execute_query=AsyncMock(return_value=([record], None, ["n"])))
+
+        conn = Neo4jConnection()
+        conn.driver = write_driver
+        conn.read_driver = read_driver
+
+        await conn.execute_read("MATCH (n) RETURN 1 as n")
+        await conn.execute_write("CREATE (n)")
+
+        assert read_driver.execute_query.await_count == 1
+        assert write_driver.execute_query.await_count == 1
+
+
+    @pytest.mark.asyncio
+    async def test_warm_query_plans_explains_each_query(self):
+        """Test plan warm-up runs EXPLAIN and tolerates failing queries."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, Mock
+
+        result = Mock(consume=AsyncMock())
+        session = Mock(run=AsyncMock(side_effect=[result, RuntimeError("bad query")]))
+
+        @asynccontextmanager
+        async def fake_session(**kwargs):
+            yield session
+
+        conn = Neo4jConnection()
+        conn.session = fake_session
+
+        planned = await conn.warm_query_plans([
+            ("MATCH (a {subsystem: $s}) RETURN a", {"s": ""}),
+            ("NOT CYPHER", {})
+        ])
+
+        assert planned == 1
+        assert session.run.await_args_list[0].args[0].startswith("EXPLAIN MATCH")
+
+
+class TestSchemaManager:
+    """Test schema creation without a database."""
+
+    @pytest.mark.asyncio
+    async def test_create_all_indexes_runs_constraints_first(self):
+        """Test constraints finish before any index statement starts, then indexes fan out."""
+        from unittest.mock import AsyncMock, Mock
+        from src.graph.schema import CONSTRAINT_QUERIES
+
+        started = []
+
+        async def execute_write(query):
+            started.append(query)
+            await asyncio.sleep(0)
+            if "doc_content_search" in query:
+                raise RuntimeError("fulltext unavailable")
+            return []
+
+        schema = SchemaManager(Mock(execute_write=AsyncMock(side_effect=execute_write)))
+
+        with pytest.raises(RuntimeError, match="fulltext unavailable"):
+            await schema.create_all_indexes()
+
+        constraints = [q.strip() for q in CONSTRAINT_QUERIES]
+        assert started[:len(constraints)] == constraints
+        # The failing full-text index didn't stop the other index groups
+        assert any("VECTOR INDEX" in q for q in started)
+        assert any("code_last_modified" in q for q in started)
+
 
 class TestGraphOperations:
     """Test CRUD operations on graph."""
 
+    @pytest.mark.asyncio
+    async def test_create_nodes_batches_rows_with_unwind(self, monkeypatch):
+        """Test bulk node creation writes each batch in one UNWIND query."""
+        from unittest.mock import AsyncMock, Mock
+        from src.graph import operations
+
+        monkeypatch.setattr(operations, "WRITE_BATCH_SIZE", 2)
+
+        conn = Mock()
+        conn.execute_write = AsyncMock(side_effect=lambda query, params: [
+            {"node_id": row["id"]} for row in params["rows"]
+        ])
+        graph_ops = GraphOperations(conn)
+
+        rows = [{"id": f"arch-{i}", "title": f"Arch {i}"} for i in range(3)]
+        node_ids = await graph_ops.create_nodes(NodeLabels.ARCHITECTURE, rows)
+
+        assert node_ids == ["arch-0", "arch-1", "arch-2"]
+        assert conn.execute_write.await_count == 2
+        query, params = conn.execute_write.await_args_list[0].args
+        assert "UNWIND $rows AS row" in query
+        assert params["rows"] == rows[:2]
+        assert "datetime()" in query
+
+    @pytest.mark.asyncio
+    async def test_create_node_with_apoc_passes_label_as_parameter(self):
+        """Test APOC mode sends the same query text for every label."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock()
+        conn.execute_write = AsyncMock(return_value=[{"node_id": "x-1"}])
+        graph_ops = GraphOperations(conn, use_apoc=True)
+
+        await graph_ops.create_node(NodeLabels.ARCHITECTURE, {"id": "x-1"})
+        await graph_ops.create_node(NodeLabels.DESIGN, {"id": "x-1"})
+
+        (arch_query, arch_params), (design_query, design_params) = [
+            call.args for call in conn.execute_write.await_args_list
+        ]
+        assert arch_query == design_query
+        assert "apoc.create.node" in arch_query
+        assert (arch_params["label"], design_params["label"]) == (NodeLabels.ARCHITECTURE, NodeLabels.DESIGN)
+
+    @pytest.mark.asyncio
+    async def test_pipeline_runs_queued_writes_in_one_transaction(self):
+        """Test pipelined writes are sent together when the block exits."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock()
+        conn.execute_write = AsyncMock()
+        conn.execute_write_transaction = AsyncMock(return_value=[[{"node_id": "design-1"}], [{"rel_id": 7}]])
+        graph_ops = GraphOperations(conn, use_apoc=False)
+
+        async with graph_ops.pipeline() as batch:
+            batch.create_node(NodeLabels.DESIGN, {"id": "design-1"})
+            batch.create_relationship(
+                NodeLabels.DESIGN, "design-1", RelationshipTypes.IMPLEMENTS,
+                NodeLabels.ARCHITECTURE, "arch-1"
+            )
+            with pytest.raises(ValueError):
+                batch.create_node("NotALabel", {"id": "x"})
+            conn.execute_write_transaction.assert_not_called()
+
+        conn.execute_write_transaction.assert_awaited_once()
+        statements = conn.execute_write_transaction.await_args.args[1]
+        assert len(statements) == 2
+        assert batch.results[0] == [{"node_id": "design-1"}]
+        conn.execute_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_coalescer_merges_concurrent_writes(self):
+        """Test batched creates from concurrent callers share one query per shape."""
+        from unittest.mock import AsyncMock, Mock
+
+        async def execute_write(query, params):
+            if "node_id" in query:
+                return [{"node_id": row["id"]} for row in params["rows"]]
+            # Only the first relationship's endpoints exist
+            return [{"i": 0}]
+
+        conn = Mock()
+        conn.execute_write = AsyncMock(side_effect=execute_write)
+        graph_ops = GraphOperations(conn, use_apoc=False)
+        graph_ops.start_write_coalescer(max_batch=10, max_delay_ms=50)
+
+        results = await asyncio.gather(
+            *(graph_ops.create_node(NodeLabels.DESIGN, {"id": f"design-{i}"}, batched=True)
+              for i in range(3)),
+            *(graph_ops.create_relationship(
+                NodeLabels.DESIGN, f"design-{i}", RelationshipTypes.IMPLEMENTS,
+                NodeLabels.ARCHITECTURE, "arch-1", batched=True
+            ) for i in range(2)),
+            return_exceptions=True
+        )
+        await graph_ops.stop_write_coalescer()
+
+        assert results[:4] == ["design-0", "design-1", "design-2", True]
+        assert isinstance(results[4], ValueError)
+        assert conn.execute_write.await_count == 2
+        assert "UNWIND" in conn.execute_write.await_args_list[0].args[0]
+
+        # Without a running coalescer, batched writes go straight through
+        conn.execute_write = AsyncMock(return_value=[{"node_id": "design-9"}])
+        assert await graph_ops.create_node(NodeLabels.DESIGN, {"id": "design-9"}, batched=True) == "design-9"
+
+    @pytest.mark.asyncio
+    async def test_document_writes_set_has_embedding_flag(self):
+        """Test Architecture/Design writes keep the indexed has_embedding flag in step."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock(execute_write=AsyncMock(return_value=[{"node_id": "x"}]))
+        graph_ops = GraphOperations(conn, use_apoc=False)
+        flag = "has_embedding = n.embedding IS NOT NULL"
+
+        await graph_ops.create_node(NodeLabels.ARCHITECTURE, {"id": "x"})
+        assert flag in conn.execute_write.await_args.args[0]
+
+        await graph_ops.merge_node(NodeLabels.DESIGN, {"id": "x"}, {"title": "t"})
+        assert flag in conn.execute_write.await_args.args[0]
+
+        await graph_ops.create_node(NodeLabels.REQUIREMENT, {"rid": "x"})
+        assert "has_embedding" not in conn.execute_write.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_query_routes_by_write_clauses(self):
+        """Test custom queries go to the writer only when they contain write clauses."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock()
+        conn.execute_read = AsyncMock(return_value=[])
+        conn.execute_write = AsyncMock(return_value=[])
+        graph_ops = GraphOperations(conn)
+
+        await graph_ops.query("MATCH (n:Dataset) RETURN n.offset, n.createdAt SKIP 1")
+        await graph_ops.query("MATCH (n {id: $id}) set n.title = $title", {"id": "a", "title": "b"})
+
+        # Write procedures whose camelCase names start with a keyword
+        await graph_ops.query("CALL db.index.vector.createNodeIndex('idx', 'Chunk', 'embedding', 768, 'cosine')")
+        await graph_ops.query("MATCH (a), (b) CALL apoc.refactor.mergeNodes([a, b]) YIELD node RETURN node")
+        await graph_ops.query("MATCH ()-[r]->() CALL apoc.refactor.setType(r, 'LINKS') YIELD output RETURN output")
+
+        assert conn.execute_read.await_count == 1
+        assert conn.execute_write.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_counts_created(self):
+        """Test bulk relationship creation sends all rows in one query."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock()
+        conn.execute_write = AsyncMock(return_value=[{"created": 2}])
+        graph_ops = GraphOperations(conn)
+
+        created = await graph_ops.create_relationships(
+            NodeLabels.DESIGN,
+            RelationshipTypes.IMPLEMENTS,
+            NodeLabels.ARCHITECTURE,
+            [("design-1", "arch-1", None), ("design-2", "arch-1", {"note": "v2"})]
+        )
+
+        assert created == 2
+        params = conn.execute_write.await_args.args[1]
+        assert [row["from_id"] for row in params["rows"]] == ["design-1", "design-2"]
+        assert params["rows"][1]["properties"]["note"] == "v2"
+
     @pytest.mark.asyncio
     async def test_create_and_get_node(self, graph_operations):
         """Test node creation and retrieval."""
@@ -313,6 +676,106 @@ class TestQueryExecutor:
         # Should return a list
         assert isinstance(drift_results, list)
 
+    @pytest.mark.asyncio
+    async def test_look_back_window_is_a_parameter(self):
+        """Test days is bound as a parameter, so query text doesn't change with it."""
+        from unittest.mock import AsyncMock, Mock
+
+        conn = Mock(execute_read=AsyncMock(return_value=[]))
+        queries = QueryExecutor(conn)
+
+        await queries.find_undocumented_code(days=3)
+        await queries.find_undocumented_code(days=14)
+        first, second = conn.execute_read.await_args_list
+        assert first.args[0] == second.args[0]
+        assert (first.args[1], second.args[1]) == ({"days": 3}, {"days": 14})
+
+        await queries.find_recent_agent_requests(days=1, limit=5)
+        assert conn.execute_read.await_args.args[1] == {"days": 1, "limit": 5}
+
+        for days in ("7) RETURN 1 //", -1, True):
+            with pytest.raises(ValueError):
+                await queries.check_agent_compliance_rate(days=days)
+
+        # ISO periods are parsed client-side and bound as a Duration
+        from neo4j.time import Duration
+        await queries.get_agent_activity_summary("P2W")
+        assert conn.execute_read.await_args.args[1] == {"period": Duration(weeks=2)}
+        with pytest.raises(ValueError):
+            await queries.get_agent_activity_summary("two weeks")
+
+
+    @pytest.mark.asyncio
+    async def test_iter_variants_stream_rows(self):
+        """Test iterator variants yield rows from the streaming read path."""
+        from unittest.mock import Mock
+        from src.graph.queries import FIND_RECENT_AGENT_REQUESTS
+
+        calls = []
+
+        async def stream_read(query, params=None):
+            calls.append((query, params))
+            for i in range(3):
+                yield {"i": i}
+
+        queries = QueryExecutor(Mock(stream_read=stream_read))
+
+        assert [r async for r in queries.find_uncovered_requirements_iter()] == [{"i": 0}, {"i": 1}, {"i": 2}]
+        rows = [r async for r in queries.find_recent_agent_requests_iter(days=2, limit=3)]
+        assert len(rows) == 3
+
+        # Exports keep the query's name but not the governance time limit
+        query, params = calls[-1]
+        assert params == {"days": 2, "limit": 3}
+        assert query.text == FIND_RECENT_AGENT_REQUESTS.text
+        assert query.metadata == {"query_name": "find_recent_agent_requests"}
+        assert FIND_RECENT_AGENT_REQUESTS.timeout and query.timeout is None
+        assert calls[0][0].timeout is None
+
+    @pytest.mark.asyncio
+    async def test_health_checks_run_concurrently(self):
+        """Test health checks are all in flight at once and failures don't hide other results."""
+        from unittest.mock import Mock
+        from src.graph.queries import FIND_ORPHANED_REQUIREMENTS
+
+        in_flight = 0
+        peak = 0
+
+        async def execute_read(query, params=None, ttl=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if query == FIND_ORPHANED_REQUIREMENTS:
+                raise RuntimeError("boom")
+            return [{"x": 1}]
+
+        queries = QueryExecutor(Mock(execute_read=execute_read))
+        health = await queries.run_health_checks(detailed=True)
+
+        assert peak == 6
+        assert health["design_drift"] == [{"x": 1}]
+        assert health["errors"] == ["orphaned_requirements: boom"]
+        assert health["summary"] == {"health_status": "error"}
+
+    @pytest.mark.asyncio
+    async def test_health_summary_counts_in_one_query(self):
+        """Test the default health check fetches only server-side counts."""
+        from unittest.mock import AsyncMock, Mock
+        from src.graph.queries import HEALTH_CHECKS, HEALTH_SUMMARY_COUNTS
+
+        counts = dict.fromkeys(HEALTH_CHECKS, 0)
+        counts["design_drift"] = 2
+        conn = Mock(execute_read=AsyncMock(return_value=[counts]))
+        queries = QueryExecutor(conn)
+
+        health = await queries.run_health_checks()
+
+        conn.execute_read.assert_awaited_once()
+        assert conn.execute_read.await_args.args[0] == HEALTH_SUMMARY_COUNTS
+        assert health["counts"] == counts
+        assert health["summary"] == {"total_issues": 2, "health_status": "degraded"}
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--asyncio-mode=auto"])
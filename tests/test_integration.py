@@ -177,6 +177,9 @@ class TestDocumentAdapter:
         assert properties["compliance_level"] == "strict"
         assert properties["content_hash"] == "test_hash_12345"
         assert "owners" in properties
+        # Timestamps are stamped by the server as DateTime values
+        assert "created_at" not in properties
+        assert "modified_at" not in properties
 
     def test_generate_chunk_id(self):
         """Test chunk ID generation."""
@@ -243,6 +246,7 @@ class TestDocumentAdapter:
         assert chunk_props["chunk_index"] == 0
         assert chunk_props["section_title"] == "Overview"
         assert chunk_props["doc_type"] == "architecture"
+        assert chunk_props["created_at"].tzinfo is not None
 
         # Verify embeddings were stored
         assert vector_ops.store_embedding.call_count == 2
@@ -597,6 +601,39 @@ class TestIntegrationMocked:
         result = AsyncSync.run_sync(async_operation())
         assert result["result"] == "success"
 
+    async def test_iter_process_directory_streams_results(self, tmp_path):
+        """Test directory processing yields per-file results and skips unsupported files."""
+        from unittest.mock import Mock, AsyncMock
+        from src.integration.orchestrator import OrchestrationResult
+
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "b.txt").write_text("B")
+
+        pipeline = Mock()
+        pipeline.parser.can_parse.side_effect = lambda path: path.endswith(".md")
+
+        orchestrator = LibrarianOrchestrator(
+            Mock(), ingestion_pipeline=pipeline, validation_engine=Mock()
+        )
+        orchestrator.process_document = AsyncMock(
+            return_value=OrchestrationResult(success=True, document_id="ARCH-001")
+        )
+
+        seen = {}
+        async for file_path, result in orchestrator.iter_process_directory(
+            str(tmp_path), pattern="*"
+        ):
+            seen[Path(file_path).name] = result
+
+        assert seen["b.txt"] is None
+        assert seen["a.md"].document_id == "ARCH-001"
+
+        report = await orchestrator.process_directory(str(tmp_path), pattern="*")
+        assert report["total_files"] == 2
+        assert report["successful"] == 1
+        assert report["skipped"] == 1
+        assert len(report["results"]) == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--asyncio-mode=auto"])
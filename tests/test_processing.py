@@ -7,6 +7,7 @@ Tests parser, chunker, embedder, and complete pipeline with real documents.
 import os
 import sys
 import pytest
+import numpy as np
 from pathlib import Path
 
 # Add src to path for imports
@@ -207,6 +208,39 @@ class TestTextChunker:
         assert token_count > 0
         assert token_count < 20  # Should be around 6-7 tokens
 
+    def test_span_counts_include_fused_leading_space(self, monkeypatch):
+        """Test span token counts match encoding the span on its own."""
+        import re
+        from src.processing import chunker as chunker_module
+
+        class WordEncoding:
+            """cl100k-like encoding that fuses a leading space into the next word."""
+            pattern = re.compile(r' ?\w+| ?[^\w\s]+|\s+(?!\S)|\s+')
+
+            def encode(self, text):
+                return [m.group() for m in self.pattern.finditer(text)]
+
+            def decode_with_offsets(self, tokens):
+                offsets, position = [], 0
+                for token in tokens:
+                    offsets.append(position)
+                    position += len(token)
+                return "".join(tokens), offsets
+
+        monkeypatch.setattr(chunker_module, "get_tokenizer", lambda name: WordEncoding())
+        chunker = TextChunker(encoding_name="fake-words")
+
+        text = "# Title\n\nHello. World. Again here.\n\nSecond para! More words?"
+        offsets = chunker._token_offsets(text)
+
+        paragraphs = chunker._paragraph_spans(text)
+        sentences = [span for start, end in paragraphs for span in chunker._sentence_spans(text, start, end)]
+        spans = paragraphs + sentences
+        assert "World." in [text[start:end] for start, end in sentences]
+
+        for start, end in spans:
+            assert chunker._tokens_in_span(offsets, start, end) == chunker.count_tokens(text[start:end])
+
     def test_chunk_architecture_document(self, architecture_doc_path):
         """Test chunking real architecture document."""
         parser = DocumentParser()
@@ -352,6 +386,80 @@ class TestEmbeddingGenerator:
             print("Model not pulled yet")
             pytest.skip("Model not available")
 
+    def test_status_checks_are_cached(self):
+        """Test that repeated connection checks reuse the first result."""
+        from unittest.mock import Mock
+
+        embedder = EmbeddingGenerator()
+        embedder.client = Mock()
+        embedder.client.list.return_value = {'models': [{'name': 'nomic-embed-text:latest'}]}
+
+        assert embedder.check_connection() is True
+        assert embedder.check_connection() is True
+        assert embedder.check_model_available() is True
+        assert embedder.check_model_available() is True
+
+        # One list() call for the connection check, one for the model check
+        assert embedder.client.list.call_count == 2
+
+    def test_generate_embeddings_batches_requests(self):
+        """Test that texts are sent to Ollama in batch_size groups, in order."""
+        from unittest.mock import Mock
+
+        embedder = EmbeddingGenerator(batch_size=4)
+        embedder.client = Mock()
+        embedder.client.embed.side_effect = lambda model, input: {
+            'embeddings': [[float(len(text))] * 768 for text in input]
+        }
+
+        texts = ["x" * n for n in range(1, 11)]
+        embeddings = embedder.generate_embeddings(texts)
+
+        # 10 texts with batch_size=4 -> 3 requests
+        assert embedder.client.embed.call_count == 3
+        assert [int(e[0]) for e in embeddings] == list(range(1, 11))
+
+    def test_validate_embedding_rejects_bad_vectors(self):
+        """Test embedding validation on lists and arrays."""
+        embedder = EmbeddingGenerator()
+
+        assert embedder.validate_embedding([0.1] * 768)
+        assert embedder.validate_embedding(np.full(768, 0.1, dtype=np.float32))
+        assert not embedder.validate_embedding([0.1] * 767)
+        assert not embedder.validate_embedding([0.0] * 768)
+        assert not embedder.validate_embedding([0.1] * 767 + [float('nan')])
+        assert not embedder.validate_embedding([0.1] * 767 + [float('inf')])
+
+    def test_quantize_int8_round_trip(self):
+        """Test int8 quantization preserves embeddings within one scale step."""
+        from src.processing import quantize_int8, dequantize_int8
+
+        embedding = np.random.default_rng(0).normal(size=768).astype(np.float32)
+        data, scale = quantize_int8(embedding)
+
+        assert len(data) == 768
+        restored = dequantize_int8(data, scale)
+        assert np.abs(restored - embedding).max() <= scale / 2 + 1e-6
+
+        data, scale = quantize_int8([0.0] * 768)
+        assert not dequantize_int8(data, scale).any()
+
+    async def test_generate_embeddings_async_batches_requests(self):
+        """Test that the async path batches requests through one shared client."""
+        from unittest.mock import AsyncMock
+
+        embedder = EmbeddingGenerator(batch_size=4)
+        embedder._async_client = AsyncMock()
+        embedder._async_client.embed.side_effect = lambda model, input: {
+            'embeddings': [[float(len(text))] * 768 for text in input]
+        }
+
+        texts = ["x" * n for n in range(1, 11)]
+        embeddings = await embedder.generate_embeddings_async(texts)
+
+        assert embedder._async_client.embed.await_count == 3
+        assert [int(e[0]) for e in embeddings] == list(range(1, 11))
+
     @pytest.mark.skipif(
         not EmbeddingGenerator().check_connection(),
         reason="Ollama not running"
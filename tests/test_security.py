@@ -12,6 +12,7 @@ from src.graph.schema import (
     ALLOWED_NODE_LABELS,
     ALLOWED_RELATIONSHIP_TYPES,
 )
+from src.graph.operations import GraphOperations, sanitize_cypher_params
 from src.processing.parser import validate_file_path
 
 
@@ -97,6 +98,70 @@ class TestCypherInjectionPrevention:
         with pytest.raises(ValueError, match="Invalid relationship type"):
             validate_relationship_type("Defines")
 
+    def test_sanitize_params_rejects_injected_clauses(self):
+        """Test that parameter values containing Cypher clauses or comments are rejected."""
+        for value in ["x' MATCH (n) DETACH DELETE n", "a }) return n", "foo // bar -- baz"]:
+            with pytest.raises(ValueError, match="not allowed|dangerous pattern"):
+                sanitize_cypher_params({"title": value})
+
+        with pytest.raises(ValueError, match="dangerous pattern"):
+            sanitize_cypher_params({"meta": {"note": "CALL db.labels()"}})
+
+        with pytest.raises(ValueError, match="SQL-style comments"):
+            sanitize_cypher_params({"title": "a*/b"})
+
+        # Lists, lists of maps and str subclasses are checked too
+        for value in [["ok", "x' MATCH (n) DELETE n"], [{"note": "CALL db.labels()"}]]:
+            with pytest.raises(ValueError, match="dangerous pattern"):
+                sanitize_cypher_params({"tags": value})
+
+        class Text(str):
+            pass
+
+        with pytest.raises(ValueError, match="dangerous pattern"):
+            sanitize_cypher_params({"title": Text("UNION ALL")})
+
+        # Trailing and non-ASCII whitespace still count as clause separators
+        for value in ["SET ", "drop\u00a0index"]:
+            with pytest.raises(ValueError, match="dangerous pattern"):
+                sanitize_cypher_params({"title": value})
+
+        # Non-ASCII letters that match a keyword case-insensitively
+        for value in ["W\u0130TH x", "W\u0131TH x", "\u017fet x"]:
+            with pytest.raises(ValueError, match="dangerous pattern"):
+                sanitize_cypher_params({"title": value})
+
+    @pytest.mark.asyncio
+    async def test_id_property_injection_rejected(self):
+        """Test that ID property names outside the allowed set never reach query text."""
+        conn = AsyncMock()
+        graph_ops = GraphOperations(conn, use_apoc=False)
+
+        with pytest.raises(ValueError, match="Invalid ID property"):
+            await graph_ops.get_node("Design", "x", id_property="id}) DETACH DELETE n //")
+
+        with pytest.raises(ValueError, match="Invalid ID property"):
+            await graph_ops.create_relationship(
+                "Design", "d", "IMPLEMENTS", "Architecture", "a", to_id_prop="name"
+            )
+
+        conn.execute_read.assert_not_called()
+        conn.execute_write.assert_not_called()
+
+    def test_sanitize_params_passes_safe_values(self):
+        """Test that ordinary values pass through unchanged, without a copy."""
+        params = {"title": "Authentication Design", "version": 2, "meta": {"owner": "team-a"}}
+        assert sanitize_cypher_params(params) is params
+
+    def test_sanitize_params_checks_deeply_nested_values(self):
+        """Test that nesting deeper than the recursion limit is still checked."""
+        params = {"note": "MATCH (n) RETURN n"}
+        for _ in range(5000):
+            params = {"meta": params}
+
+        with pytest.raises(ValueError, match="dangerous pattern"):
+            sanitize_cypher_params(params)
+
 
 class TestPathTraversalPrevention:
     """Test path traversal attack prevention."""
@@ -362,19 +362,21 @@ def test_drift_detector_initialization():
     assert detector is not None
 
 
-def test_drift_detector_handles_no_graph_query():
+@pytest.mark.asyncio
+async def test_drift_detector_handles_no_graph_query():
     """Test drift detector handles missing graph query gracefully."""
     detector = DriftDetector(graph_query=None)
 
     # Should return empty lists when no graph query available
-    assert detector.detect_design_drift() == []
-    assert detector.detect_undocumented_code() == []
-    assert detector.detect_uncovered_requirements() == []
+    assert await detector.detect_design_drift() == []
+    assert await detector.detect_undocumented_code() == []
+    assert await detector.detect_uncovered_requirements() == []
 
 
-def test_drift_detector_detects_design_drift():
+@pytest.mark.asyncio
+async def test_drift_detector_detects_design_drift():
     """Test detection of design drift."""
-    def mock_query(cypher):
+    async def mock_query(cypher):
         if "Design" in cypher and "IMPLEMENTS" in cypher:
             return [
                 {
@@ -387,16 +389,17 @@ def test_drift_detector_detects_design_drift():
         return []
 
     detector = DriftDetector(graph_query=mock_query)
-    violations = detector.detect_design_drift()
+    violations = await detector.detect_design_drift()
 
     assert len(violations) > 0
     assert violations[0].type == "design_ahead_of_architecture"
     assert violations[0].severity == Severity.HIGH
 
 
-def test_drift_detector_detects_undocumented_code():
+@pytest.mark.asyncio
+async def test_drift_detector_detects_undocumented_code():
     """Test detection of undocumented code."""
-    def mock_query(cypher):
+    async def mock_query(cypher):
         if "Code" in cypher and "IMPLEMENTS" in cypher:
             return [
                 {
@@ -408,16 +411,17 @@ def test_drift_detector_detects_undocumented_code():
         return []
 
     detector = DriftDetector(graph_query=mock_query)
-    violations = detector.detect_undocumented_code()
+    violations = await detector.detect_undocumented_code()
 
     assert len(violations) > 0
     assert violations[0].type == "undocumented_code"
     assert violations[0].severity == Severity.MEDIUM
 
 
-def test_drift_detector_detects_uncovered_requirements():
+@pytest.mark.asyncio
+async def test_drift_detector_detects_uncovered_requirements():
     """Test detection of uncovered requirements."""
-    def mock_query(cypher):
+    async def mock_query(cypher):
         if "Requirement" in cypher:
             return [
                 {
@@ -436,7 +440,7 @@ def test_drift_detector_detects_uncovered_requirements():
         return []
 
     detector = DriftDetector(graph_query=mock_query)
-    violations = detector.detect_uncovered_requirements()
+    violations = await detector.detect_uncovered_requirements()
 
     assert len(violations) == 2
     # High priority requirement should have HIGH severity
@@ -444,9 +448,48 @@ def test_drift_detector_detects_uncovered_requirements():
     assert high_priority.severity == Severity.HIGH
 
 
-def test_drift_detector_summary():
+@pytest.mark.asyncio
+async def test_drift_detector_handles_server_timestamps():
+    """Test ages are computed for timezone-aware timestamps stamped by Neo4j."""
+    from datetime import timezone
+
+    async def mock_query(cypher):
+        if "Code" in cypher and "IMPLEMENTS" in cypher:
+            return [{
+                "code_id": "code-001",
+                "code_path": "src/test.py",
+                "created_at": datetime.now(timezone.utc) - timedelta(hours=1)
+            }]
+        return []
+
+    detector = DriftDetector(graph_query=mock_query)
+    violations = await detector.detect_undocumented_code()
+
+    assert len(violations) == 1
+    assert 3500 < violations[0].time_delta < 3700
+
+
+@pytest.mark.asyncio
+async def test_drift_detector_streams_records():
+    """Test drift detection consumes a streaming query when provided."""
+    async def mock_stream(cypher):
+        if "Code" in cypher and "IMPLEMENTS" in cypher:
+            for i in range(3):
+                yield {"code_id": f"code-{i}", "code_path": f"src/m{i}.py", "created_at": None}
+
+    async def unused_query(cypher):
+        raise AssertionError("eager query should not be used when streaming")
+
+    detector = DriftDetector(graph_query=unused_query, graph_stream=mock_stream)
+    violations = await detector.detect_all_drift()
+
+    assert [v.source for v in violations] == ["code-0", "code-1", "code-2"]
+
+
+@pytest.mark.asyncio
+async def test_drift_detector_summary():
     """Test drift summary generation."""
-    def mock_query(cypher):
+    async def mock_query(cypher):
         if "Design" in cypher and "IMPLEMENTS" in cypher:
             return [{
                 "design_id": "d1",
@@ -465,11 +508,13 @@ def test_drift_detector_summary():
         return []
 
     detector = DriftDetector(graph_query=mock_query)
-    summary = detector.get_drift_summary()
+    summary = await detector.get_drift_summary()
 
     assert summary["total_violations"] >= 0  # May be 0 if queries return empty
     assert "by_type" in summary
     assert "by_severity" in summary
+    assert summary["by_type"] == {"design_ahead_of_architecture": 1, "undocumented_code": 1}
+    assert summary["by_severity"] == {Severity.HIGH.value: 1, Severity.MEDIUM.value: 1}
 
 
 # Audit Logger Tests
@@ -686,15 +731,18 @@ async def test_validation_with_drift_detection():
             }]
         return []
 
+    async def async_mock_query(cypher):
+        return mock_query(cypher)
+
     engine = ValidationEngine(graph_query=mock_query)
-    detector = DriftDetector(graph_query=mock_query)
+    detector = DriftDetector(graph_query=async_mock_query)
 
     # Validate a request
     request = create_test_request()
     result = await engine.validate_request(request)
 
     # Detect drift
-    drift_violations = detector.detect_all_drift()
+    drift_violations = await detector.detect_all_drift()
 
     # Both should work independently
     assert result is not None